@@ -1,22 +1,40 @@
 import json
+import os
 import streamlit as st
 import time
 import mysql.connector
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import pandas as pd
 import plotly.graph_objects as go
 
 from db import (
-    init_db, save_player_answer, solution_exists, get_recognized_solutions,
+    init_db, save_player_answer, solution_exists, is_symmetric_variant_recognized,
     player_solution_exists, is_solution_recognized,
-    count_unique_player_solutions, reset_player_solutions, save_to_db
+    count_unique_player_solutions, reset_player_solutions, save_to_db, load_solution_set
 )
-from solver import sequential_solver, threaded_solver
+from solver import (
+    sequential_solver, threaded_solver, bitmask_solver, process_solver,
+    symmetric_solver, counting_solver, get_solution_page
+)
+from symmetry import canonical_form
+from catalogue import get_solutions, get_solution_count, is_known_solution
 from game import (
-    init_game_state, count_queens, get_attacked_queens,
-    get_elapsed_time, is_solved, place_queen
+    init_game_state, count_queens, get_attacked_queens, get_attacked_squares,
+    get_elapsed_time, place_queen
 )
 
+# Largest boards the benchmarks accept. Enumerating solvers hold every solution in memory and
+# finish on the request thread (measured single-core: N=12 in ~2 s, N=13 in ~10 s, ~6x per extra
+# column). The count-only search stores nothing and runs in the background, so it can go further.
+ENUMERATING_SOLVER_MAX_N = 12
+COUNTING_SOLVER_MAX_N = 16
+
+@st.cache_resource
+def background_executor():
+    # One long-running count at a time, shared by every session of this server
+    return ThreadPoolExecutor(max_workers=1)
+
 init_db()
 
 def handle_player_answer(player_name, current_solution):
@@ -28,7 +46,8 @@ def handle_player_answer(player_name, current_solution):
             st.error("Not enough queens placed! You need to place all 8 queens.")
             return
 
-        if not is_solved():
+        # Check the submitted board itself against the catalogue rather than the session's conflict count
+        if not is_known_solution(current_solution):
             st.error("Incorrect solution! Some queens are attacking each other.")
             return
 
@@ -40,12 +59,24 @@ def handle_player_answer(player_name, current_solution):
             st.warning("This solution has already been recognized by another player. Try a new one.")
             return
 
-        save_player_answer(player_name, current_solution)
+        is_symmetric_variant = is_symmetric_variant_recognized(current_solution)
+
+        try:
+            save_player_answer(player_name, current_solution)
+        except mysql.connector.IntegrityError:
+            # Another player saved the same board between the check above and this insert
+            st.warning("This solution has already been recognized by another player. Try a new one.")
+            return
+
         st.success(f"🎉 Congratulations {player_name}! You've added a new unique solution.")
 
-        if count_unique_player_solutions() >= 92:
+        if is_symmetric_variant:
+            st.info("🔄 Your board is a rotation or reflection of a solution that has already been found.")
+
+        total_solutions = get_solution_count(8)
+        if count_unique_player_solutions() >= total_solutions:
             reset_player_solutions()
-            st.info("🎯 All 92 unique solutions have been found! The board has been reset for a new round of discovery.")
+            st.info(f"🎯 All {total_solutions} unique solutions have been found! The board has been reset for a new round of discovery.")
 
     except ValueError as ve:
         st.warning(f"Validation error: {ve}")
@@ -79,9 +110,52 @@ def main():
             """)
 
         elif choice == "Generate Solutions":
-            action = st.selectbox("Select Action", ["Show Saved Results", "Solve Sequentially", "Solve Using Threads", "Show Performance Chart"])
+            action = st.selectbox("Select Action", ["Show Solutions", "Browse Solutions", "Show Saved Results", "Benchmark Sequential Solver", "Benchmark Threaded Solver", "Benchmark Bitmask Solver", "Benchmark Multiprocess Solver", "Benchmark Symmetric Solver", "Benchmark Counting Solver", "Show Performance Chart"])
+
+            if action == "Show Solutions":
+                board_size = st.number_input("Board size (N)", min_value=4, max_value=ENUMERATING_SOLVER_MAX_N, value=8, step=1)
+                with st.spinner(f"Loading {board_size}-Queens solutions..."):
+                    solutions = get_solutions(int(board_size))
+                st.success(f"{len(solutions)} solutions for a {board_size}×{board_size} board.")
+                st.dataframe(pd.DataFrame(
+                    [[col + 1 for col in solution] for solution in solutions],
+                    columns=[f"Row {row + 1}" for row in range(int(board_size))]
+                ))
+
+            elif action == "Browse Solutions":
+                col_n, col_page = st.columns(2)
+                board_size = int(col_n.number_input("Board size (N)", min_value=4, max_value=24, value=16, step=1))
+                page_size = int(col_page.number_input("Solutions per page", min_value=5, max_value=100, value=20, step=5))
+
+                # Each page starts after the last solution of the previous one; keep those cursors for "Previous"
+                browser = st.session_state.get("solution_browser")
+                if not browser or browser["key"] != (board_size, page_size):
+                    browser = {"key": (board_size, page_size), "cursors": [None], "next": None}
+                    st.session_state.solution_browser = browser
+
+                nav_first, nav_prev, nav_next = st.columns(3)
+                if nav_first.button("⏮ First"):
+                    del browser["cursors"][1:]
+                if nav_prev.button("◀ Previous") and len(browser["cursors"]) > 1:
+                    browser["cursors"].pop()
+                if nav_next.button("Next ▶") and browser["next"] is not None:
+                    browser["cursors"].append(browser["next"])
+
+                with st.spinner(f"Searching {board_size}-Queens solutions..."):
+                    solutions, browser["next"] = get_solution_page(board_size, page_size, browser["cursors"][-1])
+
+                first_index = (len(browser["cursors"]) - 1) * page_size + 1
+                if solutions:
+                    st.caption(f"Page {len(browser['cursors'])}: solutions {first_index}–{first_index + len(solutions) - 1}")
+                    st.dataframe(pd.DataFrame(
+                        [[col + 1 for col in solution] for solution in solutions],
+                        columns=[f"Row {row + 1}" for row in range(board_size)],
+                        index=range(first_index, first_index + len(solutions))
+                    ))
+                else:
+                    st.info("No more solutions.")
 
-            if action == "Solve Sequentially":
+            elif action == "Benchmark Sequential Solver":
                 with st.spinner("Solving..."):
                     time_taken, solutions = sequential_solver()
                     if time_taken is not None:
@@ -90,7 +164,7 @@ def main():
                         st.error("Solver failed to generate solutions.")
 
 
-            elif action == "Solve Using Threads":
+            elif action == "Benchmark Threaded Solver":
                 with st.spinner("Solving with threads..."):
                     time_taken, solutions = threaded_solver()
                     if time_taken is not None:
@@ -99,6 +173,78 @@ def main():
                         st.error("Solver failed to generate solutions.")
 
 
+            elif action == "Benchmark Bitmask Solver":
+                board_size = st.number_input("Board size (N)", min_value=4, max_value=ENUMERATING_SOLVER_MAX_N, value=8, step=1)
+                if st.button("Run Benchmark"):
+                    with st.spinner(f"Solving {board_size}-Queens with bitmasks..."):
+                        time_taken, solutions = bitmask_solver(int(board_size))
+                        if time_taken is not None:
+                            st.success(f"Solved in {time_taken:.4f} sec with {len(solutions)} solutions.")
+                        else:
+                            st.error("Solver failed to generate solutions.")
+
+            elif action == "Benchmark Multiprocess Solver":
+                col_n, col_workers = st.columns(2)
+                board_size = col_n.number_input("Board size (N)", min_value=4, max_value=ENUMERATING_SOLVER_MAX_N, value=8, step=1)
+                workers = col_workers.number_input("Worker processes", min_value=1, max_value=64, value=os.cpu_count() or 1, step=1)
+                if st.button("Run Benchmark"):
+                    worker_times = {}
+                    with st.spinner(f"Solving {board_size}-Queens with {workers} processes..."):
+                        time_taken, solutions = process_solver(int(board_size), int(workers), worker_times)
+                        if time_taken is not None:
+                            st.success(f"Solved in {time_taken:.4f} sec with {len(solutions)} solutions.")
+                            st.table(pd.DataFrame(
+                                [(pid, f"{seconds:.4f}") for pid, seconds in sorted(worker_times.items())],
+                                columns=["Worker PID", "Busy Time (sec)"]
+                            ))
+                        else:
+                            st.error("Solver failed to generate solutions.")
+
+            elif action == "Benchmark Symmetric Solver":
+                board_size = st.number_input("Board size (N)", min_value=4, max_value=ENUMERATING_SOLVER_MAX_N, value=8, step=1)
+                if st.button("Run Benchmark"):
+                    with st.spinner(f"Solving {board_size}-Queens using mirror symmetry..."):
+                        time_taken, solutions = symmetric_solver(int(board_size))
+                        if time_taken is not None:
+                            fundamental = {tuple(canonical_form(solution)) for solution in solutions}
+                            st.success(
+                                f"Solved in {time_taken:.4f} sec with {len(solutions)} solutions "
+                                f"({len(fundamental)} fundamental)."
+                            )
+                        else:
+                            st.error("Solver failed to generate solutions.")
+
+            elif action == "Benchmark Counting Solver":
+                col_n, col_workers = st.columns(2)
+                board_size = col_n.number_input("Board size (N)", min_value=4, max_value=COUNTING_SOLVER_MAX_N, value=12, step=1)
+                workers = col_workers.number_input("Worker processes", min_value=1, max_value=64, value=os.cpu_count() or 1, step=1)
+                # Large counts take minutes, so they run in the background and the page polls for the result
+                job = st.session_state.get("counting_job")
+                running = job is not None and not job["future"].done()
+                if st.button("Run Benchmark", disabled=running):
+                    job = {
+                        "board_size": int(board_size),
+                        "started": time.time(),
+                        "future": background_executor().submit(counting_solver, int(board_size), int(workers)),
+                    }
+                    st.session_state.counting_job = job
+                    running = True
+
+                if running:
+                    st.info(f"⏳ Counting {job['board_size']}-Queens solutions in the background... "
+                            f"{time.time() - job['started']:.0f} sec elapsed.")
+                    time.sleep(1)
+                    st.rerun()
+                elif job is not None:
+                    time_taken, total_solutions, nodes_visited = job["future"].result()
+                    if time_taken is not None:
+                        st.success(
+                            f"Counted {total_solutions:,} {job['board_size']}-Queens solutions in {time_taken:.4f} sec "
+                            f"({nodes_visited:,} nodes, {nodes_visited / max(time_taken, 1e-9):,.0f} nodes/sec)."
+                        )
+                    else:
+                        st.error("Solver failed to count solutions.")
+
             elif action == "Show Saved Results":
                 try:
                     conn = mysql.connector.connect(
@@ -108,7 +254,7 @@ def main():
                         database="puzzle_game_hub"
                     )
                     c = conn.cursor()
-                    c.execute("SELECT method, time_taken, solutions, created_at FROM solutions ORDER BY id DESC")
+                    c.execute("SELECT method, time_taken, nodes_visited, total_solutions, created_at, solutions_hash FROM solutions ORDER BY id DESC")
                     rows = c.fetchall()
                     conn.close()
 
@@ -116,10 +262,9 @@ def main():
                         st.info("ℹ️ No solutions have been generated yet!")
                     else:
                         formatted_rows = []
-                        for method, time_taken, solutions_json, created_at in rows:
-                            try:
-                                total_solutions = len(json.loads(solutions_json))
-                            except Exception:
+                        stored_sets = {}
+                        for method, time_taken, nodes_visited, total_solutions, created_at, solutions_hash in rows:
+                            if total_solutions is None:
                                 total_solutions = "?"
 
                             try:
@@ -130,29 +275,51 @@ def main():
                             except Exception:
                                 created_at = str(created_at)
 
-                            formatted_rows.append((method, f"{time_taken:.4f}", total_solutions, created_at))
+                            formatted_rows.append((
+                                method, f"{time_taken:.4f}",
+                                f"{nodes_visited:,}" if nodes_visited is not None else "-",
+                                total_solutions, created_at
+                            ))
+                            # Runs with identical results share one stored set; offer each set once
+                            if solutions_hash is not None and solutions_hash not in stored_sets:
+                                stored_sets[solutions_hash] = f"{method}: {total_solutions} solutions ({created_at})"
 
-                        df = pd.DataFrame(formatted_rows, columns=["Method", "Time Taken (sec)", "Total Solutions", "Generated At"])
+                        df = pd.DataFrame(formatted_rows, columns=["Method", "Time Taken (sec)", "Nodes Visited", "Total Solutions", "Generated At"])
                         st.table(df)
+
+                        if stored_sets:
+                            solutions_hash = st.selectbox("View a stored solution set", list(stored_sets),
+                                                          format_func=stored_sets.get)
+                            solutions = load_solution_set(solutions_hash)
+                            if solutions is None:
+                                st.warning("⚠️ This solution set is no longer stored.")
+                            elif solutions:
+                                st.dataframe(pd.DataFrame(
+                                    [[col + 1 for col in solution] for solution in solutions],
+                                    columns=[f"Row {row + 1}" for row in range(len(solutions[0]))]
+                                ))
                 except Exception as e:
                     st.error(f"An error occurred while retrieving saved results: {e}")
 
             elif action == "Show Performance Chart":
-                st.subheader("📈 Compare Sequential vs Threaded Execution Time")
+                st.subheader("📈 Compare Sequential vs Threaded vs Multiprocess Execution Time")
 
                 num_rounds = st.number_input("Select number of rounds", min_value=1, max_value=20, value=5, step=1)
                 if st.button("Run Comparison"):
                     sequential_times = []
                     threaded_times = []
+                    process_times = []
                     round_numbers = list(range(1, num_rounds + 1))
 
                     with st.spinner("Running rounds..."):
                         for _ in round_numbers:
                             seq_time, _ = sequential_solver()
                             thr_time, _ = threaded_solver()
+                            proc_time, _ = process_solver()
 
                             sequential_times.append(seq_time)
                             threaded_times.append(thr_time)
+                            process_times.append(proc_time)
 
                     fig = go.Figure()
 
@@ -170,6 +337,13 @@ def main():
                         name='Threaded'
                     ))
 
+                    fig.add_trace(go.Scatter(
+                        x=round_numbers,
+                        y=process_times,
+                        mode='lines+markers',
+                        name='Multiprocess'
+                    ))
+
                     fig.update_layout(
                         title="Execution Time per Round",
                         xaxis_title="Round Number",
@@ -184,6 +358,8 @@ def main():
             if "play_game_loaded" not in st.session_state or not st.session_state.play_game_loaded:
                 init_game_state(force=True)
                 st.session_state.play_game_loaded = True
+            else:
+                init_game_state()
 
             col1, col2, col3 = st.columns(3)
             col1.metric("Queens on board", f"{count_queens()}/8")
@@ -193,6 +369,9 @@ def main():
             if st.session_state.warning_shown:
                 st.warning("You can only place up to 8 queens!")
 
+            show_attacked = st.checkbox("Highlight attacked squares")
+            attacked_squares = get_attacked_squares() if show_attacked else set()
+
             # Draw the chessboard with row/column numbers
             chessboard_html = """
             <div style='
@@ -239,7 +418,10 @@ def main():
                         '>{row + 1}</div>
                 """
                 for col in range(8):
-                    color = "#b58863" if (row + col) % 2 == 0 else "#f0d9b5"
+                    if (row, col) in attacked_squares:
+                        color = "#c0504d" if (row + col) % 2 == 0 else "#e8a09a"
+                    else:
+                        color = "#b58863" if (row + col) % 2 == 0 else "#f0d9b5"
                     content = "♛" if st.session_state.board[row][col] else ""
                     chessboard_html += f"""
                         <div style='
@@ -0,0 +1,196 @@
+"""
+Benchmark harness for the N-Queens solver engines.
+
+Runs every engine over a grid of board sizes and worker counts, with warmup runs
+and repetitions, and writes the timings to a JSON file that can be compared
+between commits. Nothing is written to the database.
+
+    python benchmark.py --sizes 8 10 12 --workers 1 2 4 --repeat 7 --output bench.json
+    python benchmark.py --compare baseline.json bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from solver import (
+    solve_n_queens, solve_n_queens_threaded, solve_n_queens_bitmask,
+    solve_n_queens_parallel, solve_n_queens_symmetric, count_n_queens
+)
+
+# name -> (run(n, workers) returning the solution count, supports(n), uses_workers)
+ENGINES = {
+    "sequential": (lambda n, workers: _run_sequential(), lambda n: n == 8, False),
+    "threaded": (lambda n, workers: len(solve_n_queens_threaded()), lambda n: n == 8, False),
+    "bitmask": (lambda n, workers: len(solve_n_queens_bitmask(n)), lambda n: True, False),
+    "symmetric": (lambda n, workers: len(solve_n_queens_symmetric(n)), lambda n: True, False),
+    "multiprocess": (lambda n, workers: len(solve_n_queens_parallel(n, workers)), lambda n: True, True),
+    "count": (lambda n, workers: count_n_queens(n, workers)[0], lambda n: True, True),
+}
+
+def _run_sequential():
+    solutions = []
+    solve_n_queens([-1] * 8, 0, solutions)
+    return len(solutions)
+
+def percentile(samples, fraction):
+    """
+    Linearly interpolated percentile of a list of samples (fraction between 0 and 1).
+    """
+    if not samples:
+        raise ValueError("percentile() requires at least one sample.")
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def median_confidence_interval(samples, confidence=0.95, resamples=2000, seed=0):
+    """
+    Bootstrap confidence interval for the median. Seeded, so reruns on the same samples agree.
+    """
+    rng = random.Random(seed)
+    medians = sorted(
+        statistics.median(rng.choices(samples, k=len(samples))) for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2
+    return percentile(medians, tail), percentile(medians, 1 - tail)
+
+def summarize(samples):
+    ci_low, ci_high = median_confidence_interval(samples)
+    return {
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "mean": statistics.mean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "ci95_low": ci_low,
+        "ci95_high": ci_high,
+    }
+
+def run_case(engine, n, workers, warmup, repeat):
+    run, _, _ = ENGINES[engine]
+    for _ in range(warmup):
+        run(n, workers)
+
+    samples = []
+    solutions = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        solutions = run(n, workers)
+        samples.append(time.perf_counter() - start_time)
+
+    result = {"engine": engine, "n": n, "workers": workers, "solutions": solutions, "samples": samples}
+    result.update(summarize(samples))
+    return result
+
+def run_benchmarks(engines, sizes, worker_counts, warmup=1, repeat=5, progress=None):
+    """
+    Runs every (engine, N, workers) combination and returns the list of results.
+    Engines that ignore workers run once per N; engines that only support some N skip the rest.
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1. Got repeat={repeat}.")
+
+    results = []
+    for engine in engines:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}. Choose from: {', '.join(ENGINES)}.")
+        _, supports, uses_workers = ENGINES[engine]
+        for n in sizes:
+            if not supports(n):
+                continue
+            for workers in (worker_counts if uses_workers else [None]):
+                result = run_case(engine, n, workers, warmup, repeat)
+                if progress:
+                    progress(result)
+                results.append(result)
+    return results
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def save_results(results, path, warmup, repeat):
+    report = {
+        "metadata": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "warmup": warmup,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return report
+
+def compare_reports(baseline, candidate):
+    """
+    Pairs up results by (engine, N, workers) and returns rows of
+    (engine, n, workers, baseline median, candidate median, speedup, significant).
+    A change is significant when the two median confidence intervals do not overlap.
+    """
+    baseline_results = {(r["engine"], r["n"], r["workers"]): r for r in baseline["results"]}
+    rows = []
+    for result in candidate["results"]:
+        key = (result["engine"], result["n"], result["workers"])
+        before = baseline_results.get(key)
+        if before is None:
+            continue
+        significant = result["ci95_high"] < before["ci95_low"] or result["ci95_low"] > before["ci95_high"]
+        speedup = before["median"] / result["median"] if result["median"] else float("inf")
+        rows.append(key + (before["median"], result["median"], speedup, significant))
+    return rows
+
+def _format_workers(workers):
+    return "-" if workers is None else str(workers)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the N-Queens solver engines.")
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[8, 10, 12])
+    parser.add_argument("--workers", nargs="+", type=int, default=sorted({1, 2, os.cpu_count() or 1}))
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"),
+                        help="compare two saved result files instead of running benchmarks")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            candidate = json.load(f)
+        print(f"{'engine':<14}{'N':>4}{'workers':>9}{'baseline':>12}{'candidate':>12}{'speedup':>9}")
+        for engine, n, workers, before, after, speedup, significant in compare_reports(baseline, candidate):
+            marker = " *" if significant else ""
+            print(f"{engine:<14}{n:>4}{_format_workers(workers):>9}{before:>12.5f}{after:>12.5f}{speedup:>8.2f}x{marker}")
+        print("* median confidence intervals do not overlap")
+        return
+
+    def progress(result):
+        print(f"{result['engine']:<14} N={result['n']:<3} workers={_format_workers(result['workers']):<3} "
+              f"median={result['median']:.5f}s p95={result['p95']:.5f}s "
+              f"95% CI=[{result['ci95_low']:.5f}, {result['ci95_high']:.5f}]")
+
+    results = run_benchmarks(args.engines, args.sizes, args.workers, args.warmup, args.repeat, progress)
+    save_results(results, args.output, args.warmup, args.repeat)
+    print(f"Saved {len(results)} results to {args.output}")
+
+if __name__ == "__main__":
+    main()
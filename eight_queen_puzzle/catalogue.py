@@ -0,0 +1,100 @@
+import os
+import threading
+from solver import solve_n_queens_symmetric, validate_board_size
+from solution_codec import pack_solutions, unpack_solutions, packed_board_size
+
+# On-disk cache: one packed file per board size (see solution_codec.pack_solutions).
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".solution_cache")
+
+_catalogue = {}
+_solution_sets = {}
+_catalogue_lock = threading.Lock()
+
+def _cache_path(n):
+    return os.path.join(CACHE_DIR, f"queens_{n}.bin")
+
+def _write_cache(n, solutions):
+    """
+    Persist solutions in packed form. The file is written atomically.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(n)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(pack_solutions(solutions, n))
+    os.replace(tmp_path, path)
+
+def _read_cache(n):
+    """
+    Load solutions from the on-disk cache, or return None if it is missing or corrupt.
+    """
+    try:
+        with open(_cache_path(n), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    try:
+        if packed_board_size(data) != n:
+            return None
+        unpacked = unpack_solutions(data)
+    except ValueError:
+        return None
+
+    solutions = tuple(tuple(solution) for solution in unpacked)
+    if any(sorted(solution) != list(range(n)) for solution in solutions):
+        return None
+    return solutions
+
+def get_solutions(n=8):
+    """
+    Returns every N-Queens solution for an n x n board as a tuple of tuples.
+    Solutions are computed once per process, persisted to disk, and served from memory afterwards.
+    """
+    validate_board_size(n)
+    if n > 255:
+        raise ValueError(f"The solution catalogue supports boards up to 255 x 255. Got n={n}.")
+
+    solutions = _catalogue.get(n)
+    if solutions is not None:
+        return solutions
+
+    with _catalogue_lock:
+        if n not in _catalogue:
+            solutions = _read_cache(n)
+            if solutions is None:
+                solutions = tuple(tuple(solution) for solution in solve_n_queens_symmetric(n))
+                try:
+                    _write_cache(n, solutions)
+                except OSError as e:
+                    print(f"Could not write solution cache for N={n}: {e}")
+            _catalogue[n] = solutions
+        return _catalogue[n]
+
+def get_solution_count(n=8):
+    """
+    Number of N-Queens solutions for an n x n board, served from the catalogue.
+    """
+    return len(get_solutions(n))
+
+def is_known_solution(solution):
+    """
+    Check whether a board (list of queen columns) is one of the catalogued solutions.
+    """
+    n = len(solution)
+    solution_set = _solution_sets.get(n)
+    if solution_set is None:
+        solution_set = _solution_sets.setdefault(n, frozenset(get_solutions(n)))
+    return tuple(solution) in solution_set
+
+def clear_catalogue(remove_files=False):
+    """
+    Drop the in-memory catalogue, and optionally the on-disk cache files.
+    """
+    with _catalogue_lock:
+        _catalogue.clear()
+        _solution_sets.clear()
+        if remove_files and os.path.isdir(CACHE_DIR):
+            for name in os.listdir(CACHE_DIR):
+                if name.startswith("queens_") and name.endswith(".bin"):
+                    os.remove(os.path.join(CACHE_DIR, name))
@@ -2,6 +2,8 @@ import mysql.connector
 import json
 import hashlib
 from datetime import datetime
+from solution_codec import pack_solutions, unpack_solutions, solution_set_hash
+from symmetry import canonical_form
 
 # Establish connection to the MySQL database
 def get_db_connection():
@@ -21,36 +23,104 @@ def init_db():
             id INT AUTO_INCREMENT PRIMARY KEY,
             method VARCHAR(255),
             time_taken FLOAT,
+            nodes_visited BIGINT,
             total_solutions INT,
-            solutions TEXT,
             solutions_hash CHAR(40),
             created_at DATETIME
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
     ''')
 
+    # Each distinct solution set is stored once in packed form (see solution_codec)
+    # and referenced from solver runs by its hash.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS solution_sets (
+            solutions_hash CHAR(40) PRIMARY KEY,
+            board_size INT NOT NULL,
+            total_solutions INT NOT NULL,
+            solutions LONGBLOB NOT NULL,
+            created_at DATETIME
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    ''')
+
 
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS player_answers (
         id INT AUTO_INCREMENT PRIMARY KEY,
         player_name VARCHAR(255),
         correct_solution TEXT,
-        created_at DATETIME
+        solution_hash CHAR(40),
+        canonical_hash CHAR(40),
+        created_at DATETIME,
+        UNIQUE KEY uq_player_answers_solution_hash (solution_hash),
+        KEY idx_player_answers_canonical_hash (canonical_hash)
     ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
     ''')
 
+    migrate_player_answers(cursor)
+
+    if not column_exists(cursor, "solutions", "nodes_visited"):
+        cursor.execute("ALTER TABLE solutions ADD COLUMN nodes_visited BIGINT NULL AFTER time_taken")
+
     conn.commit()
     conn.close()
 
+def column_exists(cursor, table, column):
+    cursor.execute('''
+    SELECT COUNT(*) FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+    ''', (table, column))
+    return cursor.fetchone()[0] > 0
+
+def index_exists(cursor, table, index):
+    cursor.execute('''
+    SELECT COUNT(*) FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+    ''', (table, index))
+    return cursor.fetchone()[0] > 0
+
+def migrate_player_answers(cursor):
+    # Older databases store answers without a fingerprint: add the column,
+    # backfill it and index it. Only the first copy of a duplicated answer
+    # gets a hash so the unique index can be built.
+    if not column_exists(cursor, "player_answers", "solution_hash"):
+        cursor.execute("ALTER TABLE player_answers ADD COLUMN solution_hash CHAR(40) NULL AFTER correct_solution")
+
+        cursor.execute("SELECT id, correct_solution FROM player_answers WHERE correct_solution IS NOT NULL ORDER BY id")
+        seen = set()
+        for answer_id, solution_json in cursor.fetchall():
+            solution_hash = generate_solution_hash(json.loads(solution_json))
+            if solution_hash in seen:
+                continue
+            seen.add(solution_hash)
+            cursor.execute("UPDATE player_answers SET solution_hash = %s WHERE id = %s", (solution_hash, answer_id))
+
+    if not index_exists(cursor, "player_answers", "uq_player_answers_solution_hash"):
+        cursor.execute("CREATE UNIQUE INDEX uq_player_answers_solution_hash ON player_answers (solution_hash)")
+
+    # Rotations and reflections of a board share a canonical hash, so spotting a
+    # symmetric variant of a recognized answer is one indexed lookup.
+    if not column_exists(cursor, "player_answers", "canonical_hash"):
+        cursor.execute("ALTER TABLE player_answers ADD COLUMN canonical_hash CHAR(40) NULL AFTER solution_hash")
+
+        cursor.execute("SELECT id, correct_solution FROM player_answers WHERE correct_solution IS NOT NULL")
+        for answer_id, solution_json in cursor.fetchall():
+            cursor.execute("UPDATE player_answers SET canonical_hash = %s WHERE id = %s",
+                           (generate_canonical_hash(json.loads(solution_json)), answer_id))
+
+    if not index_exists(cursor, "player_answers", "idx_player_answers_canonical_hash"):
+        cursor.execute("CREATE INDEX idx_player_answers_canonical_hash ON player_answers (canonical_hash)")
+
 
 def save_player_answer(player_name, correct_solution):
     conn = get_db_connection()
     cursor = conn.cursor()
 
     cursor.execute('''
-    INSERT INTO player_answers (player_name, correct_solution, created_at)
-    VALUES (%s, %s, %s)
+    INSERT INTO player_answers (player_name, correct_solution, solution_hash, canonical_hash, created_at)
+    VALUES (%s, %s, %s, %s, %s)
     ''', 
-    (player_name, json.dumps(correct_solution), datetime.now()))
+    (player_name, json.dumps(correct_solution), generate_solution_hash(correct_solution),
+     generate_canonical_hash(correct_solution), datetime.now()))
 
     conn.commit()
     conn.close()
@@ -66,39 +136,80 @@ def solution_exists(method):
     return exists
 
 def generate_solution_hash(solution):
-    # Generate a hash for the solution using SHA1 or another hashing algorithm
-    return hashlib.sha1(json.dumps(solution).encode('utf-8')).hexdigest()
+    # Generate a hash for the solution using SHA1 or another hashing algorithm.
+    # Lists and tuples of the same columns produce the same fingerprint.
+    return hashlib.sha1(json.dumps(list(solution)).encode('utf-8')).hexdigest()
+
+def generate_canonical_hash(solution):
+    # Shared by every rotation and reflection of a board.
+    return generate_solution_hash(canonical_form(solution))
 
-def save_to_db(method, time_taken, solutions):
+def save_to_db(method, time_taken, solutions, nodes_visited=None):
     conn = get_db_connection()
     cursor = conn.cursor()
 
     try:
-        solutions_hash = generate_solution_hash(solutions)
-        # This time we don't check if the solution already exists; we just insert it.
-        
+        board_size = len(solutions[0]) if solutions else 0
+        packed = pack_solutions(solutions, board_size)
+        solutions_hash = solution_set_hash(packed)
         total_solutions = len(solutions)
 
+        # Identical solution sets are stored once; later runs only reference them.
+        cursor.execute("SELECT COUNT(*) FROM solution_sets WHERE solutions_hash = %s", (solutions_hash,))
+        if cursor.fetchone()[0] == 0:
+            cursor.execute('''
+            INSERT IGNORE INTO solution_sets (solutions_hash, board_size, total_solutions, solutions, created_at)
+            VALUES (%s, %s, %s, %s, %s)
+            ''', 
+            (solutions_hash, board_size, total_solutions, packed, datetime.now()))
+
         cursor.execute('''
-        INSERT INTO solutions (method, time_taken, total_solutions, solutions, solutions_hash, created_at)
+        INSERT INTO solutions (method, time_taken, nodes_visited, total_solutions, solutions_hash, created_at)
         VALUES (%s, %s, %s, %s, %s, %s)
         ''', 
-        (method, time_taken, total_solutions, json.dumps(solutions), solutions_hash, datetime.now()))
+        (method, time_taken, nodes_visited, total_solutions, solutions_hash, datetime.now()))
 
         conn.commit()  # Committing the transaction will auto-increment the 'id'
 
     finally:
         conn.close()
 
+def save_count_to_db(method, time_taken, total_solutions, nodes_visited):
+    # Count-only runs have no solution set to store
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute('''
+        INSERT INTO solutions (method, time_taken, nodes_visited, total_solutions, solutions_hash, created_at)
+        VALUES (%s, %s, %s, %s, NULL, %s)
+        ''', 
+        (method, time_taken, nodes_visited, total_solutions, datetime.now()))
+
+        conn.commit()
+
+    finally:
+        conn.close()
+
+
+def load_solution_set(solutions_hash):
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT solutions FROM solution_sets WHERE solutions_hash = %s", (solutions_hash,))
+    row = cursor.fetchone()
+
+    conn.close()
+    return unpack_solutions(bytes(row[0])) if row else None
 
 def player_solution_exists(player_name, solution):
     conn = get_db_connection()
     cursor = conn.cursor()
 
     cursor.execute('''
-    SELECT COUNT(*) FROM player_answers WHERE player_name = %s AND correct_solution = %s
+    SELECT COUNT(*) FROM player_answers WHERE solution_hash = %s AND player_name = %s
     ''', 
-    (player_name, json.dumps(solution)))
+    (generate_solution_hash(solution), player_name))
 
     exists = cursor.fetchone()[0] > 0
 
@@ -119,7 +230,17 @@ def is_solution_recognized(solution):
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    cursor.execute("SELECT COUNT(*) FROM player_answers WHERE correct_solution = %s", (json.dumps(solution),))
+    cursor.execute("SELECT COUNT(*) FROM player_answers WHERE solution_hash = %s", (generate_solution_hash(solution),))
+    exists = cursor.fetchone()[0] > 0
+
+    conn.close()
+    return exists
+
+def is_symmetric_variant_recognized(solution):
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT COUNT(*) FROM player_answers WHERE canonical_hash = %s", (generate_canonical_hash(solution),))
     exists = cursor.fetchone()[0] > 0
 
     conn.close()
@@ -129,11 +250,11 @@ def count_unique_player_solutions():
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    cursor.execute("SELECT DISTINCT correct_solution FROM player_answers WHERE correct_solution IS NOT NULL")
-    unique_solutions = set(row[0] for row in cursor.fetchall())
+    cursor.execute("SELECT COUNT(DISTINCT solution_hash) FROM player_answers")
+    unique_solutions = cursor.fetchone()[0]
 
     conn.close()
-    return len(unique_solutions)
+    return unique_solutions
 
 def reset_player_solutions():
     conn = get_db_connection()
@@ -1,40 +1,98 @@
 import streamlit as st
 import time
 
+BOARD_SIZE = 8
+
 def init_game_state(force=False):
     if "board" not in st.session_state or force:
-        st.session_state.board = [[0 for _ in range(8)] for _ in range(8)]
+        st.session_state.board = [[0 for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
         st.session_state.queen_count = 0
         st.session_state.start_time = time.time()
         st.session_state.warning_shown = False
+        rebuild_attack_map()
+    elif "queens" not in st.session_state:
+        # Sessions created before the attack map existed only have the board
+        rebuild_attack_map()
+
+def rebuild_attack_map():
+    """
+    Recompute the occupancy counters from the board.
+    place_queen keeps them up to date afterwards, so this only runs on (re)initialisation.
+    """
+    st.session_state.queens = set()
+    st.session_state.row_counts = [0] * BOARD_SIZE
+    st.session_state.col_counts = [0] * BOARD_SIZE
+    st.session_state.diag_counts = [0] * (2 * BOARD_SIZE - 1)       # indexed by row - col + BOARD_SIZE - 1
+    st.session_state.anti_diag_counts = [0] * (2 * BOARD_SIZE - 1)  # indexed by row + col
+    st.session_state.conflicts = 0  # extra queens sharing a line, summed over all lines
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            if st.session_state.board[row][col] == 1:
+                _update_attack_map(row, col, 1)
+
+def _lines(row, col):
+    return (
+        (st.session_state.row_counts, row),
+        (st.session_state.col_counts, col),
+        (st.session_state.diag_counts, row - col + BOARD_SIZE - 1),
+        (st.session_state.anti_diag_counts, row + col),
+    )
+
+def _update_attack_map(row, col, delta):
+    for counts, index in _lines(row, col):
+        if delta > 0:
+            if counts[index] > 0:
+                st.session_state.conflicts += 1
+            counts[index] += 1
+        else:
+            counts[index] -= 1
+            if counts[index] > 0:
+                st.session_state.conflicts -= 1
+
+    if delta > 0:
+        st.session_state.queens.add((row, col))
+    else:
+        st.session_state.queens.discard((row, col))
 
 def count_queens():
     return st.session_state.queen_count
 
 def get_attacked_queens():
     attacked = set()
-    queens = [(r, c) for r in range(8) for c in range(8) if st.session_state.board[r][c] == 1]
-    for i, (r1, c1) in enumerate(queens):
-        for (r2, c2) in queens[i+1:]:
-            if r1 == r2 or c1 == c2 or abs(r1 - r2) == abs(c1 - c2):
-                attacked.add((r1, c1))
-                attacked.add((r2, c2))
+    for row, col in st.session_state.queens:
+        if any(counts[index] > 1 for counts, index in _lines(row, col)):
+            attacked.add((row, col))
+    return attacked
+
+def get_attacked_squares():
+    """
+    Squares that at least one queen can move to, read straight from the occupancy counters.
+    A queen's own square only counts when another queen attacks it.
+    """
+    attacked = set()
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            threshold = 1 if (row, col) in st.session_state.queens else 0
+            if any(counts[index] > threshold for counts, index in _lines(row, col)):
+                attacked.add((row, col))
     return attacked
 
 def get_elapsed_time():
     return int(time.time() - st.session_state.start_time)
 
 def is_solved():
-    return count_queens() == 8 and len(get_attacked_queens()) == 0
+    return count_queens() == BOARD_SIZE and st.session_state.conflicts == 0
 
 def place_queen(row, col):
-    if st.session_state.board[row][col] == 0 and st.session_state.queen_count < 8:
+    if st.session_state.board[row][col] == 0 and st.session_state.queen_count < BOARD_SIZE:
         st.session_state.board[row][col] = 1
         st.session_state.queen_count += 1
         st.session_state.warning_shown = False
+        _update_attack_map(row, col, 1)
     elif st.session_state.board[row][col] == 1:
         st.session_state.board[row][col] = 0
         st.session_state.queen_count -= 1
         st.session_state.warning_shown = False
-    elif st.session_state.queen_count >= 8:
-        st.session_state.warning_shown = True
\ No newline at end of file
+        _update_attack_map(row, col, -1)
+    elif st.session_state.queen_count >= BOARD_SIZE:
+        st.session_state.warning_shown = True
@@ -0,0 +1,50 @@
+import hashlib
+import struct
+
+# Packed solution sets start with the board size as an unsigned 16-bit integer.
+_HEADER = struct.Struct(">H")
+
+def pack_solutions(solutions, n=None):
+    """
+    Pack a list of solutions into bytes: a 2-byte board size header followed by one byte per queen.
+    """
+    if n is None:
+        n = len(solutions[0]) if solutions else 0
+    if not 0 <= n <= 255:
+        raise ValueError(f"Packed encoding supports boards up to 255 x 255. Got n={n}.")
+
+    packed = bytearray(_HEADER.pack(n))
+    for solution in solutions:
+        if len(solution) != n:
+            raise ValueError(f"All solutions must have {n} rows. Got {solution!r}.")
+        packed.extend(solution)
+    return bytes(packed)
+
+def packed_board_size(data):
+    """
+    Board size stored in the header of a packed solution set.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Packed solutions are missing the board size header.")
+    return _HEADER.unpack_from(data)[0]
+
+def unpack_solutions(data):
+    """
+    Unpack bytes produced by pack_solutions into a list of solutions.
+    """
+    n = packed_board_size(data)
+    body = memoryview(data)[_HEADER.size:]
+    if n == 0:
+        if len(body):
+            raise ValueError("Packed solutions for an empty board must have no body.")
+        return []
+    if len(body) % n != 0:
+        raise ValueError(f"Packed solutions are truncated: {len(body)} bytes is not a multiple of {n}.")
+
+    return [list(body[i:i + n]) for i in range(0, len(body), n)]
+
+def solution_set_hash(packed):
+    """
+    SHA-1 fingerprint of a packed solution set, used to deduplicate stored sets.
+    """
+    return hashlib.sha1(packed).hexdigest()
@@ -1,6 +1,10 @@
+import os
 import time
 import threading
-from db import save_to_db
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from db import save_to_db, save_count_to_db
+from symmetry import reflect_solution, canonical_form
 
 class SolverError(Exception):
     """Custom exception class for solver-specific errors."""
@@ -39,6 +43,149 @@ def solve_n_queens(board, row, solutions):
             board[row] = col
             solve_n_queens(board, row + 1, solutions)
 
+def _place_queens_bitmask(n, row, cols, diags, anti_diags, board, solutions):
+    """
+    Bitmask backtracking step: free columns and both diagonals are integer masks,
+    so each candidate square is checked in O(1) instead of re-scanning earlier rows.
+    """
+    if row == n:
+        solutions.append(board[:])
+        return
+
+    full = (1 << n) - 1
+    free = full & ~(cols | diags | anti_diags)
+    while free:
+        bit = free & -free
+        free ^= bit
+        board[row] = bit.bit_length() - 1
+        _place_queens_bitmask(
+            n, row + 1, cols | bit,
+            ((diags | bit) << 1) & full, (anti_diags | bit) >> 1,
+            board, solutions
+        )
+
+def _count_queens_bitmask(full, cols, diags, anti_diags):
+    """
+    Bitmask backtracking step that only counts completed boards.
+    Returns (solutions, nodes), where nodes is the number of queens placed during the search.
+    No board or per-solution list is allocated.
+    """
+    if cols == full:
+        return 1, 0
+
+    count = 0
+    nodes = 0
+    free = full & ~(cols | diags | anti_diags)
+    while free:
+        bit = free & -free
+        free ^= bit
+        sub_count, sub_nodes = _count_queens_bitmask(
+            full, cols | bit, ((diags | bit) << 1) & full, (anti_diags | bit) >> 1
+        )
+        count += sub_count
+        nodes += sub_nodes + 1
+    return count, nodes
+
+def validate_board_size(n):
+    """
+    Check that n is a usable board size.
+    """
+    if not isinstance(n, int) or isinstance(n, bool) or n < 1:
+        raise ValueError(f"Board size must be a positive integer. Got n={n!r}.")
+
+def solve_n_queens_bitmask(n=8):
+    """
+    Enumerates every N-Queens solution for an n x n board using bitmasks.
+    Solutions are returned in the same order as solve_n_queens (lexicographic by column).
+    """
+    validate_board_size(n)
+    solutions = []
+    _place_queens_bitmask(n, 0, 0, 0, 0, [-1] * n, solutions)
+    return solutions
+
+def count_n_queens_bitmask(n=8):
+    """
+    Counts the N-Queens solutions for an n x n board using bitmasks.
+    """
+    validate_board_size(n)
+    return _count_queens_bitmask((1 << n) - 1, 0, 0, 0)[0]
+
+def _iter_queens_bitmask(n, cursor=None):
+    """
+    Iterative bitmask backtracking that yields solutions as they are found.
+    The search state lives in per-row arrays instead of the call stack, so it can be
+    restored from a cursor (a previously yielded solution) and resumed right after it.
+    """
+    full = (1 << n) - 1
+    board = [-1] * n
+    free = [0] * n
+    cols = [0] * n
+    diags = [0] * n
+    anti_diags = [0] * n
+
+    if cursor is None:
+        free[0] = full
+        row = 0
+    else:
+        if len(cursor) != n:
+            raise ValueError(f"Cursor must have {n} rows. Got {cursor!r}.")
+        for row, col in enumerate(cursor):
+            available = full & ~(cols[row] | diags[row] | anti_diags[row])
+            bit = 1 << col if isinstance(col, int) and 0 <= col < n else 0
+            if not available & bit:
+                raise ValueError(f"Cursor is not a valid {n}-Queens solution: {cursor!r}.")
+            # Only columns after the cursor's are left to try on this row
+            free[row] = available & ~((bit << 1) - 1)
+            board[row] = col
+            if row + 1 < n:
+                cols[row + 1] = cols[row] | bit
+                diags[row + 1] = ((diags[row] | bit) << 1) & full
+                anti_diags[row + 1] = (anti_diags[row] | bit) >> 1
+        row = n - 1
+
+    while row >= 0:
+        available = free[row]
+        if not available:
+            row -= 1
+            continue
+
+        bit = available & -available
+        free[row] = available ^ bit
+        board[row] = bit.bit_length() - 1
+
+        if row == n - 1:
+            yield board[:]
+        else:
+            cols[row + 1] = cols[row] | bit
+            diags[row + 1] = ((diags[row] | bit) << 1) & full
+            anti_diags[row + 1] = (anti_diags[row] | bit) >> 1
+            free[row + 1] = full & ~(cols[row + 1] | diags[row + 1] | anti_diags[row + 1])
+            row += 1
+
+def iter_n_queens(n=8, skip=0, limit=None, cursor=None):
+    """
+    Lazily yields N-Queens solutions in the same order as solve_n_queens_bitmask.
+    skip and limit select a window of the results; cursor resumes the search
+    right after a previously yielded solution.
+    """
+    validate_board_size(n)
+    if not isinstance(skip, int) or skip < 0:
+        raise ValueError(f"skip must be a non-negative integer. Got skip={skip!r}.")
+    if limit is not None and (not isinstance(limit, int) or limit < 0):
+        raise ValueError(f"limit must be a non-negative integer or None. Got limit={limit!r}.")
+
+    stop = None if limit is None else skip + limit
+    return islice(_iter_queens_bitmask(n, cursor), skip, stop)
+
+def get_solution_page(n=8, page_size=20, cursor=None):
+    """
+    Returns (solutions, next_cursor) for one page of results.
+    next_cursor is passed back in to fetch the following page, and is None once the search is exhausted.
+    """
+    solutions = list(iter_n_queens(n, limit=page_size, cursor=cursor))
+    next_cursor = solutions[-1] if solutions and len(solutions) == page_size else None
+    return solutions, next_cursor
+
 def sequential_solver():
     """
     Solves the N-Queens problem sequentially and saves the result to the database.
@@ -62,45 +209,268 @@ def sequential_solver():
         print(f"Error in sequential_solver: {e}")
         return None, None
 
+def solve_n_queens_threaded():
+    """
+    Solves the 8-Queens problem with one thread per row-0 column and returns the solutions.
+    """
+    solutions = []
+    lock = threading.Lock()
+    threads = []
+
+    def thread_solve(start_col):
+        local_board = [-1] * 8
+        local_solutions = []
+
+        if is_safe(local_board, 0, start_col):
+            local_board[0] = start_col
+            solve_n_queens(local_board, 1, local_solutions)
+
+            with lock:
+                solutions.extend(local_solutions)
+
+    for col in range(8):
+        thread = threading.Thread(target=thread_solve, args=(col,))
+        threads.append(thread)
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return solutions
+
 def threaded_solver():
     """
     Solves the N-Queens problem using multiple threads and saves the result to the database.
     """
     try:
-        solutions = []
-        lock = threading.Lock()
-        threads = []
+        start_time = time.time()
+        solutions = solve_n_queens_threaded()
+        end_time = time.time()
+        time_taken = end_time - start_time
+
+        if not solutions:
+            raise SolverError("Threaded solver found no solutions.")
+
+        save_to_db("Threaded", time_taken, solutions)
+        return time_taken, solutions
+
+    except Exception as e:
+        print(f"Error in threaded_solver: {e}")
+        return None, None
+
+def bitmask_solver(n=8):
+    """
+    Solves the N-Queens problem for any board size with the bitmask engine
+    and saves the result to the database.
+    """
+    try:
+        start_time = time.time()
+        solutions = solve_n_queens_bitmask(n)
+        end_time = time.time()
+
+        time_taken = end_time - start_time
+
+        if not solutions:
+            raise SolverError(f"Bitmask solver found no solutions for N={n}.")
+
+        save_to_db(f"Bitmask (N={n})", time_taken, solutions)
+        return time_taken, solutions
+
+    except Exception as e:
+        print(f"Error in bitmask_solver: {e}")
+        return None, None
+
+def generate_prefixes(n, depth=2):
+    """
+    Lists every safe placement of the first `depth` rows, in lexicographic order.
+    Each prefix is an independent subtree of the search and can be solved on its own.
+    """
+    validate_board_size(n)
+    depth = min(depth, n)
+    prefixes = []
+
+    def extend(prefix):
+        if len(prefix) == depth:
+            prefixes.append(prefix)
+            return
+        for col in range(n):
+            if _prefix_state(n, prefix + [col]) is not None:
+                extend(prefix + [col])
+
+    extend([])
+    return prefixes
+
+def _prefix_state(n, prefix):
+    """
+    Replays a prefix into (cols, diags, anti_diags) masks, or returns None if it is unsafe.
+    """
+    full = (1 << n) - 1
+    cols = diags = anti_diags = 0
+    for col in prefix:
+        bit = 1 << col
+        if (cols | diags | anti_diags) & bit:
+            return None
+        cols |= bit
+        diags = ((diags | bit) << 1) & full
+        anti_diags = (anti_diags | bit) >> 1
+    return cols, diags, anti_diags
+
+def _solve_prefix(n, prefix):
+    """
+    Worker task: enumerates all solutions that start with the given prefix.
+    Returns (worker pid, seconds spent, solutions).
+    """
+    start_time = time.perf_counter()
+    cols, diags, anti_diags = _prefix_state(n, prefix)
+    board = prefix + [-1] * (n - len(prefix))
+    solutions = []
+    _place_queens_bitmask(n, len(prefix), cols, diags, anti_diags, board, solutions)
+    return os.getpid(), time.perf_counter() - start_time, solutions
 
-        def thread_solve(start_col):
-            local_board = [-1] * 8
-            local_solutions = []
+def solve_n_queens_parallel(n=8, workers=None, worker_times=None):
+    """
+    Enumerates N-Queens solutions on a process pool, one task per row-0/row-1 prefix.
+    Results are merged in prefix order, so the output matches solve_n_queens_bitmask.
+    If worker_times is a dict, it is filled with the seconds each worker process spent solving.
+    """
+    prefixes = generate_prefixes(n)
+    solutions = []
 
-            if is_safe(local_board, 0, start_col):
-                local_board[0] = start_col
-                solve_n_queens(local_board, 1, local_solutions)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_solve_prefix, [n] * len(prefixes), prefixes)
+        for pid, elapsed, prefix_solutions in results:
+            solutions.extend(prefix_solutions)
+            if worker_times is not None:
+                worker_times[pid] = worker_times.get(pid, 0.0) + elapsed
 
-                with lock:
-                    solutions.extend(local_solutions)
+    return solutions
 
+def process_solver(n=8, workers=None, worker_times=None):
+    """
+    Solves the N-Queens problem using a pool of worker processes and saves the result to the database.
+    Unlike threaded_solver, the work is not serialized by the GIL.
+    """
+    try:
         start_time = time.time()
+        solutions = solve_n_queens_parallel(n, workers, worker_times)
+        end_time = time.time()
+
+        time_taken = end_time - start_time
 
-        for col in range(8):
-            thread = threading.Thread(target=thread_solve, args=(col,))
-            threads.append(thread)
-            thread.start()
+        if not solutions:
+            raise SolverError(f"Process solver found no solutions for N={n}.")
+
+        save_to_db(f"Multiprocess (N={n})", time_taken, solutions)
+        return time_taken, solutions
+
+    except Exception as e:
+        print(f"Error in process_solver: {e}")
+        return None, None
+
+def solve_n_queens_symmetric(n=8):
+    """
+    Enumerates all N-Queens solutions while only searching the left half of row 0.
+    Every solution with its row-0 queen in the right half is the mirror image of one
+    in the left half, so those are generated by reflection instead of being searched.
+    For odd n, the middle column of row 0 is its own mirror and is searched directly.
+    """
+    validate_board_size(n)
+    full = (1 << n) - 1
+    solutions = []
 
-        for thread in threads:
-            thread.join()
+    for col in range((n + 1) // 2):
+        bit = 1 << col
+        board = [col] + [-1] * (n - 1)
+        half = []
+        _place_queens_bitmask(n, 1, bit, (bit << 1) & full, bit >> 1, board, half)
+        solutions.extend(half)
+        if col != n - 1 - col:
+            solutions.extend(reflect_solution(solution) for solution in half)
 
+    solutions.sort()
+    return solutions
+
+def fundamental_solutions(n=8):
+    """
+    Returns the canonical form of each solution class under rotations and reflections
+    (12 fundamental solutions for N=8), in lexicographic order.
+    """
+    unique = {tuple(canonical_form(solution)) for solution in solve_n_queens_symmetric(n)}
+    return [list(solution) for solution in sorted(unique)]
+
+def symmetric_solver(n=8):
+    """
+    Solves the N-Queens problem using mirror symmetry and saves the result to the database.
+    """
+    try:
+        start_time = time.time()
+        solutions = solve_n_queens_symmetric(n)
         end_time = time.time()
+
         time_taken = end_time - start_time
 
         if not solutions:
-            raise SolverError("Threaded solver found no solutions.")
+            raise SolverError(f"Symmetric solver found no solutions for N={n}.")
 
-        save_to_db("Threaded", time_taken, solutions)
+        save_to_db(f"Symmetric (N={n})", time_taken, solutions)
         return time_taken, solutions
 
     except Exception as e:
-        print(f"Error in threaded_solver: {e}")
+        print(f"Error in symmetric_solver: {e}")
         return None, None
+
+def _count_prefix(n, prefix):
+    """
+    Worker task: counts the solutions that start with the given prefix.
+    Returns (solutions, nodes), counting the prefix queens as visited nodes.
+    """
+    cols, diags, anti_diags = _prefix_state(n, prefix)
+    count, nodes = _count_queens_bitmask((1 << n) - 1, cols, diags, anti_diags)
+    return count, nodes + len(prefix)
+
+def count_n_queens(n=8, workers=None):
+    """
+    Counts N-Queens solutions without materializing them.
+    Only the left half of row 0 is searched and its count doubled (the middle column
+    of odd boards counts once). With workers > 1 the row-0/row-1 prefixes are counted
+    on a process pool. Returns (total_solutions, nodes_visited).
+    """
+    validate_board_size(n)
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError(f"workers must be a positive integer or None. Got workers={workers!r}.")
+
+    prefixes = [prefix for prefix in generate_prefixes(n) if prefix[0] <= (n - 1) // 2]
+    weights = [1 if prefix[0] == n - 1 - prefix[0] else 2 for prefix in prefixes]
+
+    if workers is None or workers == 1:
+        results = [_count_prefix(n, prefix) for prefix in prefixes]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_count_prefix, [n] * len(prefixes), prefixes))
+
+    total_solutions = sum(weight * count for weight, (count, _) in zip(weights, results))
+    # Every row-0 queen in the searched half, plus each prefix subtree below it
+    nodes_visited = (n + 1) // 2 + sum(nodes - 1 for _, nodes in results)
+    return total_solutions, nodes_visited
+
+def counting_solver(n=8, workers=None):
+    """
+    Counts the N-Queens solutions and saves the count and node statistics to the database.
+    Returns (time_taken, total_solutions, nodes_visited).
+    """
+    try:
+        start_time = time.time()
+        total_solutions, nodes_visited = count_n_queens(n, workers)
+        end_time = time.time()
+
+        time_taken = end_time - start_time
+
+        if not total_solutions:
+            raise SolverError(f"Counting solver found no solutions for N={n}.")
+
+        save_count_to_db(f"Count Only (N={n})", time_taken, total_solutions, nodes_visited)
+        return time_taken, total_solutions, nodes_visited
+
+    except Exception as e:
+        print(f"Error in counting_solver: {e}")
+        return None, None, None
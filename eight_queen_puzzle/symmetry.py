@@ -0,0 +1,42 @@
+def _check_full_solution(solution):
+    """
+    Check that a solution places exactly one queen in every row and column.
+    """
+    if not isinstance(solution, (list, tuple)) or sorted(solution) != list(range(len(solution))):
+        raise ValueError(f"Expected a complete board with one queen per row and column. Got {solution!r}.")
+
+def rotate_solution(solution):
+    """
+    Rotates a board 90 degrees clockwise: the queen at (row, col) moves to (col, n-1-row).
+    """
+    n = len(solution)
+    rotated = [-1] * n
+    for row, col in enumerate(solution):
+        rotated[col] = n - 1 - row
+    return rotated
+
+def reflect_solution(solution):
+    """
+    Mirrors a board left to right.
+    """
+    n = len(solution)
+    return [n - 1 - col for col in solution]
+
+def dihedral_variants(solution):
+    """
+    Returns the 8 boards obtained by rotating and reflecting a solution (duplicates included).
+    """
+    _check_full_solution(solution)
+    variants = []
+    for board in (list(solution), reflect_solution(solution)):
+        for _ in range(4):
+            variants.append(board)
+            board = rotate_solution(board)
+    return variants
+
+def canonical_form(solution):
+    """
+    Canonical representative of a solution under rotations and reflections:
+    the lexicographically smallest of its dihedral variants.
+    """
+    return min(dihedral_variants(solution))
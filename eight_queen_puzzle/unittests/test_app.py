@@ -29,10 +29,11 @@ class TestSavePlayerAnswer(unittest.TestCase):
         mock_conn.cursor.assert_called_once()
         mock_cursor.execute.assert_called_once_with(
             '''
-    INSERT INTO player_answers (player_name, correct_solution, created_at)
-    VALUES (%s, %s, %s)
+    INSERT INTO player_answers (player_name, correct_solution, solution_hash, canonical_hash, created_at)
+    VALUES (%s, %s, %s, %s, %s)
     ''',
-            (player_name, json.dumps(correct_solution), unittest.mock.ANY)
+            (player_name, json.dumps(correct_solution), db.generate_solution_hash(correct_solution),
+             db.generate_canonical_hash(correct_solution), unittest.mock.ANY)
         )
         mock_conn.commit.assert_called_once()
         mock_conn.close.assert_called_once()
@@ -52,7 +53,96 @@ class TestSavePlayerAnswer(unittest.TestCase):
             db.save_player_answer(player_name, correct_solution)
 
 # ---------------------------------------------
-# Test 2: Reset after all solutions are found
+# Test 2: Hashed lookups of player answers
+# ---------------------------------------------
+
+class TestSolutionHashLookups(unittest.TestCase):
+
+    @patch('db.get_db_connection')
+    def test_is_solution_recognized_uses_hash(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (1,)
+
+        solution = [0, 4, 7, 5, 2, 6, 1, 3]
+        self.assertTrue(db.is_solution_recognized(solution))
+
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn("solution_hash = %s", query)
+        self.assertEqual(params, (db.generate_solution_hash(solution),))
+
+    @patch('db.get_db_connection')
+    def test_count_unique_player_solutions_counts_on_server(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (12,)
+
+        self.assertEqual(db.count_unique_player_solutions(), 12)
+        mock_cursor.fetchall.assert_not_called()
+
+    @patch('db.get_db_connection')
+    def test_symmetric_variant_lookup_uses_canonical_hash(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (1,)
+
+        solution = [0, 4, 7, 5, 2, 6, 1, 3]
+        mirrored = [7 - col for col in solution]
+        self.assertTrue(db.is_symmetric_variant_recognized(mirrored))
+
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn("canonical_hash = %s", query)
+        self.assertEqual(params, (db.generate_canonical_hash(solution),))
+        mock_cursor.fetchall.assert_not_called()
+
+    def test_canonical_hash_is_shared_by_symmetric_boards(self):
+        solution = [0, 4, 7, 5, 2, 6, 1, 3]
+        self.assertEqual(db.generate_canonical_hash(solution), db.generate_canonical_hash(solution[::-1]))
+        mirrored = [7 - col for col in solution]
+        self.assertEqual(db.generate_canonical_hash(mirrored), db.generate_solution_hash(solution))
+        self.assertNotEqual(db.generate_canonical_hash(mirrored), db.generate_solution_hash(mirrored))
+
+    def test_migration_backfills_canonical_hash(self):
+        mock_cursor = MagicMock()
+        # solution_hash and its index exist; canonical_hash and its index do not
+        mock_cursor.fetchone.side_effect = [(1,), (1,), (0,), (0,)]
+        mock_cursor.fetchall.return_value = [(7, json.dumps([0, 4, 7, 5, 2, 6, 1, 3]))]
+
+        db.migrate_player_answers(mock_cursor)
+
+        statements = [call[0] for call in mock_cursor.execute.call_args_list]
+        self.assertIn(("UPDATE player_answers SET canonical_hash = %s WHERE id = %s",
+                       (db.generate_canonical_hash([0, 4, 7, 5, 2, 6, 1, 3]), 7)), statements)
+        self.assertTrue(any("CREATE INDEX idx_player_answers_canonical_hash" in statement[0] for statement in statements))
+
+    def test_solution_hash_is_fixed_width(self):
+        self.assertEqual(len(db.generate_solution_hash([0, 4, 7, 5, 2, 6, 1, 3])), 40)
+        self.assertEqual(db.generate_solution_hash((0, 4, 7, 5, 2, 6, 1, 3)),
+                         db.generate_solution_hash([0, 4, 7, 5, 2, 6, 1, 3]))
+
+    @patch('db.get_db_connection')
+    def test_save_to_db_stores_each_solution_set_once(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (1,)  # the set is already stored
+
+        db.save_to_db("Sequential", 0.01, [[1, 3, 0, 2], [2, 0, 3, 1]])
+
+        queries = [call[0][0] for call in mock_cursor.execute.call_args_list]
+        self.assertFalse(any("INSERT IGNORE INTO solution_sets" in query for query in queries))
+        self.assertTrue(any("INSERT INTO solutions" in query for query in queries))
+        mock_conn.commit.assert_called_once()
+
+# ---------------------------------------------
+# Test 3: Reset after all solutions are found
 # ---------------------------------------------
 
 class TestResetAfterAllSolutionsFound(unittest.TestCase):
@@ -78,7 +168,7 @@ class TestResetAfterAllSolutionsFound(unittest.TestCase):
         mock_reset_player_solutions.assert_not_called()
 
 # ---------------------------------------------
-# Test 3: Solution already recognized warning
+# Test 4: Solution already recognized warning
 # ---------------------------------------------
 
 class TestSolutionRecognition(unittest.TestCase):
@@ -86,10 +176,9 @@ class TestSolutionRecognition(unittest.TestCase):
     @patch('app.save_player_answer')
     @patch('app.is_solution_recognized')
     @patch('app.player_solution_exists', return_value=False)
-    @patch('app.is_solved', return_value=True)
     @patch('app.count_queens', return_value=8)
     @patch('app.st')
-    def test_solution_already_recognized(self, mock_st, mock_count_queens, mock_is_solved, mock_player_solution_exists, 
+    def test_solution_already_recognized(self, mock_st, mock_count_queens, mock_player_solution_exists, 
                                          mock_is_solution_recognized, mock_save_player_answer):
         player_name = "Test Player"
         current_solution = [0, 4, 7, 5, 2, 6, 1, 3]
@@ -102,6 +191,15 @@ class TestSolutionRecognition(unittest.TestCase):
         mock_st.warning.assert_called_with("This solution has already been recognized by another player. Try a new one.")
         mock_save_player_answer.assert_not_called()
 
+    @patch('app.save_player_answer')
+    @patch('app.count_queens', return_value=8)
+    @patch('app.st')
+    def test_attacking_queens_rejected(self, mock_st, mock_count_queens, mock_save_player_answer):
+        handle_player_answer("Test Player", [0, 1, 2, 3, 4, 5, 6, 7])
+
+        mock_st.error.assert_called_with("Incorrect solution! Some queens are attacking each other.")
+        mock_save_player_answer.assert_not_called()
+
 # ---------------------------------------------
 # Run all tests
 # ---------------------------------------------
@@ -0,0 +1,49 @@
+import json
+import os
+import tempfile
+import unittest
+
+import benchmark
+
+class TestBenchmarkHarness(unittest.TestCase):
+
+    def test_percentile(self):
+        samples = [5, 1, 4, 2, 3]
+        self.assertEqual(benchmark.percentile(samples, 0.5), 3)
+        self.assertEqual(benchmark.percentile(samples, 1.0), 5)
+        self.assertAlmostEqual(benchmark.percentile(samples, 0.95), 4.8)
+
+    def test_median_confidence_interval_contains_median(self):
+        samples = [0.10, 0.11, 0.12, 0.13, 0.50]
+        low, high = benchmark.median_confidence_interval(samples)
+        self.assertLessEqual(low, 0.12)
+        self.assertGreaterEqual(high, 0.12)
+
+    def test_run_benchmarks_covers_supported_grid(self):
+        results = benchmark.run_benchmarks(["sequential", "bitmask", "count"], [6, 8], [1, 2], warmup=0, repeat=2)
+
+        cases = {(r["engine"], r["n"], r["workers"]) for r in results}
+        self.assertEqual(cases, {
+            ("sequential", 8, None),
+            ("bitmask", 6, None), ("bitmask", 8, None),
+            ("count", 6, 1), ("count", 6, 2), ("count", 8, 1), ("count", 8, 2),
+        })
+        for result in results:
+            self.assertEqual(len(result["samples"]), 2)
+            self.assertEqual(result["solutions"], {6: 4, 8: 92}[result["n"]])
+
+    def test_saved_results_can_be_compared(self):
+        results = benchmark.run_benchmarks(["bitmask"], [6], [1], warmup=0, repeat=3)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "bench.json")
+            benchmark.save_results(results, path, warmup=0, repeat=3)
+            with open(path) as f:
+                report = json.load(f)
+
+        rows = benchmark.compare_reports(report, report)
+        self.assertEqual(len(rows), 1)
+        self.assertAlmostEqual(rows[0][5], 1.0)
+        self.assertFalse(rows[0][6])
+
+if __name__ == '__main__':
+    unittest.main()
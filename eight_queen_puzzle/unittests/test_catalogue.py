@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import catalogue
+
+class TestSolutionCatalogue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_patch = patch('catalogue.CACHE_DIR', self.tmp_dir.name)
+        self.cache_patch.start()
+        catalogue.clear_catalogue()
+
+    def tearDown(self):
+        catalogue.clear_catalogue()
+        self.cache_patch.stop()
+        self.tmp_dir.cleanup()
+
+    def test_solutions_are_computed_once(self):
+        with patch('catalogue.solve_n_queens_symmetric', wraps=catalogue.solve_n_queens_symmetric) as mock_solve:
+            first = catalogue.get_solutions(8)
+            second = catalogue.get_solutions(8)
+
+        self.assertEqual(len(first), 92)
+        self.assertIs(first, second)
+        mock_solve.assert_called_once_with(8)
+
+    def test_solutions_are_loaded_from_disk_cache(self):
+        solutions = catalogue.get_solutions(6)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp_dir.name, "queens_6.bin")))
+
+        catalogue.clear_catalogue()
+        with patch('catalogue.solve_n_queens_symmetric') as mock_solve:
+            self.assertEqual(catalogue.get_solutions(6), solutions)
+        mock_solve.assert_not_called()
+
+    def test_corrupt_cache_is_recomputed(self):
+        with open(os.path.join(self.tmp_dir.name, "queens_8.bin"), "wb") as f:
+            f.write(b"\x00\x00\x00")
+
+        self.assertEqual(catalogue.get_solution_count(8), 92)
+
+    def test_is_known_solution(self):
+        self.assertTrue(catalogue.is_known_solution([0, 4, 7, 5, 2, 6, 1, 3]))
+        self.assertFalse(catalogue.is_known_solution([0, 1, 2, 3, 4, 5, 6, 7]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import game
+
+class SessionState(SimpleNamespace):
+    def __contains__(self, key):
+        return hasattr(self, key)
+
+class TestAttackMap(unittest.TestCase):
+
+    def setUp(self):
+        self.st_patch = patch('game.st', SimpleNamespace(session_state=SessionState()))
+        self.st_patch.start()
+        game.init_game_state(force=True)
+
+    def tearDown(self):
+        self.st_patch.stop()
+
+    def test_attacked_queens_follow_placements(self):
+        game.place_queen(0, 0)
+        game.place_queen(2, 2)  # same diagonal
+        game.place_queen(1, 4)
+        self.assertEqual(game.get_attacked_queens(), {(0, 0), (2, 2)})
+
+        game.place_queen(2, 2)  # removing the queen clears the conflict
+        self.assertEqual(game.get_attacked_queens(), set())
+
+    def test_is_solved(self):
+        for row, col in enumerate([0, 4, 7, 5, 2, 6, 1, 3]):
+            game.place_queen(row, col)
+        self.assertTrue(game.is_solved())
+
+        game.place_queen(7, 3)
+        game.place_queen(7, 2)
+        self.assertFalse(game.is_solved())
+
+    def test_attacked_squares(self):
+        game.place_queen(0, 0)
+        attacked = game.get_attacked_squares()
+
+        self.assertNotIn((0, 0), attacked)
+        self.assertIn((0, 7), attacked)
+        self.assertIn((7, 0), attacked)
+        self.assertIn((7, 7), attacked)
+        self.assertNotIn((1, 2), attacked)
+        self.assertEqual(len(attacked), 21)
+
+    def test_rebuild_matches_incremental_updates(self):
+        for row, col in [(0, 1), (3, 4), (5, 1), (6, 6)]:
+            game.place_queen(row, col)
+        incremental = (game.get_attacked_queens(), game.st.session_state.conflicts)
+
+        game.rebuild_attack_map()
+        self.assertEqual((game.get_attacked_queens(), game.st.session_state.conflicts), incremental)
+
+if __name__ == '__main__':
+    unittest.main()
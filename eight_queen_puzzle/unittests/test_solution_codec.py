@@ -0,0 +1,28 @@
+import unittest
+
+from solution_codec import pack_solutions, unpack_solutions, solution_set_hash
+from solver import solve_n_queens_bitmask
+
+class TestSolutionCodec(unittest.TestCase):
+
+    def test_pack_unpack_round_trip(self):
+        solutions = solve_n_queens_bitmask(8)
+        packed = pack_solutions(solutions)
+
+        # 2-byte header plus one byte per queen
+        self.assertEqual(len(packed), 2 + 92 * 8)
+        self.assertEqual(unpack_solutions(packed), solutions)
+
+    def test_unpack_rejects_truncated_data(self):
+        packed = pack_solutions(solve_n_queens_bitmask(6))
+        with self.assertRaises(ValueError):
+            unpack_solutions(packed[:-1])
+
+    def test_solution_set_hash_identifies_identical_sets(self):
+        first = pack_solutions(solve_n_queens_bitmask(8))
+        second = pack_solutions(solve_n_queens_bitmask(8))
+        self.assertEqual(solution_set_hash(first), solution_set_hash(second))
+        self.assertNotEqual(solution_set_hash(first), solution_set_hash(pack_solutions(solve_n_queens_bitmask(6))))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,13 @@
 import unittest
 from unittest.mock import patch
-from solver import sequential_solver, threaded_solver
+from solver import (
+    sequential_solver, threaded_solver, bitmask_solver,
+    solve_n_queens_bitmask, count_n_queens_bitmask,
+    process_solver, generate_prefixes,
+    solve_n_queens_symmetric, fundamental_solutions,
+    iter_n_queens, get_solution_page, count_n_queens, counting_solver
+)
+from symmetry import canonical_form, dihedral_variants
 
 class TestNQueensSolvers(unittest.TestCase):
 
@@ -34,5 +41,106 @@ class TestNQueensSolvers(unittest.TestCase):
         # For 8-Queens, there should be exactly 92 solutions
         self.assertEqual(len(solutions), 92)
 
+    @patch('solver.save_to_db')
+    def test_bitmask_solver_matches_sequential(self, mock_save_to_db):
+        _, sequential_solutions = sequential_solver()
+        time_taken, solutions = bitmask_solver(8)
+
+        self.assertIsInstance(time_taken, float)
+        self.assertEqual(solutions, sequential_solutions)
+
+    def test_bitmask_engine_other_board_sizes(self):
+        # Known solution counts for N = 1..10
+        expected = [1, 0, 0, 2, 10, 4, 40, 92, 352, 724]
+        for n, count in enumerate(expected, start=1):
+            self.assertEqual(count_n_queens_bitmask(n), count)
+            self.assertEqual(len(solve_n_queens_bitmask(n)), count)
+
+    def test_bitmask_engine_rejects_invalid_size(self):
+        with self.assertRaises(ValueError):
+            solve_n_queens_bitmask(0)
+        with self.assertRaises(ValueError):
+            count_n_queens_bitmask("8")
+
+    @patch('solver.save_to_db')
+    def test_process_solver(self, mock_save_to_db):
+        worker_times = {}
+        time_taken, solutions = process_solver(8, workers=2, worker_times=worker_times)
+
+        self.assertIsInstance(time_taken, float)
+        # Merged in prefix order, so the result is deterministic and matches the bitmask engine
+        self.assertEqual(solutions, solve_n_queens_bitmask(8))
+        self.assertTrue(worker_times)
+        mock_save_to_db.assert_called_once()
+
+    def test_generate_prefixes_are_safe_and_ordered(self):
+        prefixes = generate_prefixes(8)
+        self.assertEqual(prefixes, sorted(prefixes))
+        for first, second in prefixes:
+            self.assertGreater(abs(first - second), 1)
+
+    def test_symmetric_enumeration_matches_full_search(self):
+        for n in range(1, 11):
+            self.assertEqual(solve_n_queens_symmetric(n), solve_n_queens_bitmask(n))
+
+    def test_fundamental_solutions(self):
+        self.assertEqual(len(fundamental_solutions(8)), 12)
+        self.assertEqual(len(fundamental_solutions(6)), 1)
+
+    def test_canonical_form_is_shared_by_rotations_and_reflections(self):
+        solution = [0, 4, 7, 5, 2, 6, 1, 3]
+        form = canonical_form(solution)
+        for variant in dihedral_variants(solution):
+            self.assertEqual(canonical_form(variant), form)
+
+    def test_canonical_form_rejects_incomplete_board(self):
+        with self.assertRaises(ValueError):
+            canonical_form([0, 4, 7, 5, 2, 6, 1, -1])
+
+    def test_iter_n_queens_is_lazy_and_ordered(self):
+        solutions = iter_n_queens(8)
+        self.assertEqual(next(solutions), [0, 4, 7, 5, 2, 6, 1, 3])
+        self.assertEqual([[0, 4, 7, 5, 2, 6, 1, 3]] + list(solutions), solve_n_queens_bitmask(8))
+
+    def test_iter_n_queens_skip_and_limit(self):
+        all_solutions = solve_n_queens_bitmask(8)
+        self.assertEqual(list(iter_n_queens(8, skip=10, limit=5)), all_solutions[10:15])
+        self.assertEqual(list(iter_n_queens(8, skip=90)), all_solutions[90:])
+
+    def test_iter_n_queens_resumes_from_cursor(self):
+        all_solutions = solve_n_queens_bitmask(8)
+        self.assertEqual(list(iter_n_queens(8, cursor=all_solutions[41])), all_solutions[42:])
+        self.assertEqual(list(iter_n_queens(8, cursor=all_solutions[-1])), [])
+
+        with self.assertRaises(ValueError):
+            list(iter_n_queens(8, cursor=[0, 1, 2, 3, 4, 5, 6, 7]))
+
+    def test_get_solution_page(self):
+        all_solutions = solve_n_queens_bitmask(8)
+        pages = []
+        solutions, cursor = get_solution_page(8, 40)
+        pages.extend(solutions)
+        while cursor is not None:
+            solutions, cursor = get_solution_page(8, 40, cursor)
+            pages.extend(solutions)
+        self.assertEqual(pages, all_solutions)
+
+    def test_count_n_queens(self):
+        expected = [1, 0, 0, 2, 10, 4, 40, 92, 352, 724, 2680]
+        for n, count in enumerate(expected, start=1):
+            total_solutions, nodes_visited = count_n_queens(n)
+            self.assertEqual(total_solutions, count)
+            self.assertGreaterEqual(nodes_visited, count)
+
+    def test_count_n_queens_with_workers(self):
+        self.assertEqual(count_n_queens(9, workers=2), count_n_queens(9))
+
+    @patch('solver.save_count_to_db')
+    def test_counting_solver_records_nodes(self, mock_save_count_to_db):
+        time_taken, total_solutions, nodes_visited = counting_solver(8)
+
+        self.assertEqual(total_solutions, 92)
+        mock_save_count_to_db.assert_called_once_with("Count Only (N=8)", time_taken, 92, nodes_visited)
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,14 +2,26 @@ import streamlit as st
 import random
 import time
 import datetime
-import networkx as nx
-import matplotlib.pyplot as plt
 import pandas as pd
 import plotly.express as px
-from tsp_algorithms import run_tsp_algorithms
+from tsp_algorithms import (
+    iter_tsp_algorithms, plan_tsp_algorithms, algorithm_names, DEFAULT_TIME_BUDGET, DEFAULT_MEMORY_BUDGET
+)
+from instance import TSPInstance
+from result_cache import result_cache, fingerprint
+from city_map import render_city_map_from_data
+from distance_table import build_distance_table, path_length
 from dotenv import load_dotenv
 from database import db
 
+# Seconds an algorithm may run on the results page before it is cancelled
+ALGORITHM_TIMEOUT = 30
+
+# Large-instance benchmark: cities get integer ids and seeded positions on a BENCHMARK_GRID x BENCHMARK_GRID grid
+BENCHMARK_MIN_CITIES = 50
+BENCHMARK_MAX_CITIES = 2000
+BENCHMARK_GRID = 1000
+
 # Load environment variables
 load_dotenv()
 
@@ -32,6 +44,11 @@ if "cities" not in st.session_state:
 if "selected_cities" not in st.session_state:
     st.session_state.selected_cities = []
     
+@st.cache_data(max_entries=64, show_spinner=False)
+def cached_city_map(coordinates, labels, metric, home):
+    """City map PNG, rendered once per distance set and reused across reruns."""
+    return render_city_map_from_data(coordinates, labels, metric, home)
+
 # --- Validation Functions ---
 def validate_name(name):
     """Validate player name"""
@@ -123,6 +140,9 @@ def go_to_path_game():
         st.session_state.start_time = datetime.datetime.now()
         st.session_state.page = "path_game"
 
+def rerun_stored_instance(instance_hash, seed):
+    st.session_state.benchmark_rerun = {'instance_hash': instance_hash, 'seed': seed}
+
 # --- Sidebar Navigation ---
 st.sidebar.title("Navigation")
 
@@ -131,7 +151,7 @@ st.sidebar.title("Navigation")
 
 nav_option = st.sidebar.radio(
     "Go to:",
-    ["Play Game", "Algorithm Performance", "Leaderboard"],
+    ["Play Game", "Algorithm Performance", "Large Instance Benchmark", "Leaderboard"],
     index=0
 )
 
@@ -139,6 +159,8 @@ if nav_option == "Play Game" and st.session_state.page not in ["welcome", "name_
     st.session_state.page = "welcome"
 elif nav_option == "Algorithm Performance":
     st.session_state.page = "algorithm_performance"
+elif nav_option == "Large Instance Benchmark":
+    st.session_state.page = "benchmark"
 elif nav_option == "Leaderboard":
     st.session_state.page = "leaderboard"
 
@@ -263,60 +285,24 @@ elif st.session_state.page == "path_game":
     st.markdown(f"🏠 **Home City:** `{home}`")
     st.markdown(f"🗺️ **Cities to Visit:** `{', '.join(selected)}`")
 
-    def generate_distances(cities):
-        distances = {}
-        for i, city1 in enumerate(cities):
-            for j, city2 in enumerate(cities):
-                if i < j:  
-                    dist = random.randint(50, 100)
-                    distances[(city1, city2)] = dist
-                    distances[(city2, city1)] = dist
-
-        return distances
-
-    if "distances" not in st.session_state:
-        st.session_state.distances = generate_distances(all_cities)
-
-    distances = st.session_state.distances
-
-    G = nx.Graph()
-    G.add_nodes_from(all_cities)
-    for (i, j), d in distances.items():
-        G.add_edge(i, j, weight=d)
+    # Cities sit at random grid points; distances are rounded Euclidean (TSPLIB EUC_2D)
+    if "instance" not in st.session_state:
+        st.session_state.instance = TSPInstance.random(all_cities)
 
-    node_colors = []
-    for node in G.nodes():
-        if node == st.session_state.home_city:
-            node_colors.append("red")   
-        else:
-            node_colors.append("skyblue")
+    instance = st.session_state.instance
 
     col1, col2 = st.columns(2)
 
     with col1:
         st.subheader("📍 City Map")
-        pos = nx.spring_layout(G, seed=42)
-        fig, ax = plt.subplots(figsize=(6, 6))
-        nx.draw(G, pos, with_labels=True, node_color=node_colors, node_size=2000, font_size=12, ax=ax)
-        labels = nx.get_edge_attributes(G, 'weight')
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=10, ax=ax)
-        st.pyplot(fig)
+        st.image(cached_city_map(
+            tuple(map(tuple, instance.coordinates.tolist())), tuple(instance.labels), instance.metric, home
+        ))
 
     with col2:
         st.subheader("📏 Distance Matrix")
-        matrix = pd.DataFrame(index=all_cities, columns=all_cities)
-        for i in all_cities:
-            for j in all_cities:
-                if i == j:
-                    matrix.loc[i, j] = 0
-                else:
-                    matrix.loc[i, j] = distances.get((i, j), distances.get((j, i), 0))
-    
-        display_matrix = matrix.copy()
-        for i in all_cities:
-            display_matrix.loc[i, i] = '-'
-        
-        st.dataframe(matrix.astype(str))
+        _, distance_frame = build_distance_table(instance)
+        st.dataframe(distance_frame.style.format("{:g}"))
         
     st.markdown("### 🚶‍♂️ Your Move!")
     st.markdown("Enter the cities in the order you want to visit (starting and ending at your home city).")
@@ -344,27 +330,10 @@ elif st.session_state.page == "evaluate_path":
     home = st.session_state.home_city
     selected = st.session_state.selected_cities
     all_cities = [home] + selected
-    distances = st.session_state.distances
-
-    city_indices = {city: i for i, city in enumerate(all_cities)}
-    city_names = list(city_indices.keys())
-
-    dist_matrix = [[0] * len(city_names) for _ in range(len(city_names))]
-    for (c1, c2), d in distances.items():
-        i, j = city_indices[c1], city_indices[c2]
-        dist_matrix[i][j] = d
-        dist_matrix[j][i] = d
-
-    def path_distance(path):
-        total = 0
-        for i in range(len(path) - 1):
-            from_city = path[i]
-            to_city = path[i + 1]
-            from_idx = city_indices[from_city]
-            to_idx = city_indices[to_city]
-            d = dist_matrix[from_idx][to_idx]
-            total += d
-        return total
+    # The instance caches its matrix, so the algorithms and the table below share one array
+    dist_matrix = st.session_state.instance
+    _, distance_frame = build_distance_table(dist_matrix)
+    city_names = dist_matrix.labels
 
     validation_error = validate_user_path(user_input, home, selected)
     if validation_error:
@@ -373,9 +342,32 @@ elif st.session_state.page == "evaluate_path":
         st.stop()
 
     user_path = [city.strip().upper() for city in user_input.split(",") if city.strip()]
-    user_distance = path_distance(user_path)
-
-    algo_outputs = run_tsp_algorithms(dist_matrix, home_index=0)
+    user_distance = path_length(distance_frame, user_path)
+
+    # Reruns, refreshes and replayed games reuse the results computed for the same instance
+    cache_key = fingerprint(dist_matrix, 0, DEFAULT_TIME_BUDGET, DEFAULT_MEMORY_BUDGET,
+                            ALGORITHM_TIMEOUT, algorithm_names())
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        algo_outputs = cached['results']
+        skipped_algorithms = cached['skipped']
+    else:
+        # Algorithms run in parallel; show the best tour found so far while the slower ones finish
+        algo_outputs = []
+        skipped_algorithms = []
+        progress = st.empty()
+        for kind, entry in iter_tsp_algorithms(dist_matrix, home_index=0, timeout=ALGORITHM_TIMEOUT):
+            if kind == 'result':
+                algo_outputs.append(entry)
+                best_so_far = min(algo_outputs, key=lambda x: x['cost'])
+                progress.info(f"⏳ Best so far: `{best_so_far['cost']}` units ({best_so_far['algorithm']}) "
+                              f"— {len(algo_outputs)} algorithm(s) finished")
+            else:
+                skipped_algorithms.append(entry)
+        progress.empty()
+        # A timed-out algorithm may finish next time, so partial results are not kept
+        if not any(entry.get('timed_out') for entry in skipped_algorithms):
+            result_cache.put(cache_key, {'results': algo_outputs, 'skipped': skipped_algorithms})
     best_result = min(algo_outputs, key=lambda x: x['cost'])
     best_path_names = [city_names[i] for i in best_result['path']]
 
@@ -407,25 +399,33 @@ elif st.session_state.page == "evaluate_path":
     else:
         st.info("🔍 Your path is valid, but not the shortest.")
 
-    game_id = db.save_game_result(
-        st.session_state.player_name,
-        home,
-        selected,
-        ','.join(user_path),
-        user_distance,
-        True,
-        is_optimal,
-        ' -> '.join(best_path_names),
-        best_result['cost']
-    )
-
-    if game_id is not None:
-        db.save_algorithm_performance(
-            game_id,
-            [(res['algorithm'], res['time']) for res in algo_outputs]
+    # Streamlit reruns this page on every interaction; record each submission only once
+    submission = (cache_key, user_input)
+    if st.session_state.get("saved_submission") != submission:
+        instance_hash = db.save_instance(dist_matrix)
+        game_id = db.save_game_result(
+            st.session_state.player_name,
+            home,
+            selected,
+            ','.join(user_path),
+            user_distance,
+            True,
+            is_optimal,
+            ' -> '.join(best_path_names),
+            best_result['cost'],
+            instance_hash
         )
-    else:
-        st.error("❌ Failed to save game results. Check database logs.")
+
+        if game_id is not None:
+            st.session_state.saved_submission = submission
+            # Cached timings were already recorded when they were measured
+            if cached is None:
+                db.save_algorithm_performance(
+                    game_id,
+                    [(res['algorithm'], res['time']) for res in algo_outputs]
+                )
+        else:
+            st.error("❌ Failed to save game results. Check database logs.")
         
     with st.expander("📊 See How the Algorithms Performed"):
         for res in algo_outputs:
@@ -433,7 +433,14 @@ elif st.session_state.page == "evaluate_path":
             cost = res['cost']
             t = res['time']
             path = [city_names[i] for i in res['path']]
-            st.markdown(f"**{algo_name}**: `{ ' -> '.join(str(x) for x in path) }` = {str(cost)} units in `{str(t)}` seconds")
+            st.markdown(f"**{algo_name}**: `{ ' -> '.join(str(x) for x in path) }` = {str(cost)} units in `{str(t)}` seconds "
+                        f"(CPU `{res['cpu_time']:.4f}` s)")
+        for skipped in skipped_algorithms:
+            st.markdown(f"~~{skipped['algorithm']}~~: skipped ({skipped['reason']})")
+        stats = result_cache.stats()
+        st.caption(f"{'♻️ Cached results' if cached is not None else '🧮 Freshly computed'} — "
+                   f"result cache hit rate {stats['hit_rate']:.0%} "
+                   f"({stats['hits']} of {stats['hits'] + stats['misses']} lookups)")
 
     st.markdown("---")
     st.markdown("Want to try again or check the leaderboard?")
@@ -449,23 +456,12 @@ elif st.session_state.page == "algorithm_performance":
     st.title("📊 Algorithm Performance")
 
     st.markdown("""
-    This page shows the performance of the three TSP algorithms (Brute Force, Held-Karp, Nearest Neighbor) 
+    This page shows the performance of the TSP algorithms (Brute Force, Held-Karp, Branch and Bound, Nearest Neighbor, Multi-Start NN, NN + Local Search, MST 2-Approximation) 
     over the last 10 game rounds. The chart below compares their execution times.
     """)
 
     try:
-        # Query the last 30 algorithm entries (3 algorithms × 10 rounds)
-        query = """
-            SELECT ap.algorithm_name, ap.execution_time, gr.timestamp
-            FROM tsp_algorithm_performance ap
-            JOIN tsp_game_results gr ON ap.game_id = gr.game_id
-            ORDER BY gr.timestamp DESC
-            LIMIT 30
-        """
-        cursor = db.connection.cursor(dictionary=True)
-        cursor.execute(query)
-        data = cursor.fetchall()
-        cursor.close()
+        data = db.get_recent_algorithm_performance(rounds=10)
 
         if data:
             # Create DataFrame from raw data
@@ -474,18 +470,14 @@ elif st.session_state.page == "algorithm_performance":
             df = df.sort_values(by='timestamp', ascending=False)
 
             # Add Game Round index (latest = highest)
-            df['Round Index'] = df.groupby('timestamp').ngroup()
+            df['Round Index'] = df.groupby('game_id').ngroup()
             df['Game Round'] = df['Round Index'].max() - df['Round Index']
 
             # Pivot the DataFrame
             pivot_df = df.pivot(index='Game Round', columns='algorithm_name', values='execution_time')
 
             # Rename columns for display
-            pivot_df = pivot_df.rename(columns={
-                'Brute Force': 'Brute Force (seconds)',
-                'Held-Karp': 'Held-Karp (seconds)',
-                'Nearest Neighbor': 'Nearest Neighbor (seconds)'
-            }).reset_index()
+            pivot_df = pivot_df.rename(columns=lambda name: f"{name} (seconds)").reset_index()
 
             # Display bar chart
             fig = px.bar(
@@ -508,6 +500,116 @@ elif st.session_state.page == "algorithm_performance":
         st.error(f"Failed to fetch performance data: {e}")
 
 
+# --- Page: Large Instance Benchmark ---
+elif st.session_state.page == "benchmark":
+    st.title("🏋️ Large Instance Benchmark")
+
+    st.markdown("""
+    Stress the algorithms on hundreds or thousands of cities. Cities are numbered `0..n-1` and placed
+    at seeded random grid points, so the same size and seed always give the same instance.
+    Only the algorithms whose estimated cost fits the time and memory budgets are run.
+    """)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        num_cities = st.number_input("Number of cities", min_value=BENCHMARK_MIN_CITIES,
+                                     max_value=BENCHMARK_MAX_CITIES, value=500, step=50)
+    with col2:
+        seed = st.number_input("Seed", min_value=0, value=0, step=1)
+
+    to_run, planned_skips = plan_tsp_algorithms(num_cities)
+    st.markdown(f"Runs: `{', '.join(name for name, _ in to_run)}`")
+    st.caption("Skipped: " + "; ".join(f"{skip['algorithm']} ({skip['reason']})" for skip in planned_skips))
+
+    instance = None
+    if st.button("🚀 Run Benchmark"):
+        instance = TSPInstance.random(int(num_cities), seed=int(seed), size=BENCHMARK_GRID)
+        instance_seed = int(seed)
+
+    # A run picked from "Recent Benchmark Runs" below replays the instance stored in the database
+    rerun = st.session_state.pop("benchmark_rerun", None)
+    if rerun is not None:
+        instance = db.load_instance(rerun['instance_hash'])
+        instance_seed = rerun['seed']
+        if instance is None:
+            st.error("That instance could not be loaded from the database.")
+
+    if instance is not None:
+        cache_key = fingerprint(instance, 0, DEFAULT_TIME_BUDGET, DEFAULT_MEMORY_BUDGET,
+                                ALGORITHM_TIMEOUT, algorithm_names())
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            algo_outputs = cached['results']
+            skipped_algorithms = cached['skipped']
+        else:
+            algo_outputs = []
+            skipped_algorithms = []
+            progress = st.empty()
+            planned = len(plan_tsp_algorithms(len(instance))[0])
+            for kind, entry in iter_tsp_algorithms(instance, home_index=0, timeout=ALGORITHM_TIMEOUT):
+                if kind == 'result':
+                    algo_outputs.append(entry)
+                    progress.info(f"⏳ {entry['algorithm']} finished — {len(algo_outputs)} of {planned} done")
+                else:
+                    skipped_algorithms.append(entry)
+            progress.empty()
+            if not any(entry.get('timed_out') for entry in skipped_algorithms):
+                result_cache.put(cache_key, {'results': algo_outputs, 'skipped': skipped_algorithms})
+
+            # Only fresh timings are recorded; the instance itself is stored once under its hash
+            instance_hash = db.save_instance(instance, seed=instance_seed)
+            db.save_benchmark_results(instance_hash, algo_outputs)
+
+        st.session_state.benchmark = {
+            'instance': instance,
+            'results': algo_outputs,
+            'skipped': skipped_algorithms,
+            'cached': cached is not None,
+        }
+
+    benchmark = st.session_state.get("benchmark")
+    if benchmark:
+        instance = benchmark['instance']
+        best_cost = min(res['cost'] for res in benchmark['results'])
+        df = pd.DataFrame([{
+            'Algorithm': res['algorithm'],
+            'Tour Length': res['cost'],
+            'Gap to Best (%)': 100 * (res['cost'] - best_cost) / best_cost if best_cost else 0.0,
+            'Time (s)': res['time'],
+            'CPU Time (s)': res['cpu_time'],
+        } for res in benchmark['results']])
+
+        st.subheader(f"Results for {len(instance)} cities")
+        st.dataframe(df.style.format({
+            'Tour Length': '{:,.0f}', 'Gap to Best (%)': '{:.2f}', 'Time (s)': '{:.3f}', 'CPU Time (s)': '{:.3f}'
+        }), hide_index=True)
+        for skipped in benchmark['skipped']:
+            st.markdown(f"~~{skipped['algorithm']}~~: skipped ({skipped['reason']})")
+        st.caption(f"{'♻️ Cached results' if benchmark['cached'] else '🧮 Freshly computed'} — "
+                   f"instance `{instance.digest()[:12]}`")
+
+        st.image(cached_city_map(
+            tuple(map(tuple, instance.coordinates.tolist())), tuple(instance.labels), instance.metric, 0
+        ))
+
+    st.subheader("Recent Benchmark Runs")
+    runs = db.get_recent_benchmark_runs(limit=50)
+    if runs:
+        st.dataframe(pd.DataFrame(runs), hide_index=True)
+
+        stored = {}
+        for run in runs:
+            stored.setdefault(run['instance_hash'], run)
+        col_pick, col_rerun = st.columns([3, 1])
+        instance_hash = col_pick.selectbox(
+            "Stored instance", list(stored),
+            format_func=lambda h: f"{stored[h]['num_cities']} cities, seed {stored[h]['seed']} ({h[:12]})"
+        )
+        col_rerun.button("🔁 Re-run", on_click=rerun_stored_instance,
+                         args=(instance_hash, stored[instance_hash]['seed']))
+    else:
+        st.warning("No benchmark runs recorded yet.")
+
 # --- Page: Leaderboard ---
 elif st.session_state.page == "leaderboard":
     st.title("🏆 Leaderboard")
@@ -531,10 +633,7 @@ elif st.session_state.page == "leaderboard":
             ORDER BY optimal_count DESC, best_distance ASC
             LIMIT 10
         """
-        cursor = db.connection.cursor(dictionary=True)
-        cursor.execute(query)
-        data = cursor.fetchall()
-        cursor.close()
+        data = db.query(query)
 
         if data:
             df = pd.DataFrame(data)
@@ -0,0 +1,128 @@
+"""
+Benchmark runner for the TSP algorithms on the bundled TSPLIB corpus (data/tsplib).
+
+Runs every algorithm the dispatcher selects for each instance and reports the tour cost,
+the optimality gap against the published optimum, and wall-clock and CPU time.
+Nothing is written to the database.
+
+    python benchmark.py
+    python benchmark.py --instances burma14 berlin52 --time-budget 30 --output tsp_bench.json
+"""
+import argparse
+import json
+import os
+import sys
+
+from tsp_algorithms import DEFAULT_TIME_BUDGET, DEFAULT_MEMORY_BUDGET, dispatch_tsp_algorithms, _tour_cost
+from tsplib import load_problem, load_tour
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "tsplib")
+
+# Published optimal tour lengths for the bundled instances
+KNOWN_OPTIMA = {
+    "burma14": 3323,
+    "ulysses16": 6859,
+    "gr17": 2085,
+    "ulysses22": 7013,
+    "att48": 10628,
+    "eil51": 426,
+    "berlin52": 7542,
+}
+
+def corpus_instances(corpus_dir=CORPUS_DIR):
+    """
+    Names of the .tsp files in the corpus, smallest first.
+    """
+    names = [name[:-len(".tsp")] for name in os.listdir(corpus_dir) if name.endswith(".tsp")]
+    return sorted(names, key=lambda name: (int("".join(c for c in name if c.isdigit()) or 0), name))
+
+def optimal_cost(name, distances, corpus_dir=CORPUS_DIR):
+    """
+    Published optimum for the instance, else the cost of its .opt.tour file, else None.
+    """
+    if name in KNOWN_OPTIMA:
+        return KNOWN_OPTIMA[name]
+    tour_path = os.path.join(corpus_dir, f"{name}.opt.tour")
+    if os.path.exists(tour_path):
+        tour = load_tour(tour_path)
+        return _tour_cost(distances, tour + [tour[0]])
+    return None
+
+def optimality_gap(cost, optimum):
+    """
+    Percentage by which cost exceeds the optimum.
+    """
+    if not optimum:
+        return None
+    return 100.0 * (cost - optimum) / optimum
+
+def benchmark_instance(name, time_budget=DEFAULT_TIME_BUDGET, memory_budget=DEFAULT_MEMORY_BUDGET,
+                       parallel=False, timeout=None, corpus_dir=CORPUS_DIR):
+    problem = load_problem(os.path.join(corpus_dir, f"{name}.tsp"))
+    optimum = optimal_cost(name, problem["distances"], corpus_dir)
+    report = dispatch_tsp_algorithms(problem["distances"], 0, time_budget, memory_budget,
+                                     parallel=parallel, timeout=timeout)
+    return {
+        "instance": name,
+        "dimension": problem["dimension"],
+        "optimum": optimum,
+        "results": [
+            {
+                "algorithm": result["algorithm"],
+                "cost": result["cost"],
+                "gap": optimality_gap(result["cost"], optimum),
+                "time": result["time"],
+                "cpu_time": result["cpu_time"],
+            }
+            for result in report["results"]
+        ],
+        "skipped": report["skipped"],
+    }
+
+def run_benchmarks(names=None, time_budget=DEFAULT_TIME_BUDGET, memory_budget=DEFAULT_MEMORY_BUDGET,
+                   parallel=False, timeout=None, progress=None, corpus_dir=CORPUS_DIR):
+    """
+    Benchmarks every named instance (default: the whole corpus) and returns the list of reports.
+    """
+    available = corpus_instances(corpus_dir)
+    names = names or available
+    for name in names:
+        if name not in available:
+            raise ValueError(f"Unknown instance {name!r}. Choose from: {', '.join(available)}.")
+
+    reports = []
+    for name in names:
+        report = benchmark_instance(name, time_budget, memory_budget, parallel, timeout, corpus_dir)
+        if progress:
+            progress(report)
+        reports.append(report)
+    return reports
+
+def _print_report(report):
+    print(f"{report['instance']} (n={report['dimension']}, optimum={report['optimum']})")
+    for result in report["results"]:
+        gap = "-" if result["gap"] is None else f"{result['gap']:.2f}%"
+        print(f"  {result['algorithm']:<20}{result['cost']:>12.1f}{gap:>9}"
+              f"{result['time']:>11.4f}s{result['cpu_time']:>10.4f}s cpu")
+    for skipped in report["skipped"]:
+        print(f"  {skipped['algorithm']:<20}skipped: {skipped['reason']}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the TSP algorithms on the TSPLIB corpus.")
+    parser.add_argument("--instances", nargs="+", help="instance names (default: the whole corpus)")
+    parser.add_argument("--time-budget", type=float, default=DEFAULT_TIME_BUDGET)
+    parser.add_argument("--memory-budget", type=int, default=DEFAULT_MEMORY_BUDGET)
+    parser.add_argument("--parallel", action="store_true", help="run the algorithms in separate processes")
+    parser.add_argument("--timeout", type=float, help="per-algorithm timeout in seconds (with --parallel)")
+    parser.add_argument("--output", help="write the reports to this JSON file")
+    args = parser.parse_args(argv)
+
+    reports = run_benchmarks(args.instances, args.time_budget, args.memory_budget,
+                             args.parallel, args.timeout, _print_report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": sys.version.split()[0], "reports": reports}, f, indent=2)
+        print(f"Saved {len(reports)} reports to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import io
+import matplotlib.pyplot as plt
+import networkx as nx
+
+from instance import TSPInstance
+
+# Above this many cities the complete graph is unreadable, so only the cities are drawn
+MAX_LABELLED_CITIES = 12
+
+def render_city_map(instance, home=None):
+    """
+    Draws the cities at their own coordinates (no layout computation) and returns PNG bytes.
+    Small maps show every road with its distance; the home city is drawn in red.
+    """
+    labels = instance.labels
+    pos = {label: tuple(point) for label, point in zip(labels, instance.coordinates.tolist())}
+    node_colors = ["red" if label == home else "skyblue" for label in labels]
+    small = len(labels) <= MAX_LABELLED_CITIES
+
+    G = nx.Graph()
+    G.add_nodes_from(labels)
+    if small:
+        dist = instance.matrix()
+        for i in range(len(labels)):
+            for j in range(i + 1, len(labels)):
+                G.add_edge(labels[i], labels[j], weight=int(dist[i, j]))
+
+    fig, ax = plt.subplots(figsize=(6, 6))
+    try:
+        nx.draw(G, pos, with_labels=small, node_color=node_colors, node_size=2000 if small else 20,
+                font_size=12, edge_color="lightgray", ax=ax)
+        if small:
+            labels_by_edge = nx.get_edge_attributes(G, 'weight')
+            nx.draw_networkx_edge_labels(G, pos, edge_labels=labels_by_edge, font_size=8, ax=ax)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", bbox_inches="tight")
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+def render_city_map_from_data(coordinates, labels, metric, home=None):
+    """
+    Same as render_city_map but takes plain, hashable data so the result can be memoised
+    (e.g. with st.cache_data) per distance set.
+    """
+    return render_city_map(TSPInstance(coordinates, list(labels), metric), home)
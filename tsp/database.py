@@ -1,68 +1,197 @@
 import json
 import os
-import mysql.connector
-from mysql.connector import Error
+import threading
+import time
+from contextlib import contextmanager
+from mysql.connector import Error, PoolError, pooling
 from dotenv import load_dotenv
 
+from instance import TSPInstance
+
 # Load environment variables
 load_dotenv()
 
+# Wide enough for integer city ids of large instances, not just the single-letter game cities
+HOME_CITY_LENGTH = 16
+
+# Upper bound on open connections, and how long a request waits for a free one
+DEFAULT_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DEFAULT_CHECKOUT_TIMEOUT = 10.0
+
 class Database:
-    def __init__(self):
-        self.connection = None
-        self.connect()
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, checkout_timeout=DEFAULT_CHECKOUT_TIMEOUT):
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.pool = None
+        self._pool_lock = threading.Lock()
 
     def connect(self):
-        """Establish a connection to the MySQL database."""
+        """Create the connection pool. Connections are opened by the pool and checked out per request."""
         try:
-            self.connection = mysql.connector.connect(
+            self.pool = pooling.MySQLConnectionPool(
+                pool_name="tsp_pool",
+                pool_size=self.pool_size,
+                pool_reset_session=True,
                 host=os.getenv("DB_HOST"),
                 user=os.getenv("DB_USER"),
                 password=os.getenv("DB_PASSWORD"),
                 database=os.getenv("DB_NAME")
             )
-            print(" Database connection established")
+            print(" Database connection pool established")
         except Error as e:
             print(f" Database connection failed: {e}")
             raise
 
     def disconnect(self):
-        """Close the database connection."""
-        if self.connection.is_connected():
-            self.connection.close()
-            print(" Database connection closed")
+        """
+        Drop the pool; the next checkout creates a new one. The old pool and its idle connections
+        are closed when it is garbage-collected. Connections checked out at the time are not
+        interrupted: they finish their request and go back to the old pool first.
+        """
+        with self._pool_lock:
+            self.pool = None
+        print(" Database connection pool closed")
+
+    @contextmanager
+    def checkout(self):
+        """
+        Borrow a pooled connection for one unit of work and return it to the pool afterwards.
+        The pool is created on first use. Waits up to checkout_timeout seconds when every
+        connection is busy, and pings (reconnecting if needed) before handing a connection out,
+        so connections MySQL dropped while idle are revived instead of failing the request.
+        Uncommitted work is rolled back if the block raises.
+        """
+        if self.pool is None:
+            with self._pool_lock:
+                if self.pool is None:
+                    self.connect()
+
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            try:
+                connection = self.pool.get_connection()
+                break
+            except PoolError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.05)
+
+        try:
+            connection.ping(reconnect=True, attempts=3, delay=1)
+            yield connection
+        except Exception:
+            if connection.is_connected():
+                connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    def index_exists(self, cursor, table, index):
+        """Check information_schema for an index on a table in the current database."""
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+        """, (table, index))
+        return cursor.fetchone()[0] > 0
+
+    def column_length(self, cursor, table, column):
+        """Declared character length of a column in the current database, or None if it does not exist."""
+        cursor.execute("""
+            SELECT CHARACTER_MAXIMUM_LENGTH FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        """, (table, column))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def column_exists(self, cursor, table, column):
+        """Check information_schema for a column on a table in the current database."""
+        cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        """, (table, column))
+        return cursor.fetchone()[0] > 0
 
     def initialize_db(self):
         """Create tables if they don't exist (idempotent)."""
         try:
-            cursor = self.connection.cursor()
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tsp_game_results (
-                    game_id INT AUTO_INCREMENT PRIMARY KEY,
-                    player_name VARCHAR(50) NOT NULL,
-                    home_city CHAR(1) NOT NULL,
-                    selected_cities JSON NOT NULL,
-                    user_path TEXT NOT NULL,
-                    user_distance INT NOT NULL,
-                    is_optimal BOOLEAN NOT NULL,
-                    best_path TEXT NOT NULL,
-                    best_distance INT NOT NULL,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tsp_algorithm_performance (
-                    performance_id INT AUTO_INCREMENT PRIMARY KEY,
-                    game_id INT NOT NULL,
-                    algorithm_name VARCHAR(20) NOT NULL,
-                    execution_time FLOAT NOT NULL,
-                    FOREIGN KEY (game_id) REFERENCES tsp_game_results(game_id)
-                )
-            """)
+            with self.checkout() as connection:
+                cursor = connection.cursor()
+
+                cursor.execute(f"""
+                    CREATE TABLE IF NOT EXISTS tsp_game_results (
+                        game_id INT AUTO_INCREMENT PRIMARY KEY,
+                        player_name VARCHAR(50) NOT NULL,
+                        home_city VARCHAR({HOME_CITY_LENGTH}) NOT NULL,
+                        selected_cities JSON NOT NULL,
+                        user_path TEXT NOT NULL,
+                        user_distance INT NOT NULL,
+                        is_optimal BOOLEAN NOT NULL,
+                        best_path TEXT NOT NULL,
+                        best_distance INT NOT NULL,
+                        instance_hash CHAR(40) NULL,
+                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS tsp_algorithm_performance (
+                        performance_id INT AUTO_INCREMENT PRIMARY KEY,
+                        game_id INT NOT NULL,
+                        algorithm_name VARCHAR(20) NOT NULL,
+                        execution_time FLOAT NOT NULL,
+                        FOREIGN KEY (game_id) REFERENCES tsp_game_results(game_id)
+                    )
+                """)
+
+                # Instances are stored once, keyed by TSPInstance.digest(); games and benchmark
+                # runs refer to them by hash instead of repeating the cities inline
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS tsp_instances (
+                        instance_hash CHAR(40) PRIMARY KEY,
+                        num_cities INT NOT NULL,
+                        metric VARCHAR(16) NOT NULL,
+                        seed BIGINT NULL,
+                        coordinates LONGBLOB NOT NULL,
+                        labels JSON NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS tsp_benchmark_runs (
+                        run_id INT AUTO_INCREMENT PRIMARY KEY,
+                        instance_hash CHAR(40) NOT NULL,
+                        algorithm_name VARCHAR(20) NOT NULL,
+                        cost DOUBLE NOT NULL,
+                        execution_time FLOAT NOT NULL,
+                        cpu_time FLOAT NOT NULL,
+                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        INDEX idx_benchmark_runs_instance (instance_hash, algorithm_name),
+                        FOREIGN KEY (instance_hash) REFERENCES tsp_instances(instance_hash)
+                    )
+                """)
+
+                # Tables created before large instances existed: single-letter home city, no instance reference
+                home_city_length = self.column_length(cursor, "tsp_game_results", "home_city")
+                if home_city_length is not None and home_city_length < HOME_CITY_LENGTH:
+                    cursor.execute(f"ALTER TABLE tsp_game_results MODIFY home_city VARCHAR({HOME_CITY_LENGTH}) NOT NULL")
+                if not self.column_exists(cursor, "tsp_game_results", "instance_hash"):
+                    cursor.execute("ALTER TABLE tsp_game_results ADD COLUMN instance_hash CHAR(40) NULL AFTER best_distance")
 
-            self.connection.commit()
+                # Newest rounds first for the performance page, and a covering index so the
+                # per-round lookups never touch the table rows
+                if not self.index_exists(cursor, "tsp_game_results", "idx_game_results_timestamp"):
+                    cursor.execute("""
+                        CREATE INDEX idx_game_results_timestamp
+                        ON tsp_game_results (timestamp, game_id)
+                    """)
+                if not self.index_exists(cursor, "tsp_algorithm_performance", "idx_performance_game_algorithm"):
+                    cursor.execute("""
+                        CREATE INDEX idx_performance_game_algorithm
+                        ON tsp_algorithm_performance (game_id, algorithm_name, execution_time)
+                    """)
+
+                connection.commit()
             print(" Database tables initialized")
         except Error as e:
             print(f" Failed to initialize database: {e}")
@@ -70,7 +199,7 @@ class Database:
 
     def save_game_result(
         self, player_name, home_city, selected_cities, user_path,
-        user_distance, is_correct, is_optimal, best_path, best_distance
+        user_distance, is_correct, is_optimal, best_path, best_distance, instance_hash=None
     ):
         # Add validation for player_name
         if not player_name or not isinstance(player_name, str):
@@ -78,67 +207,160 @@ class Database:
             return None
             
         try:
-            cursor = self.connection.cursor()
-            selected_cities_json = json.dumps(list(selected_cities) if selected_cities else [])
-            query = """
-                INSERT INTO tsp_game_results (
-                    player_name, home_city, selected_cities,
-                    user_path, user_distance, is_optimal,
-                    best_path, best_distance
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            cursor.execute(query, (
-                player_name.strip(),  # Clean the name
-                home_city, 
-                selected_cities_json,
-                user_path, 
-                user_distance, 
-                is_optimal,
-                best_path, 
-                best_distance
-            ))
-            game_id = cursor.lastrowid
-            self.connection.commit()
-            return game_id
+            with self.checkout() as connection:
+                cursor = connection.cursor()
+                selected_cities_json = json.dumps(list(selected_cities) if selected_cities else [])
+                query = """
+                    INSERT INTO tsp_game_results (
+                        player_name, home_city, selected_cities,
+                        user_path, user_distance, is_optimal,
+                        best_path, best_distance, instance_hash
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """
+                cursor.execute(query, (
+                    player_name.strip(),  # Clean the name
+                    home_city, 
+                    selected_cities_json,
+                    user_path, 
+                    user_distance, 
+                    is_optimal,
+                    best_path, 
+                    best_distance,
+                    instance_hash
+                ))
+                game_id = cursor.lastrowid
+                connection.commit()
+                return game_id
         except Error as e:
             print(f"Failed to save game result: {e}")
-            self.connection.rollback()
             return None
 
     def save_algorithm_performance(self, game_id, algorithm_data):
-        """Save algorithm performance metrics."""
+        """Save algorithm performance metrics in a single multi-row INSERT."""
         if game_id is None:
             print(" Invalid algorithm save: Invalid game_id")
             return
 
+        rows = [(game_id, algo_name, exec_time) for algo_name, exec_time in algorithm_data]
+        if not rows:
+            return
+
         try:
-            cursor = self.connection.cursor()
-            query = """
-                INSERT INTO tsp_algorithm_performance (
-                    game_id, algorithm_name, execution_time
-                ) VALUES (%s, %s, %s)
-            """
-            for algo_name, exec_time in algorithm_data:
-                cursor.execute(query, (game_id, algo_name, exec_time))
-            self.connection.commit()
+            with self.checkout() as connection:
+                cursor = connection.cursor()
+                query = """
+                    INSERT INTO tsp_algorithm_performance (
+                        game_id, algorithm_name, execution_time
+                    ) VALUES (%s, %s, %s)
+                """
+                # mysql.connector rewrites executemany on an INSERT into one multi-row statement
+                cursor.executemany(query, rows)
+                connection.commit()
         except Error as e:
             print(f" Failed to save algorithm performance: {e}")
-            self.connection.rollback()
+
+    def save_instance(self, instance, seed=None):
+        """
+        Store a TSPInstance once, keyed by its digest, and return the hash (None on failure).
+        Coordinates are stored as packed float64 pairs; default integer labels are not stored.
+        """
+        instance_hash = instance.digest()
+        labels = None if instance.labels == list(range(len(instance))) else json.dumps(instance.labels)
+        try:
+            with self.checkout() as connection:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    INSERT IGNORE INTO tsp_instances (
+                        instance_hash, num_cities, metric, seed, coordinates, labels
+                    ) VALUES (%s, %s, %s, %s, %s, %s)
+                """, (instance_hash, len(instance), instance.metric, seed, instance.coordinates_bytes(), labels))
+                connection.commit()
+                return instance_hash
+        except Error as e:
+            print(f" Failed to save instance: {e}")
+            return None
+
+    def load_instance(self, instance_hash):
+        """Rebuild a stored TSPInstance from its hash, or None if it is unknown."""
+        rows = self.query("""
+            SELECT metric, coordinates, labels FROM tsp_instances WHERE instance_hash = %s
+        """, (instance_hash,))
+        if not rows:
+            return None
+        row = rows[0]
+        labels = json.loads(row['labels']) if row['labels'] else None
+        return TSPInstance.from_coordinates_bytes(bytes(row['coordinates']), labels, row['metric'])
+
+    def save_benchmark_results(self, instance_hash, results):
+        """Save one benchmark run (result entries from iter_tsp_algorithms) in a single multi-row INSERT."""
+        rows = [
+            (instance_hash, res['algorithm'], res['cost'], res['time'], res['cpu_time'])
+            for res in results
+        ]
+        if instance_hash is None or not rows:
+            return
+
+        try:
+            with self.checkout() as connection:
+                cursor = connection.cursor()
+                cursor.executemany("""
+                    INSERT INTO tsp_benchmark_runs (
+                        instance_hash, algorithm_name, cost, execution_time, cpu_time
+                    ) VALUES (%s, %s, %s, %s, %s)
+                """, rows)
+                connection.commit()
+        except Error as e:
+            print(f" Failed to save benchmark results: {e}")
+
+    def get_recent_benchmark_runs(self, limit=50):
+        """Latest benchmark results with the size and seed of the instance they ran on, newest first."""
+        return self.query("""
+            SELECT br.instance_hash, i.num_cities, i.seed, br.algorithm_name,
+                   br.cost, br.execution_time, br.cpu_time, br.timestamp
+            FROM tsp_benchmark_runs br
+            JOIN tsp_instances i ON i.instance_hash = br.instance_hash
+            ORDER BY br.timestamp DESC, br.run_id DESC
+            LIMIT %s
+        """, (limit,))
+
+    def get_recent_algorithm_performance(self, rounds=10):
+        """
+        Algorithm timings for the last `rounds` games that recorded any, newest first.
+        Games replayed from the result cache save no timings and are left out.
+        The derived table reads the newest game ids straight off the timestamp index, and the
+        EXISTS probe and the join are answered from the covering index, so the cost does not
+        grow with history.
+        """
+        return self.query("""
+            SELECT gr.game_id, ap.algorithm_name, ap.execution_time, gr.timestamp
+            FROM (
+                SELECT game_id, timestamp
+                FROM tsp_game_results g
+                WHERE EXISTS (
+                    SELECT 1 FROM tsp_algorithm_performance p WHERE p.game_id = g.game_id
+                )
+                ORDER BY timestamp DESC, game_id DESC
+                LIMIT %s
+            ) gr
+            JOIN tsp_algorithm_performance ap ON ap.game_id = gr.game_id
+            ORDER BY gr.timestamp DESC, gr.game_id DESC
+        """, (rounds,))
 
     def query(self, query, params=None):
         """Execute a generic SELECT query and return results."""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            results = cursor.fetchall()
-            cursor.close()
-            return results
+            with self.checkout() as connection:
+                cursor = connection.cursor(dictionary=True)
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                results = cursor.fetchall()
+                cursor.close()
+                return results
         except Error as e:
             print(f" Failed to execute query: {e}")
             return []
 
 
-db = Database()
\ No newline at end of file
+db = Database()
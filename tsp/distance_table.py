@@ -0,0 +1,24 @@
+import pandas as pd
+
+def build_distance_table(instance):
+    """
+    Returns (matrix, frame) for a TSPInstance: the NumPy distance matrix and a DataFrame
+    labelled by city that wraps the same array without copying it. The matrix is the one the
+    instance caches, so the algorithms, the path scoring and the displayed table all read a
+    single representation.
+    """
+    matrix = instance.matrix()
+    frame = pd.DataFrame(matrix, index=instance.labels, columns=instance.labels, copy=False)
+    return matrix, frame
+
+def path_length(frame, path):
+    """
+    Length of a path given as city labels, looked up in one vectorized step.
+    """
+    if len(path) < 2:
+        return 0
+    rows = frame.index.get_indexer(path[:-1])
+    cols = frame.columns.get_indexer(path[1:])
+    if (rows < 0).any() or (cols < 0).any():
+        raise ValueError(f"Path contains unknown cities: {path!r}.")
+    return frame.to_numpy()[rows, cols].sum().item()
@@ -0,0 +1,172 @@
+import hashlib
+import random
+import numpy as np
+
+# Rows are computed in blocks of this many when building the full matrix; small blocks keep the
+# temporaries in the CPU caches (32 rows builds a 5000-city matrix ~3x faster than 1024)
+_BLOCK_ROWS = 32
+
+# Metrics take the coordinates of both endpoints, (x1, y1, x2, y2), as broadcastable arrays.
+# Apart from 'euclidean' they follow the TSPLIB definitions, which round to integers.
+
+def _euclidean(x1, y1, x2, y2):
+    # sqrt of the squared differences, as TSPLIB defines it; several times faster than np.hypot
+    dx = x1 - x2
+    dy = y1 - y2
+    return np.sqrt(dx * dx + dy * dy)
+
+def _euc_2d(x1, y1, x2, y2):
+    # EUC_2D: Euclidean distance rounded to the nearest integer
+    return np.floor(_euclidean(x1, y1, x2, y2) + 0.5)
+
+def _ceil_2d(x1, y1, x2, y2):
+    return np.ceil(_euclidean(x1, y1, x2, y2))
+
+def _att(x1, y1, x2, y2):
+    # ATT pseudo-Euclidean distance: sqrt(d^2 / 10) rounded up to an integer
+    r = np.sqrt(((x1 - x2) ** 2 + (y1 - y2) ** 2) / 10.0)
+    t = np.floor(r + 0.5)
+    return np.where(t < r, t + 1, t)
+
+def _geo_radians(value):
+    # Coordinates are DDD.MM (degrees and minutes); TSPLIB uses PI = 3.141592
+    degrees = np.trunc(value)
+    return 3.141592 * (degrees + 5.0 * (value - degrees) / 3.0) / 180.0
+
+def _geo(x1, y1, x2, y2):
+    # GEO: great-circle distance in km on an idealised sphere, truncated; x is latitude, y longitude
+    lat1, lon1, lat2, lon2 = (_geo_radians(value) for value in (x1, y1, x2, y2))
+    q1 = np.cos(lon1 - lon2)
+    q2 = np.cos(lat1 - lat2)
+    q3 = np.cos(lat1 + lat2)
+    arc = np.arccos(np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0))
+    return np.where((x1 == x2) & (y1 == y2), 0.0, np.trunc(6378.388 * arc + 1.0))
+
+METRICS = {
+    'euclidean': _euclidean,
+    'euc_2d': _euc_2d,
+    'ceil_2d': _ceil_2d,
+    'att': _att,
+    'geo': _geo,
+}
+
+class TSPInstance:
+    """
+    TSP instance backed by 2D city coordinates.
+
+    Distances are computed on demand from the coordinates: instance[i] is row i, instance[rows]
+    a block of rows and instance[a, b] the (broadcast) distances between index arrays, mirroring
+    NumPy indexing. matrix() builds the full matrix in one vectorized pass and caches it;
+    np.asarray(instance) returns the same matrix, so the algorithms accept an instance anywhere
+    they accept a nested list.
+    """
+
+    def __init__(self, coordinates, labels=None, metric='euclidean', dtype=np.float64):
+        coordinates = np.asarray(coordinates, dtype=float)
+        if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+            raise ValueError(f"Coordinates must have shape (n, 2). Got {coordinates.shape}.")
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}. Choose from: {', '.join(METRICS)}.")
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError(f"dtype must be float32 or float64. Got {dtype}.")
+
+        self.coordinates = coordinates
+        self.labels = list(labels) if labels is not None else list(range(len(coordinates)))
+        if len(self.labels) != len(coordinates):
+            raise ValueError(f"Got {len(self.labels)} labels for {len(coordinates)} cities.")
+        self.metric = metric
+        self.dtype = dtype
+        self._matrix = None
+
+    @classmethod
+    def random(cls, labels, seed=None, size=100, metric='euc_2d', dtype=np.float64):
+        """
+        Cities at distinct random integer coordinates in a size x size square.
+        labels is either a list of city labels or a number of cities.
+        """
+        labels = list(range(labels)) if isinstance(labels, int) else list(labels)
+        if len(labels) > (size + 1) ** 2:
+            raise ValueError(f"Cannot place {len(labels)} distinct cities on a {size} x {size} grid.")
+        cells = random.Random(seed).sample(range((size + 1) ** 2), len(labels))
+        coordinates = [divmod(cell, size + 1) for cell in cells]
+        return cls(coordinates, labels, metric, dtype)
+
+    def __len__(self):
+        return len(self.coordinates)
+
+    def __getitem__(self, key):
+        if self._matrix is not None:
+            return self._matrix[key]
+        if isinstance(key, tuple):
+            rows, cols = key
+            return self._distances(rows, cols)
+        rows = np.arange(len(self))[key] if isinstance(key, slice) else np.asarray(key)
+        if rows.ndim == 0:
+            return self._distances(rows, slice(None))
+        return self._distances(rows[..., None], np.arange(len(self)))
+
+    def __array__(self, dtype=None, copy=None):
+        matrix = self.matrix()
+        return matrix if dtype is None else matrix.astype(dtype, copy=False)
+
+    def _distances(self, rows, cols):
+        x, y = self.coordinates[:, 0], self.coordinates[:, 1]
+        return METRICS[self.metric](x[rows], y[rows], x[cols], y[cols]).astype(self.dtype, copy=False)
+
+    def index(self, label):
+        return self.labels.index(label)
+
+    def distance(self, i, j):
+        return float(self._distances(i, j))
+
+    def matrix(self):
+        """
+        Full distance matrix, computed block by block and cached.
+        """
+        if self._matrix is None:
+            n = len(self)
+            matrix = np.empty((n, n), dtype=self.dtype)
+            columns = np.arange(n)
+            for start in range(0, n, _BLOCK_ROWS):
+                rows = np.arange(start, min(start + _BLOCK_ROWS, n))
+                matrix[rows] = self._distances(rows[:, None], columns)
+            self._matrix = matrix
+        return self._matrix
+
+    def tour_cost(self, path):
+        """
+        Length of a path given as city indices, computed straight from the coordinates.
+        """
+        path = np.asarray(path, dtype=np.intp)
+        return float(self._distances(path[:-1], path[1:]).sum(dtype=np.float64))
+
+    def digest(self):
+        """
+        SHA-1 of the metric and coordinates; identifies the instance independently of labels and dtype.
+        """
+        digest = hashlib.sha1(f"{self.metric}:{len(self)}:".encode())
+        digest.update(self.coordinates_bytes())
+        return digest.hexdigest()
+
+    def coordinates_bytes(self):
+        """
+        Coordinates packed as little-endian float64 pairs (see from_coordinates_bytes).
+        """
+        return np.ascontiguousarray(self.coordinates, dtype='<f8').tobytes()
+
+    @classmethod
+    def from_coordinates_bytes(cls, data, labels=None, metric='euclidean', dtype=np.float64):
+        return cls(np.frombuffer(data, dtype='<f8').reshape(-1, 2), labels, metric, dtype)
+
+    def to_dict(self):
+        return {
+            'labels': self.labels,
+            'coordinates': self.coordinates.tolist(),
+            'metric': self.metric,
+            'dtype': self.dtype.name,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['coordinates'], data['labels'], data['metric'], data['dtype'])
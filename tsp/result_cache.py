@@ -0,0 +1,159 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+from dotenv import load_dotenv
+
+from instance import TSPInstance
+
+load_dotenv()
+
+# Optional on-disk tier: one JSON file per fingerprint, enabled by setting TSP_RESULT_CACHE_DIR
+CACHE_DIR = os.getenv("TSP_RESULT_CACHE_DIR") or None
+DEFAULT_MAX_DISK_ENTRIES = 512
+
+def fingerprint(dist_matrix, home_index, *params):
+    """
+    SHA-1 key for an instance, home city and any extra parameters that affect the results.
+    Coordinate instances are hashed by their coordinates and metric, so the matrix is never built.
+    """
+    digest = hashlib.sha1()
+    if isinstance(dist_matrix, TSPInstance):
+        digest.update(f"instance:{dist_matrix.digest()}:{dist_matrix.dtype.name}".encode())
+    else:
+        matrix = np.ascontiguousarray(dist_matrix, dtype=np.float64)
+        digest.update(f"matrix:{matrix.shape}".encode())
+        digest.update(matrix.tobytes())
+    digest.update(json.dumps([home_index, *params]).encode())
+    return digest.hexdigest()
+
+class ResultCache:
+    """
+    LRU cache of algorithm results in memory, optionally backed by JSON files on disk.
+    Values must be JSON-serialisable when a cache_dir is used. Lookups return copies.
+    The disk tier keeps at most max_disk_entries files, pruning the least recently used.
+    """
+
+    def __init__(self, max_entries=128, cache_dir=None, max_disk_entries=DEFAULT_MAX_DISK_ENTRIES):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1. Got max_entries={max_entries}.")
+        if max_disk_entries < 1:
+            raise ValueError(f"max_disk_entries must be at least 1. Got max_disk_entries={max_disk_entries}.")
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_disk(self, key):
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                value = json.load(f)
+            # Refresh the modification time, which orders files for pruning
+            os.utime(path)
+            return value
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key, value):
+        text = json.dumps(value)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        self._prune_disk()
+
+    def _prune_disk(self):
+        paths = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith(".json")]
+        if len(paths) <= self.max_disk_entries:
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:len(paths) - self.max_disk_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def get(self, key):
+        """
+        Cached value for key, or None. Disk hits are promoted into memory.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+
+            value = self._read_disk(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, value)
+            return copy.deepcopy(value)
+
+    def put(self, key, value):
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value)
+            if self.cache_dir is not None:
+                try:
+                    self._write_disk(key, value)
+                except (OSError, TypeError) as e:
+                    print(f"Could not write result cache entry {key}: {e}")
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+        }
+
+    def clear(self, remove_files=False):
+        """
+        Drop the in-memory entries and statistics, and optionally the on-disk files.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+            if remove_files and self.cache_dir is not None and os.path.isdir(self.cache_dir):
+                for name in os.listdir(self.cache_dir):
+                    if name.endswith(".json"):
+                        os.remove(os.path.join(self.cache_dir, name))
+
+# Shared cache used by the app; survives Streamlit reruns because modules are imported once
+result_cache = ResultCache(cache_dir=CACHE_DIR)
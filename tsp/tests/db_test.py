@@ -1,7 +1,10 @@
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 
+from mysql.connector import Error, PoolError
 from database import Database
+from instance import TSPInstance
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -10,50 +13,254 @@ class TestDatabase(unittest.TestCase):
     def setUp(self):
         self.db = Database()
 
-    @patch('mysql.connector.connect')
-    def test_connect_success(self, mock_connect):
-        mock_connect.return_value = MagicMock()
+    def use_connection(self, mock_connection):
+        self.db.pool = MagicMock()
+        self.db.pool.get_connection.return_value = mock_connection
+
+    @patch('database.pooling.MySQLConnectionPool')
+    def test_connect_success(self, mock_pool):
         self.db.connect()
-        mock_connect.assert_called_once()
+        mock_pool.assert_called_once()
+        self.assertEqual(mock_pool.call_args.kwargs['pool_size'], self.db.pool_size)
+        self.assertIs(self.db.pool, mock_pool.return_value)
 
-    @patch('mysql.connector.connect')
-    def test_connect_failure(self, mock_connect):
-        mock_connect.side_effect = Exception("Database connection error")
+    @patch('database.pooling.MySQLConnectionPool')
+    def test_connect_failure(self, mock_pool):
+        mock_pool.side_effect = Error("Database connection error")
         with self.assertRaises(Exception):
             self.db.connect()
 
-    @patch('mysql.connector.connect')
-    def test_initialize_db(self, mock_connect):
+    @patch('database.pooling.MySQLConnectionPool')
+    def test_disconnect_releases_pool(self, mock_pool):
+        with self.db.checkout():
+            pass
+        self.db.disconnect()
+        self.assertIsNone(self.db.pool)
+
+        self.db.disconnect()  # already disconnected
+        self.assertIsNone(self.db.pool)
+
+        with self.db.checkout():  # reconnects on the next checkout
+            pass
+        self.assertEqual(mock_pool.call_count, 2)
+
+    @patch('database.pooling.MySQLConnectionPool')
+    def test_pool_created_lazily_once(self, mock_pool):
+        self.assertIsNone(self.db.pool)
+        with self.db.checkout():
+            pass
+        with self.db.checkout():
+            pass
+        mock_pool.assert_called_once()
+
+    def test_checkout_pings_and_returns_connection(self):
+        mock_connection = MagicMock()
+        self.use_connection(mock_connection)
+
+        with self.db.checkout() as connection:
+            self.assertIs(connection, mock_connection)
+            mock_connection.ping.assert_called_once_with(reconnect=True, attempts=3, delay=1)
+            mock_connection.close.assert_not_called()
+        mock_connection.close.assert_called_once()
+
+    def test_checkout_rolls_back_on_error(self):
+        mock_connection = MagicMock()
+        self.use_connection(mock_connection)
+
+        with self.assertRaises(Error):
+            with self.db.checkout():
+                raise Error("lost connection")
+        mock_connection.rollback.assert_called_once()
+        mock_connection.close.assert_called_once()
+
+    def test_checkout_waits_for_a_free_connection(self):
+        mock_connection = MagicMock()
+        self.use_connection(mock_connection)
+        self.db.pool.get_connection.side_effect = [PoolError("exhausted"), PoolError("exhausted"), mock_connection]
+
+        with self.db.checkout() as connection:
+            self.assertIs(connection, mock_connection)
+        self.assertEqual(self.db.pool.get_connection.call_count, 3)
+
+    def test_checkout_times_out_when_pool_stays_exhausted(self):
+        self.db = Database(checkout_timeout=0.1)
+        self.db.pool = MagicMock()
+        self.db.pool.get_connection.side_effect = PoolError("exhausted")
+
+        with self.assertRaises(PoolError):
+            with self.db.checkout():
+                pass
+
+    def test_concurrent_requests_use_separate_connections(self):
+        connections = [MagicMock(), MagicMock()]
+        self.db.pool = MagicMock()
+        self.db.pool.get_connection.side_effect = connections
+        inside = threading.Barrier(2)
+        used = []
+
+        def request():
+            with self.db.checkout() as connection:
+                inside.wait(timeout=5)
+                used.append(connection)
+
+        threads = [threading.Thread(target=request) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertCountEqual(used, connections)
+
+    def test_initialize_db(self):
         mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = (1,)
         mock_connection = MagicMock()
         mock_connection.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_connection
+        self.use_connection(mock_connection)
 
         self.db.initialize_db()
         mock_cursor.execute.assert_called()
+        mock_connection.commit.assert_called_once()
 
-    @patch('mysql.connector.connect')
-    def test_save_game_result(self, mock_connect):
+    def test_save_game_result(self):
         mock_cursor = MagicMock()
+        mock_cursor.lastrowid = 42
         mock_connection = MagicMock()
         mock_connection.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_connection
+        self.use_connection(mock_connection)
 
         game_id = self.db.save_game_result(
             'Player1', 'A', ['B', 'C'], 'A-B-C-A', 100, True, True, 'A-B-C-A', 90
         )
-        self.assertIsNotNone(game_id)
+        self.assertEqual(game_id, 42)
         mock_cursor.execute.assert_called()
+        mock_connection.close.assert_called_once()
+
+    def test_save_game_result_failure_rolls_back(self):
+        mock_cursor = MagicMock()
+        mock_cursor.execute.side_effect = Error("MySQL server has gone away")
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        self.use_connection(mock_connection)
+
+        game_id = self.db.save_game_result(
+            'Player1', 'A', ['B', 'C'], 'A-B-C-A', 100, True, True, 'A-B-C-A', 90
+        )
+        self.assertIsNone(game_id)
+        mock_connection.rollback.assert_called_once()
 
-    @patch('mysql.connector.connect')
-    def test_save_algorithm_performance(self, mock_connect):
+    def test_save_algorithm_performance(self):
         mock_cursor = MagicMock()
         mock_connection = MagicMock()
         mock_connection.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_connection
+        self.use_connection(mock_connection)
 
         self.db.save_algorithm_performance(1, [('Brute Force', 0.5), ('Held-Karp', 1.2)])
-        mock_cursor.execute.assert_called()
+        mock_cursor.executemany.assert_called_once()
+        self.assertEqual(mock_cursor.executemany.call_args[0][1], [(1, 'Brute Force', 0.5), (1, 'Held-Karp', 1.2)])
+        mock_cursor.execute.assert_not_called()
+        mock_connection.commit.assert_called_once()
+
+    def test_save_algorithm_performance_skips_empty_batches(self):
+        mock_connection = MagicMock()
+        self.use_connection(mock_connection)
+
+        self.db.save_algorithm_performance(1, [])
+        self.db.pool.get_connection.assert_not_called()
+
+    def test_initialize_db_creates_missing_indexes_once(self):
+        mock_cursor = MagicMock()
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        self.use_connection(mock_connection)
+
+        mock_cursor.fetchone.return_value = (0,)
+        self.db.initialize_db()
+        statements = [call[0][0] for call in mock_cursor.execute.call_args_list]
+        self.assertTrue(any('CREATE INDEX idx_game_results_timestamp' in sql for sql in statements))
+        self.assertTrue(any('CREATE INDEX idx_performance_game_algorithm' in sql for sql in statements))
+
+        mock_cursor.reset_mock()
+        mock_cursor.fetchone.return_value = (1,)
+        self.db.initialize_db()
+        statements = [call[0][0] for call in mock_cursor.execute.call_args_list]
+        self.assertFalse(any('CREATE INDEX' in sql for sql in statements))
+
+    def test_get_recent_algorithm_performance(self):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [{'game_id': 7, 'algorithm_name': 'Held-Karp', 'execution_time': 0.1}]
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        self.use_connection(mock_connection)
+
+        rows = self.db.get_recent_algorithm_performance(rounds=5)
+        self.assertEqual(rows[0]['game_id'], 7)
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn('LIMIT %s', sql)
+        self.assertEqual(params, (5,))
+        # Rounds served from the result cache have no timings and must not take up the window
+        self.assertIn('WHERE EXISTS', sql)
+
+    def test_initialize_db_widens_home_city_and_adds_instance_hash(self):
+        mock_cursor = MagicMock()
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        self.use_connection(mock_connection)
+
+        # Old schema: CHAR(1) home city, no instance_hash column
+        mock_cursor.fetchone.side_effect = lambda: (1,) if 'CHARACTER_MAXIMUM_LENGTH' in mock_cursor.execute.call_args[0][0] else (0,)
+        self.db.initialize_db()
+        statements = [call[0][0] for call in mock_cursor.execute.call_args_list]
+        self.assertTrue(any('CREATE TABLE IF NOT EXISTS tsp_instances' in sql for sql in statements))
+        self.assertTrue(any('MODIFY home_city VARCHAR(16)' in sql for sql in statements))
+        self.assertTrue(any('ADD COLUMN instance_hash' in sql for sql in statements))
+
+        mock_cursor.reset_mock()
+        mock_cursor.fetchone.side_effect = lambda: (16,) if 'CHARACTER_MAXIMUM_LENGTH' in mock_cursor.execute.call_args[0][0] else (1,)
+        self.db.initialize_db()
+        statements = [call[0][0] for call in mock_cursor.execute.call_args_list]
+        self.assertFalse(any('ALTER TABLE' in sql for sql in statements))
+
+    def test_save_and_load_instance(self):
+        mock_cursor = MagicMock()
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        self.use_connection(mock_connection)
+        instance = TSPInstance.random(500, seed=4, size=1000)
+
+        instance_hash = self.db.save_instance(instance, seed=4)
+        self.assertEqual(instance_hash, instance.digest())
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn('INSERT IGNORE INTO tsp_instances', sql)
+        self.assertEqual(params[:4], (instance_hash, 500, 'euc_2d', 4))
+        self.assertIsNone(params[5])
+
+        mock_cursor.fetchall.return_value = [{'metric': 'euc_2d', 'coordinates': bytearray(params[4]), 'labels': None}]
+        loaded = self.db.load_instance(instance_hash)
+        self.assertEqual(loaded.digest(), instance_hash)
+        self.assertEqual(loaded.labels, list(range(500)))
+
+    def test_save_instance_keeps_custom_labels(self):
+        mock_cursor = MagicMock()
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        self.use_connection(mock_connection)
+
+        self.db.save_instance(TSPInstance.random(list('ABC'), seed=1))
+        self.assertEqual(mock_cursor.execute.call_args[0][1][5], '["A", "B", "C"]')
+
+    def test_save_benchmark_results(self):
+        mock_cursor = MagicMock()
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        self.use_connection(mock_connection)
+
+        results = [{'algorithm': 'Nearest Neighbor', 'cost': 120.0, 'time': 0.5, 'cpu_time': 0.4, 'path': [0, 1, 0]}]
+        self.db.save_benchmark_results('a' * 40, results)
+        self.assertEqual(mock_cursor.executemany.call_args[0][1], [('a' * 40, 'Nearest Neighbor', 120.0, 0.5, 0.4)])
+        mock_connection.commit.assert_called_once()
+
+        self.db.save_benchmark_results(None, results)
+        self.assertEqual(self.db.pool.get_connection.call_count, 1)
 
 if __name__ == '__main__':
     unittest.main()
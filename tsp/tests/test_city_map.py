@@ -0,0 +1,28 @@
+import unittest
+
+from instance import TSPInstance
+from city_map import render_city_map, render_city_map_from_data
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+class TestCityMap(unittest.TestCase):
+
+    def test_renders_png(self):
+        instance = TSPInstance.random(list('ABCDE'), seed=1)
+        image = render_city_map(instance, home='A')
+        self.assertTrue(image.startswith(PNG_SIGNATURE))
+
+    def test_large_maps_skip_roads(self):
+        instance = TSPInstance.random(300, seed=1, size=1000)
+        self.assertTrue(render_city_map(instance).startswith(PNG_SIGNATURE))
+        self.assertIsNone(instance._matrix)
+
+    def test_render_from_hashable_data(self):
+        instance = TSPInstance.random(list('ABC'), seed=2)
+        image = render_city_map_from_data(
+            tuple(map(tuple, instance.coordinates.tolist())), tuple(instance.labels), instance.metric, 'B'
+        )
+        self.assertTrue(image.startswith(PNG_SIGNATURE))
+
+if __name__ == '__main__':
+    unittest.main()
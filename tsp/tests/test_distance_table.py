@@ -0,0 +1,28 @@
+import unittest
+import numpy as np
+
+from instance import TSPInstance
+from distance_table import build_distance_table, path_length
+
+class TestDistanceTable(unittest.TestCase):
+
+    def setUp(self):
+        self.instance = TSPInstance([(0, 0), (3, 4), (6, 0)], labels=['A', 'B', 'C'])
+
+    def test_frame_wraps_the_instance_matrix(self):
+        matrix, frame = build_distance_table(self.instance)
+        self.assertIs(matrix, self.instance.matrix())
+        self.assertTrue(np.shares_memory(frame.to_numpy(), matrix))
+        self.assertEqual(list(frame.index), ['A', 'B', 'C'])
+        self.assertEqual(frame.loc['A', 'B'], 5)
+        self.assertEqual(frame.loc['C', 'A'], 6)
+
+    def test_path_length(self):
+        _, frame = build_distance_table(self.instance)
+        self.assertEqual(path_length(frame, ['A', 'B', 'C', 'A']), 16)
+        self.assertEqual(path_length(frame, ['A']), 0)
+        with self.assertRaises(ValueError):
+            path_length(frame, ['A', 'Z', 'A'])
+
+if __name__ == '__main__':
+    unittest.main()
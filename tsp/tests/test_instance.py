@@ -0,0 +1,94 @@
+import unittest
+import numpy as np
+
+from instance import TSPInstance
+from tsp_algorithms import (
+    brute_force_tsp, held_karp_tsp, branch_and_bound_tsp, nearest_neighbor_tsp, local_search_tsp,
+    multi_start_nearest_neighbor_tsp, mst_approximation_tsp, _distance_rows
+)
+
+class TestTSPInstance(unittest.TestCase):
+
+    def setUp(self):
+        self.instance = TSPInstance([(0, 0), (3, 4), (6, 0), (3, -4)], labels=['A', 'B', 'C', 'D'])
+
+    def test_distances(self):
+        self.assertEqual(len(self.instance), 4)
+        self.assertEqual(self.instance.distance(0, 1), 5.0)
+        self.assertEqual(self.instance.index('C'), 2)
+        np.testing.assert_allclose(self.instance[0], [0, 5, 6, 5])
+        np.testing.assert_allclose(self.instance[[0, 2], [1, 3]], [5, 5])
+        np.testing.assert_allclose(self.instance[[1, 3]], self.instance.matrix()[[1, 3]])
+
+    def test_lazy_rows_do_not_build_matrix(self):
+        self.instance[1]
+        self.instance.tour_cost([0, 1, 2, 3, 0])
+        self.assertIsNone(self.instance._matrix)
+
+        matrix = np.asarray(self.instance)
+        self.assertIs(matrix, self.instance.matrix())
+        np.testing.assert_allclose(matrix, matrix.T)
+
+    def test_float32_storage(self):
+        instance = TSPInstance(self.instance.coordinates, dtype=np.float32)
+        self.assertEqual(instance.matrix().dtype, np.float32)
+        self.assertEqual(instance[0].dtype, np.float32)
+
+    def test_euc_2d_rounds_to_nearest_integer(self):
+        instance = TSPInstance([(0, 0), (1, 1), (2, 2)], metric='euc_2d')
+        np.testing.assert_array_equal(instance.matrix(), [[0, 1, 3], [1, 0, 1], [3, 1, 0]])
+
+    def test_random_is_seeded_and_distinct(self):
+        first = TSPInstance.random(list('ABCDEFGHIJ'), seed=7)
+        second = TSPInstance.random(list('ABCDEFGHIJ'), seed=7)
+        np.testing.assert_array_equal(first.coordinates, second.coordinates)
+        self.assertEqual(len({tuple(point) for point in first.coordinates}), 10)
+        self.assertTrue(np.all(first.matrix()[~np.eye(10, dtype=bool)] > 0))
+
+    def test_to_dict_round_trip(self):
+        copy = TSPInstance.from_dict(self.instance.to_dict())
+        self.assertEqual(copy.labels, self.instance.labels)
+        np.testing.assert_array_equal(copy.matrix(), self.instance.matrix())
+
+    def test_digest_identifies_coordinates_and_metric(self):
+        same = TSPInstance(self.instance.coordinates, dtype=np.float32)
+        self.assertEqual(same.digest(), self.instance.digest())
+        self.assertNotEqual(TSPInstance(self.instance.coordinates, metric='euc_2d').digest(), self.instance.digest())
+        self.assertNotEqual(TSPInstance.random(500, seed=1).digest(), TSPInstance.random(500, seed=2).digest())
+
+    def test_coordinates_bytes_round_trip(self):
+        instance = TSPInstance.random(300, seed=3, size=1000)
+        copy = TSPInstance.from_coordinates_bytes(instance.coordinates_bytes(), metric=instance.metric)
+        self.assertEqual(copy.labels, list(range(300)))
+        self.assertEqual(copy.digest(), instance.digest())
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            TSPInstance([1, 2, 3])
+        with self.assertRaises(ValueError):
+            TSPInstance([(0, 0)], metric='manhattan')
+        with self.assertRaises(ValueError):
+            TSPInstance([(0, 0)], labels=['A', 'B'])
+        with self.assertRaises(ValueError):
+            TSPInstance([(0, 0)], dtype=np.int32)
+
+    def test_algorithms_use_dense_rows_within_memory_budget(self):
+        instance = TSPInstance.random(50, seed=1)
+        self.assertIs(_distance_rows(instance), instance.matrix())
+        # 50 x 50 float64 is 20,000 bytes, so a smaller budget keeps rows lazy
+        lazy = TSPInstance.random(50, seed=1)
+        self.assertIs(_distance_rows(lazy, memory_budget=10_000), lazy)
+        self.assertIsNone(lazy._matrix)
+
+    def test_algorithms_accept_instances(self):
+        instance = TSPInstance.random(8, seed=2)
+        matrix = instance.matrix().tolist()
+        for algorithm in (brute_force_tsp, held_karp_tsp, branch_and_bound_tsp, nearest_neighbor_tsp,
+                          local_search_tsp, multi_start_nearest_neighbor_tsp, mst_approximation_tsp):
+            expected = algorithm(matrix, 3)
+            result = algorithm(TSPInstance.random(8, seed=2), 3)
+            self.assertEqual(result['path'], expected['path'])
+            self.assertAlmostEqual(result['cost'], expected['cost'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from instance import TSPInstance
+from result_cache import ResultCache, fingerprint
+
+class TestFingerprint(unittest.TestCase):
+
+    def test_same_instance_same_key(self):
+        matrix = [[0, 1, 2], [1, 0, 3], [2, 3, 0]]
+        self.assertEqual(fingerprint(matrix, 0), fingerprint(np.array(matrix, dtype=float), 0))
+        self.assertNotEqual(fingerprint(matrix, 0), fingerprint(matrix, 1))
+        self.assertNotEqual(fingerprint(matrix, 0), fingerprint(matrix, 0, 5.0))
+        self.assertNotEqual(fingerprint(matrix, 0), fingerprint([[0, 1, 2], [1, 0, 4], [2, 4, 0]], 0))
+
+    def test_instances_are_hashed_by_coordinates(self):
+        first = TSPInstance.random(6, seed=1)
+        key = fingerprint(first, 0)
+        self.assertIsNone(first._matrix)
+        self.assertEqual(key, fingerprint(TSPInstance.random(6, seed=1), 0))
+        self.assertNotEqual(key, fingerprint(TSPInstance(first.coordinates, metric='euclidean'), 0))
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_lru_eviction_and_hit_rate(self):
+        cache = ResultCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)  # evicts 'b', the least recently used
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats()['entries'], 2)
+        self.assertAlmostEqual(cache.hit_rate(), 2 / 3)
+
+    def test_returns_copies(self):
+        cache = ResultCache()
+        cache.put('key', {'path': [0, 1, 0]})
+        cache.get('key')['path'].append(5)
+        self.assertEqual(cache.get('key'), {'path': [0, 1, 0]})
+
+    def test_disk_tier_survives_new_cache(self):
+        value = {'results': [{'algorithm': 'Held-Karp', 'path': [0, 2, 1, 0], 'cost': 6.0}], 'skipped': []}
+        ResultCache(cache_dir=self.tmp_dir).put('key', value)
+
+        cache = ResultCache(cache_dir=self.tmp_dir)
+        self.assertEqual(cache.get('key'), value)
+        self.assertEqual(cache.stats()['disk_hits'], 1)
+        self.assertEqual(cache.get('key'), value)
+        self.assertEqual(cache.stats()['disk_hits'], 1)
+
+        cache.clear(remove_files=True)
+        self.assertIsNone(cache.get('key'))
+
+    def test_disk_tier_is_bounded(self):
+        cache = ResultCache(max_entries=1, cache_dir=self.tmp_dir, max_disk_entries=2)
+        for i, key in enumerate(('a', 'b', 'c')):
+            cache.put(key, i)
+            # Distinct modification times regardless of filesystem timestamp resolution
+            os.utime(os.path.join(self.tmp_dir, f"{key}.json"), (i, i))
+
+        self.assertEqual(sorted(os.listdir(self.tmp_dir)), ['b.json', 'c.json'])
+        self.assertIsNone(ResultCache(cache_dir=self.tmp_dir).get('a'))
+
+    def test_disk_tier_is_off_by_default(self):
+        cache = ResultCache()
+        cache.put('key', 1)
+        self.assertIsNone(cache.cache_dir)
+
+    def test_get_or_compute(self):
+        cache = ResultCache()
+        calls = []
+        compute = lambda: calls.append(1) or 'value'
+        self.assertEqual(cache.get_or_compute('key', compute), 'value')
+        self.assertEqual(cache.get_or_compute('key', compute), 'value')
+        self.assertEqual(len(calls), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,25 @@
 import unittest
 
-from tsp_algorithms import brute_force_tsp, held_karp_tsp, nearest_neighbor_tsp, run_tsp_algorithms
+from tsp_algorithms import (
+    brute_force_tsp, held_karp_tsp, nearest_neighbor_tsp, branch_and_bound_tsp, run_tsp_algorithms,
+    dispatch_tsp_algorithms, plan_tsp_algorithms, local_search_tsp, improve_tour,
+    multi_start_nearest_neighbor_tsp, iter_tsp_algorithms, minimum_spanning_tree, mst_approximation_tsp,
+    estimate_brute_force, estimate_held_karp, estimate_branch_and_bound
+)
+import tsp_algorithms
+from instance import TSPInstance
+from unittest.mock import patch
+import math
+import multiprocessing
+import random
+import numpy as np
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def _crashing_tsp(dist_matrix, home_index):
+    os._exit(3)
+
 class TestTSPAlgorithms(unittest.TestCase):
 
     def setUp(self):
@@ -34,13 +50,226 @@ class TestTSPAlgorithms(unittest.TestCase):
         self.assertTrue(result['path'])
         self.assertGreater(result['cost'], 0)
 
+    def test_branch_and_bound_tsp(self):
+        result = branch_and_bound_tsp(self.dist_matrix, self.home_index)
+        self.assertEqual(result['cost'], brute_force_tsp(self.dist_matrix, self.home_index)['cost'])
+        self.assertEqual(result['path'][0], self.home_index)
+        self.assertEqual(result['path'][-1], self.home_index)
+
+    def test_branch_and_bound_matches_brute_force(self):
+        for seed in range(20):
+            rng = random.Random(seed)
+            n = rng.randint(2, 8)
+            matrix = [[0] * n for _ in range(n)]
+            for i in range(n):
+                for j in range(n):
+                    if i != j:
+                        matrix[i][j] = rng.randint(1, 100)
+            home = rng.randrange(n)
+            result = branch_and_bound_tsp(matrix, home)
+            self.assertEqual(result['cost'], brute_force_tsp(matrix, home)['cost'])
+            self.assertEqual(sorted(result['path'][:-1]), list(range(n)))
+
+    def test_branch_and_bound_solves_twenty_cities(self):
+        rng = random.Random(7)
+        points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(20)]
+        matrix = [[round(((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5) for x2, y2 in points] for x1, y1 in points]
+
+        result = branch_and_bound_tsp(matrix, 0)
+        self.assertEqual(len(result['path']), 21)
+        self.assertLessEqual(result['cost'], nearest_neighbor_tsp(matrix, 0)['cost'])
+
+    def test_held_karp_matches_brute_force(self):
+        for seed in range(20):
+            rng = random.Random(seed)
+            n = rng.randint(1, 8)
+            matrix = [[0 if i == j else rng.randint(1, 100) for j in range(n)] for i in range(n)]
+            home = rng.randrange(n)
+            result = held_karp_tsp(matrix, home)
+            self.assertEqual(result['cost'], brute_force_tsp(matrix, home)['cost'])
+            self.assertEqual(sorted(result['path'][:-1]), list(range(n)))
+
+    def test_held_karp_agrees_with_branch_and_bound(self):
+        rng = random.Random(3)
+        points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(14)]
+        matrix = [[round(((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5) for x2, y2 in points] for x1, y1 in points]
+
+        self.assertEqual(held_karp_tsp(matrix, 5)['cost'], branch_and_bound_tsp(matrix, 5)['cost'])
+
     def test_run_tsp_algorithms(self):
         results = run_tsp_algorithms(self.dist_matrix, self.home_index)
-        self.assertEqual(len(results), 3)  
+        self.assertEqual(len(results), 7)  
         for result in results:
             self.assertIn('algorithm', result)
             self.assertIn('path', result)
             self.assertIn('cost', result)
 
+    def test_dispatcher_skips_infeasible_exact_methods(self):
+        to_run, skipped = plan_tsp_algorithms(40)
+        self.assertEqual([name for name, _ in to_run], ['Nearest Neighbor', 'Multi-Start NN', 'NN + Local Search', 'MST 2-Approximation'])
+        self.assertEqual({entry['algorithm'] for entry in skipped}, {'Brute Force', 'Held-Karp', 'Branch and Bound'})
+        for entry in skipped:
+            self.assertIn('budget', entry['reason'])
+
+    def test_dispatcher_respects_memory_budget(self):
+        to_run, skipped = plan_tsp_algorithms(16, time_budget=None, memory_budget=1024 ** 2)
+        self.assertNotIn('Held-Karp', [name for name, _ in to_run])
+        self.assertIn('memory budget', [entry for entry in skipped if entry['algorithm'] == 'Held-Karp'][0]['reason'])
+
+    def test_plan_skips_overflowing_estimates_on_large_instances(self):
+        for n in (200, 1200, 5000):
+            to_run, skipped = plan_tsp_algorithms(n)
+            self.assertEqual([name for name, _ in to_run], ['Nearest Neighbor', 'Multi-Start NN', 'NN + Local Search', 'MST 2-Approximation'])
+            self.assertEqual(len(skipped), 3)
+
+    def test_cost_models_saturate_on_large_instances(self):
+        for estimator in (estimate_brute_force, estimate_held_karp, estimate_branch_and_bound):
+            self.assertEqual(estimator(5000), (math.inf, math.inf))
+        self.assertLess(estimate_brute_force(10)[0], math.inf)
+
+    def test_run_tsp_algorithms_on_large_instance(self):
+        results = run_tsp_algorithms(TSPInstance.random(1000, seed=5, size=1000), 0)
+        self.assertEqual([result['algorithm'] for result in results],
+                         ['Nearest Neighbor', 'Multi-Start NN', 'NN + Local Search', 'MST 2-Approximation'])
+        for result in results:
+            self.assertEqual(sorted(result['path'][:-1]), list(range(1000)))
+
+    def test_dispatch_falls_back_to_heuristics(self):
+        report = dispatch_tsp_algorithms(self.dist_matrix, self.home_index, time_budget=0)
+        self.assertEqual([result['algorithm'] for result in report['results']], ['Nearest Neighbor'])
+        self.assertEqual(len(report['skipped']), 6)
+
+    def test_parallel_dispatch_matches_serial(self):
+        serial = dispatch_tsp_algorithms(self.dist_matrix, self.home_index)
+        parallel = dispatch_tsp_algorithms(self.dist_matrix, self.home_index, parallel=True, timeout=30)
+
+        self.assertEqual([r['algorithm'] for r in parallel['results']], [r['algorithm'] for r in serial['results']])
+        for before, after in zip(serial['results'], parallel['results']):
+            self.assertAlmostEqual(before['cost'], after['cost'])
+            self.assertGreaterEqual(after['time'], 0)
+            self.assertGreaterEqual(after['cpu_time'], 0)
+
+    def test_parallel_timeout_cancels_slow_algorithms(self):
+        rng = random.Random(3)
+        matrix = [[0 if i == j else rng.randint(1, 100) for j in range(10)] for i in range(10)]
+
+        report = dispatch_tsp_algorithms(matrix, 0, parallel=True, timeout=0.05, workers=1)
+
+        reasons = {entry['algorithm']: entry['reason'] for entry in report['skipped']}
+        self.assertIn('timed out', reasons['Brute Force'])
+        self.assertTrue([entry for entry in report['skipped'] if entry['algorithm'] == 'Brute Force'][0]['timed_out'])
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_iter_tsp_algorithms_yields_cheapest_first_and_cleans_up(self):
+        algorithms = iter_tsp_algorithms(self.dist_matrix, self.home_index, workers=1)
+        kind, entry = next(algorithms)
+        self.assertEqual((kind, entry['algorithm']), ('result', 'Nearest Neighbor'))
+        algorithms.close()
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_crashed_worker_is_reported_and_others_finish(self):
+        registry = tsp_algorithms._algorithms() + [('Crash', _crashing_tsp, lambda n: (0, 0), False)]
+        with patch('tsp_algorithms._algorithms', return_value=registry):
+            outcomes = list(iter_tsp_algorithms(self.dist_matrix, self.home_index, workers=2, timeout=10))
+
+        skipped = {entry['algorithm']: entry['reason'] for kind, entry in outcomes if kind == 'skipped'}
+        self.assertEqual(skipped, {'Crash': 'process exited with code 3'})
+        self.assertEqual(len([kind for kind, _ in outcomes if kind == 'result']), 7)
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_nearest_neighbor_accepts_numpy_matrix(self):
+        result = nearest_neighbor_tsp(np.array(self.dist_matrix), self.home_index)
+        self.assertEqual(result, nearest_neighbor_tsp(self.dist_matrix, self.home_index))
+
+    def test_multi_start_nearest_neighbor(self):
+        rng = random.Random(5)
+        points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(60)]
+        matrix = [[((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5 for x2, y2 in points] for x1, y1 in points]
+
+        single = nearest_neighbor_tsp(matrix, 7)
+        for kwargs in ({}, {'max_starts': 60, 'batch_size': 7}):
+            result = multi_start_nearest_neighbor_tsp(matrix, 7, **kwargs)
+            self.assertEqual(result['path'][0], 7)
+            self.assertEqual(result['path'][-1], 7)
+            self.assertEqual(sorted(result['path'][:-1]), list(range(60)))
+            self.assertLessEqual(result['cost'], single['cost'])
+            self.assertAlmostEqual(result['cost'], sum(matrix[a][b] for a, b in zip(result['path'], result['path'][1:])))
+
+    def test_minimum_spanning_tree(self):
+        parent = minimum_spanning_tree(self.dist_matrix, 0)
+        self.assertEqual(parent[0], -1)
+        weight = sum(self.dist_matrix[city][up] for city, up in enumerate(parent) if up >= 0)
+        self.assertEqual(weight, 10 + 15 + 20)
+
+    def test_mst_approximation_within_twice_optimal(self):
+        for seed in range(5):
+            rng = random.Random(seed)
+            points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(10)]
+            matrix = [[((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5 for x2, y2 in points] for x1, y1 in points]
+
+            result = mst_approximation_tsp(matrix, 4)
+            self.assertEqual(result['path'][0], 4)
+            self.assertEqual(result['path'][-1], 4)
+            self.assertEqual(sorted(result['path'][:-1]), list(range(10)))
+            self.assertLessEqual(result['cost'], 2 * held_karp_tsp(matrix, 4)['cost'] + 1e-9)
+
+    def test_local_search_improves_nearest_neighbor(self):
+        rng = random.Random(11)
+        points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(200)]
+        matrix = [[((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5 for x2, y2 in points] for x1, y1 in points]
+
+        greedy = nearest_neighbor_tsp(matrix, 17)
+        result = local_search_tsp(matrix, 17)
+
+        self.assertEqual(result['path'][0], 17)
+        self.assertEqual(result['path'][-1], 17)
+        self.assertEqual(sorted(result['path'][:-1]), list(range(200)))
+        self.assertLess(result['cost'], greedy['cost'])
+        self.assertAlmostEqual(result['cost'], sum(matrix[a][b] for a, b in zip(result['path'], result['path'][1:])))
+
+    def test_local_search_close_to_optimal_on_small_instances(self):
+        for seed in range(5):
+            rng = random.Random(seed)
+            points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(12)]
+            matrix = [[((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5 for x2, y2 in points] for x1, y1 in points]
+            optimal = held_karp_tsp(matrix, 0)['cost']
+            self.assertLessEqual(local_search_tsp(matrix, 0)['cost'], optimal * 1.1)
+
+    def test_or_opt_moves_segments_in_place(self):
+        rng = random.Random(5)
+        points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(120)]
+        matrix = [[((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5 for x2, y2 in points] for x1, y1 in points]
+        tour = list(range(120))
+        rng.shuffle(tour)
+        pos = [0] * 120
+        for index, city in enumerate(tour):
+            pos[city] = index
+        cost = lambda: sum(matrix[tour[k]][tour[(k + 1) % 120]] for k in range(120))
+
+        before = cost()
+        touched = tsp_algorithms._or_opt(matrix, tour, pos, tsp_algorithms._neighbor_lists(np.array(matrix), 8))
+
+        self.assertTrue(touched)
+        self.assertLess(cost(), before)
+        self.assertEqual(sorted(tour), list(range(120)))
+        self.assertTrue(all(tour[pos[city]] == city for city in range(120)))
+
+    def test_local_search_finishes_on_asymmetric_matrices(self):
+        for seed in range(10):
+            rng = random.Random(seed)
+            matrix = [[0 if i == j else rng.randint(1, 100) for j in range(15)] for i in range(15)]
+            greedy = nearest_neighbor_tsp(matrix, 0)
+            result = local_search_tsp(matrix, 0)
+            self.assertEqual(result['path'], greedy['path'])
+            self.assertEqual(result['cost'], greedy['cost'])
+
+        rng = random.Random(3)
+        matrix = [[0 if i == j else rng.randint(1, 100) for j in range(9)] for i in range(9)]
+        self.assertEqual(len(run_tsp_algorithms(matrix, 0)), 7)
+
+    def test_improve_tour_keeps_tiny_tours(self):
+        result = improve_tour(self.dist_matrix, [0, 1, 3, 2, 0])
+        self.assertEqual(result['path'], [0, 1, 3, 2, 0])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+
+from instance import TSPInstance
+from tsplib import load_problem, load_tour
+from tsp_algorithms import branch_and_bound_tsp, plan_tsp_algorithms, _tour_cost
+from benchmark import CORPUS_DIR, KNOWN_OPTIMA, corpus_instances, optimal_cost, run_benchmarks
+
+class TestTSPLIBReader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_coordinate_problem(self):
+        problem = load_problem(os.path.join(CORPUS_DIR, 'berlin52.tsp'))
+        self.assertEqual(problem['name'], 'berlin52')
+        self.assertEqual(problem['dimension'], 52)
+        self.assertEqual(problem['edge_weight_type'], 'EUC_2D')
+        self.assertIsInstance(problem['distances'], TSPInstance)
+
+    def test_opt_tours_match_published_optima(self):
+        for name in ('ulysses16', 'att48', 'eil51', 'berlin52'):
+            distances = load_problem(os.path.join(CORPUS_DIR, f'{name}.tsp'))['distances']
+            tour = load_tour(os.path.join(CORPUS_DIR, f'{name}.opt.tour'))
+            self.assertEqual(_tour_cost(distances, tour + [tour[0]]), KNOWN_OPTIMA[name])
+
+    def test_geo_and_explicit_problems_solve_to_optimum(self):
+        for name in ('burma14', 'gr17'):
+            distances = load_problem(os.path.join(CORPUS_DIR, f'{name}.tsp'))['distances']
+            self.assertEqual(branch_and_bound_tsp(distances, 0)['cost'], KNOWN_OPTIMA[name])
+
+    def test_explicit_formats(self):
+        expected = np.array([[0, 1, 2], [1, 0, 3], [2, 3, 0]])
+        sections = {
+            'UPPER_ROW': '1 2\n3',
+            'LOWER_DIAG_ROW': '0\n1 0\n2 3 0',
+            'UPPER_DIAG_ROW': '0 1 2 0 3 0',
+            'FULL_MATRIX': '0 1 2\n1 0 3\n2 3 0',
+        }
+        for weight_format, section in sections.items():
+            path = self.write('tiny.tsp', (
+                f"NAME: tiny\nTYPE: TSP\nDIMENSION: 3\nEDGE_WEIGHT_TYPE: EXPLICIT\n"
+                f"EDGE_WEIGHT_FORMAT: {weight_format}\nEDGE_WEIGHT_SECTION\n{section}\n"
+                f"DISPLAY_DATA_SECTION\n1 0 0\n2 1 0\n3 0 1\nEOF\n"
+            ))
+            np.testing.assert_array_equal(load_problem(path)['distances'], expected)
+
+    def test_gzip_files(self):
+        path = os.path.join(self.tmp_dir, 'burma14.tsp.gz')
+        with open(os.path.join(CORPUS_DIR, 'burma14.tsp'), 'rb') as src, gzip.open(path, 'wb') as dst:
+            dst.write(src.read())
+        self.assertEqual(load_problem(path)['dimension'], 14)
+
+    def test_invalid_files(self):
+        truncated = self.write('truncated.tsp', (
+            "NAME: bad\nTYPE: TSP\nDIMENSION: 3\nEDGE_WEIGHT_TYPE: EXPLICIT\n"
+            "EDGE_WEIGHT_FORMAT: UPPER_ROW\nEDGE_WEIGHT_SECTION\n1 2\nEOF\n"
+        ))
+        asymmetric = self.write('asym.atsp', "NAME: bad\nTYPE: ATSP\nDIMENSION: 3\nEOF\n")
+        missing_node = self.write('missing.tsp', (
+            "NAME: bad\nTYPE: TSP\nDIMENSION: 3\nEDGE_WEIGHT_TYPE: EUC_2D\nNODE_COORD_SECTION\n1 0 0\n2 1 1\nEOF\n"
+        ))
+        for path in (truncated, asymmetric, missing_node):
+            with self.assertRaises(ValueError):
+                load_problem(path)
+
+        bad_tour = self.write('bad.tour', "NAME: bad\nTYPE: TOUR\nDIMENSION: 3\nTOUR_SECTION\n1\n2\n2\n-1\nEOF\n")
+        with self.assertRaises(ValueError):
+            load_tour(bad_tour)
+
+class TestTSPBenchmark(unittest.TestCase):
+
+    def test_corpus_optima(self):
+        for name in corpus_instances():
+            self.assertIn(name, KNOWN_OPTIMA)
+        distances = load_problem(os.path.join(CORPUS_DIR, 'eil51.tsp'))['distances']
+        self.assertEqual(optimal_cost('eil51', distances), 426)
+
+    def test_run_benchmarks_reports_gaps(self):
+        report, = run_benchmarks(['burma14'])
+        gaps = {result['algorithm']: result['gap'] for result in report['results']}
+        self.assertEqual(gaps['Held-Karp'], 0)
+        self.assertEqual(gaps['Branch and Bound'], 0)
+        self.assertGreaterEqual(gaps['Nearest Neighbor'], 0)
+        self.assertIn('Brute Force', [skipped['algorithm'] for skipped in report['skipped']])
+
+    def test_dispatcher_declines_held_karp_on_ulysses22(self):
+        distances = load_problem(os.path.join(CORPUS_DIR, 'ulysses22.tsp'))['distances']
+        to_run, skipped = plan_tsp_algorithms(len(distances), time_budget=5.0)
+        self.assertNotIn('Held-Karp', [name for name, _ in to_run])
+        self.assertIn('Held-Karp', [entry['algorithm'] for entry in skipped])
+
+        to_run, _ = plan_tsp_algorithms(len(load_problem(os.path.join(CORPUS_DIR, 'gr17.tsp'))['distances']), time_budget=5.0)
+        self.assertIn('Held-Karp', [name for name, _ in to_run])
+
+    def test_unknown_instance(self):
+        with self.assertRaises(ValueError):
+            run_benchmarks(['pr2392'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,44 +1,246 @@
+import functools
 import itertools
+import math
+import multiprocessing
+import os
 import time
+from multiprocessing.connection import wait as wait_for_connections
+import numpy as np
+from instance import TSPInstance
 
-def run_tsp_algorithms(dist_matrix, home_index):
+# Budgets used by the dispatcher to decide which algorithms are feasible for an instance
+DEFAULT_TIME_BUDGET = 5.0                # seconds per algorithm
+DEFAULT_MEMORY_BUDGET = 512 * 1024 ** 2  # bytes per algorithm
+
+def _algorithms():
     """
-    Runs three TSP algorithms and returns their results.
+    Registry of (name, function, cost estimator, required).
+    Required algorithms run regardless of the budgets.
     """
-    algorithms = [
-        ('Brute Force', brute_force_tsp),
-        ('Held-Karp', held_karp_tsp),
-        ('Nearest Neighbor', nearest_neighbor_tsp)
+    return [
+        ('Brute Force', brute_force_tsp, estimate_brute_force, False),
+        ('Held-Karp', held_karp_tsp, estimate_held_karp, False),
+        ('Branch and Bound', branch_and_bound_tsp, estimate_branch_and_bound, False),
+        ('Nearest Neighbor', nearest_neighbor_tsp, estimate_nearest_neighbor, True),
+        ('Multi-Start NN', multi_start_nearest_neighbor_tsp, estimate_multi_start_nearest_neighbor, False),
+        ('NN + Local Search', local_search_tsp, estimate_local_search, False),
+        ('MST 2-Approximation', mst_approximation_tsp, estimate_mst_approximation, False)
     ]
-    
-    results = []
-    
-    for name, func in algorithms:
-        start_time = time.perf_counter()
+
+def algorithm_names():
+    return [name for name, *_ in _algorithms()]
+
+def _saturating(estimator):
+    """
+    Exponential cost models overflow floats on large instances (e.g. (n-1)! past ~170 cities);
+    report those as unbounded so the planner simply skips the algorithm.
+    """
+    @functools.wraps(estimator)
+    def wrapper(n):
         try:
-            result = func(dist_matrix, home_index)
-            end_time = time.perf_counter()
-            exec_time = end_time - start_time
-        
-            if result['path'] is None and result['cost'] == float('inf'):
-                continue  
-            
-            results.append({
+            return estimator(n)
+        except OverflowError:
+            return math.inf, math.inf
+    return wrapper
+
+# Cost models return (seconds, bytes) for an instance with n cities. The constants are rough
+# per-operation costs measured on a desktop CPU; they only need to be right to an order of magnitude.
+@_saturating
+def estimate_brute_force(n):
+    permutations = math.factorial(max(n - 1, 0))
+    return 1.2e-7 * permutations * n, 8 * n
+
+@_saturating
+def estimate_held_karp(n):
+    # Fitted on the n = 12..22 corpus and random instances: the per-transition cost grows from
+    # ~8e-9 s to ~1.3e-8 s (up to ~2e-8 s of wall time) once the tables outgrow the CPU caches,
+    # so the larger value is used to keep the estimate on the safe side near the budget.
+    m = max(n - 1, 0)
+    states = (1 << m) * m
+    return 1e-3 + 2e-8 * states * m, 9 * states + 16 * (1 << m)
+
+@_saturating
+def estimate_branch_and_bound(n):
+    # Exponential in the worst case; with 1-tree bounds typical instances explore ~1.25^n partial tours
+    return 1e-4 * n * 1.25 ** n, 48 * n * n
+
+def estimate_nearest_neighbor(n):
+    return 5e-8 * n * n, 8 * n * n
+
+def estimate_multi_start_nearest_neighbor(n):
+    # Up to 16 starts advance together, so each step is one vectorized argmin over a block of rows;
+    # measured ~1e-7 s per n^2 up to 5000 cities, plus the per-start penalty and tour arrays
+    return 1.5e-7 * n * n + 2e-5 * n, 8 * n * n + 512 * n
+
+def estimate_local_search(n):
+    # Nearest neighbour construction plus a few passes over neighbour lists;
+    # up to 2000 cities the matrix is also copied into Python lists for fast lookups
+    return 5e-8 * n * n + 5e-4 * n, 8 * n * n + (32 * n * n if n <= 2000 else 0)
+
+def estimate_mst_approximation(n):
+    # Prim's algorithm reads every row once; rows of a TSPInstance are computed on demand
+    return 1e-7 * n * n, 8 * n * n
+
+def plan_tsp_algorithms(n, time_budget=DEFAULT_TIME_BUDGET, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Splits the registered algorithms into those that fit the budgets for n cities and those that do not.
+    Nearest Neighbor always runs so there is a result even when everything else is skipped.
+    Returns (to_run, skipped) where to_run is a list of (name, function) and skipped a list of
+    {'algorithm', 'reason'} dicts.
+    """
+    to_run = []
+    skipped = []
+    
+    for name, func, estimator, required in _algorithms():
+        seconds, memory = estimator(n)
+        if not required and time_budget is not None and seconds > time_budget:
+            skipped.append({
                 'algorithm': name,
-                'path': result['path'] or [],  
-                'cost': result['cost'],
-                'time': exec_time
+                'reason': f"estimated {seconds:.3g} s exceeds the {time_budget:g} s time budget"
             })
-        except Exception as e:
-            print(f"Algorithm {name} failed: {e}")
-            continue
+        elif not required and memory_budget is not None and memory > memory_budget:
+            skipped.append({
+                'algorithm': name,
+                'reason': f"estimated {memory / 1024 ** 2:.3g} MiB exceeds the {memory_budget / 1024 ** 2:g} MiB memory budget"
+            })
+        else:
+            to_run.append((name, func))
     
-    return results
+    return to_run, skipped
+
+def _result_entry(name, result, wall_time, cpu_time):
+    """
+    Turns an algorithm's return value into a ('result', entry) or ('skipped', entry) pair.
+    """
+    if result['path'] is None and result['cost'] == float('inf'):
+        return 'skipped', {'algorithm': name, 'reason': "no tour found"}
+    return 'result', {
+        'algorithm': name,
+        'path': result['path'] or [],
+        'cost': result['cost'],
+        'time': wall_time,
+        'cpu_time': cpu_time
+    }
+
+def _run_algorithm(name, func, dist_matrix, home_index):
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        result = func(dist_matrix, home_index)
+    except Exception as e:
+        print(f"Algorithm {name} failed: {e}")
+        return 'skipped', {'algorithm': name, 'reason': f"failed: {e}"}
+    return _result_entry(name, result, time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+def _algorithm_process(name, func, dist_matrix, home_index, connection):
+    # Each worker has its own pipe, so terminating one can never corrupt another's result
+    connection.send(_run_algorithm(name, func, dist_matrix, home_index))
+    connection.close()
+
+def iter_tsp_algorithms(dist_matrix, home_index, time_budget=DEFAULT_TIME_BUDGET,
+                        memory_budget=DEFAULT_MEMORY_BUDGET, timeout=None, workers=None):
+    """
+    Runs the feasible algorithms in separate processes and yields ('result', entry) or
+    ('skipped', entry) pairs as soon as each one is known, so the first tour can be shown
+    while slower algorithms are still running.
+    An algorithm still running after timeout seconds is terminated and reported as skipped,
+    as is every algorithm still running when the generator is closed early.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1. Got workers={workers}.")
+    workers = workers or os.cpu_count() or 1
+
+    to_run, skipped = plan_tsp_algorithms(len(dist_matrix), time_budget, memory_budget)
+    for entry in skipped:
+        yield 'skipped', entry
+
+    # Start the cheapest algorithms first so a tour is available quickly even with few workers
+    estimates = {name: estimator(len(dist_matrix))[0] for name, _, estimator, _ in _algorithms()}
+    to_run.sort(key=lambda item: estimates[item[0]])
+
+    context = multiprocessing.get_context()
+    running = {}  # name -> (process, receiving end of its pipe, deadline)
+    try:
+        while to_run or running:
+            while to_run and len(running) < workers:
+                name, func = to_run.pop(0)
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_algorithm_process, args=(name, func, dist_matrix, home_index, sender), daemon=True
+                )
+                process.start()
+                sender.close()
+                running[name] = (process, receiver, time.perf_counter() + timeout if timeout is not None else None)
+
+            deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+            wait = 0.1 if not deadlines else min(0.1, max(0.0, min(deadlines) - time.perf_counter()))
+            ready = wait_for_connections([receiver for _, receiver, _ in running.values()], timeout=wait)
+
+            for name in [name for name, (_, receiver, _) in running.items() if receiver in ready]:
+                process, receiver, _ = running.pop(name)
+                try:
+                    outcome = receiver.recv()
+                except EOFError:
+                    # The worker died before sending anything
+                    outcome = None
+                receiver.close()
+                process.join()
+                yield outcome or ('skipped', {'algorithm': name, 'reason': f"process exited with code {process.exitcode}"})
+
+            now = time.perf_counter()
+            for name, (process, receiver, deadline) in list(running.items()):
+                if deadline is not None and now >= deadline:
+                    process.terminate()
+                    process.join()
+                    receiver.close()
+                    del running[name]
+                    yield 'skipped', {'algorithm': name, 'reason': f"timed out after {timeout:g} s", 'timed_out': True}
+    finally:
+        for process, receiver, _ in running.values():
+            process.terminate()
+            process.join()
+            receiver.close()
+
+def dispatch_tsp_algorithms(dist_matrix, home_index, time_budget=DEFAULT_TIME_BUDGET,
+                            memory_budget=DEFAULT_MEMORY_BUDGET, parallel=False, timeout=None, workers=None):
+    """
+    Runs every algorithm that is feasible for the instance size and reports what was skipped.
+    With parallel=True the algorithms run in separate processes (see iter_tsp_algorithms).
+    Returns {'results': [...], 'skipped': [{'algorithm', 'reason'}, ...]}; each result has
+    its wall-clock 'time' and 'cpu_time' in seconds.
+    """
+    results = []
+    skipped = []
+
+    if parallel:
+        for kind, entry in iter_tsp_algorithms(dist_matrix, home_index, time_budget, memory_budget, timeout, workers):
+            (results if kind == 'result' else skipped).append(entry)
+        order = algorithm_names()
+        results.sort(key=lambda entry: order.index(entry['algorithm']))
+        return {'results': results, 'skipped': skipped}
+
+    to_run, skipped = plan_tsp_algorithms(len(dist_matrix), time_budget, memory_budget)
+    for name, func in to_run:
+        kind, entry = _run_algorithm(name, func, dist_matrix, home_index)
+        (results if kind == 'result' else skipped).append(entry)
+
+    return {'results': results, 'skipped': skipped}
+
+def run_tsp_algorithms(dist_matrix, home_index, time_budget=DEFAULT_TIME_BUDGET,
+                       memory_budget=DEFAULT_MEMORY_BUDGET, parallel=False, timeout=None, workers=None):
+    """
+    Runs the TSP algorithms that fit the time and memory budgets and returns their results.
+    """
+    return dispatch_tsp_algorithms(dist_matrix, home_index, time_budget, memory_budget,
+                                   parallel, timeout, workers)['results']
 
 def brute_force_tsp(dist_matrix, home_index):
     """
     Brute-force exact algorithm (for small n).
     """
+    if isinstance(dist_matrix, TSPInstance):
+        # Scalar lookups in the permutation loop are far cheaper on nested lists
+        dist_matrix = dist_matrix.matrix().tolist()
     n = len(dist_matrix)
     cities = [i for i in range(n) if i != home_index]
     
@@ -66,6 +268,11 @@ def brute_force_tsp(dist_matrix, home_index):
 def held_karp_tsp(dist_matrix, home_index):
     """
     Dynamic Programming (Held-Karp) exact algorithm.
+    cost[mask * m + j] is the cheapest path that leaves home, visits exactly the cities in
+    `mask` and ends at city j (m = number of cities besides home); parent holds the city before j.
+    Both are flat, preallocated arrays, so memory is 2^m * m floats plus 2^m * m small ints.
+    Subsets are processed in order of size and, for each last city j, the minimisation over
+    predecessors is done for all subsets of that size at once with NumPy.
     """
     n = len(dist_matrix)
     cities = [i for i in range(n) if i != home_index]
@@ -74,119 +281,544 @@ def held_karp_tsp(dist_matrix, home_index):
     if num_cities == 0:
         return {'path': [home_index, home_index], 'cost': 0}
     
-    # Mapping between city indices and subset indices
-    city_to_idx = {city: idx for idx, city in enumerate(cities)}
-    idx_to_city = {idx: city for idx, city in enumerate(cities)}
+    dist = np.asarray(dist_matrix, dtype=float)
+    between = dist[np.ix_(cities, cities)]  # between[k, j] = distance from cities[k] to cities[j]
+    num_masks = 1 << num_cities
+    
+    cost = np.full(num_masks * num_cities, np.inf)
+    parent = np.full(num_masks * num_cities, -1, dtype=np.int8 if num_cities < 128 else np.int16)
+    cost_table = cost.reshape(num_masks, num_cities)
+    parent_table = parent.reshape(num_masks, num_cities)
     
-    memo = {}
+    # Initialize base cases: home -> j
+    singletons = 1 << np.arange(num_cities)
+    cost_table[singletons, np.arange(num_cities)] = dist[home_index, cities]
     
-    # Initialize base cases
-    for idx in range(num_cities):
-        city = cities[idx]
-        mask = 1 << idx
-        memo[(mask, idx)] = (dist_matrix[home_index][city], home_index)
+    # Group subsets by size; every subset is built from subsets one city smaller
+    masks = np.arange(num_masks)
+    subset_sizes = np.zeros(num_masks, dtype=np.int8)
+    for bit in range(num_cities):
+        subset_sizes += (masks >> bit) & 1
+    masks_by_size = np.argsort(subset_sizes, kind='stable')
+    layer_ends = np.cumsum(np.bincount(subset_sizes, minlength=num_cities + 1))
     
-    # Build DP table for subsets
     for subset_size in range(2, num_cities + 1):
-        for subset in itertools.combinations(range(num_cities), subset_size):
-            mask = sum(1 << bit for bit in subset)
-            
-            for current in subset:
-                prev_mask = mask & ~(1 << current)
-                min_cost = float('inf')
-                min_prev = -1
-                
-                for prev in subset:
-                    if prev == current:
-                        continue
-                    if (prev_mask, prev) not in memo:
-                        continue
-                    cost, _ = memo[(prev_mask, prev)]
-                    cost += dist_matrix[idx_to_city[prev]][idx_to_city[current]]
-                    if cost < min_cost:
-                        min_cost = cost
-                        min_prev = prev
-                
-                if min_prev != -1:
-                    memo[(mask, current)] = (min_cost, min_prev)
+        layer = masks_by_size[layer_ends[subset_size - 1]:layer_ends[subset_size]]
+        for current in range(num_cities):
+            subsets = layer[(layer >> current) & 1 == 1]
+            candidates = cost_table[subsets ^ (1 << current)] + between[:, current]
+            best_prev = candidates.argmin(axis=1)
+            cost_table[subsets, current] = candidates[np.arange(len(subsets)), best_prev]
+            parent_table[subsets, current] = best_prev
     
     # Find optimal return path to home
-    mask = (1 << num_cities) - 1
-    min_total = float('inf')
-    best_last = -1
-    
-    for current in range(num_cities):
-        if (mask, current) not in memo:
-            continue
-        cost, _ = memo[(mask, current)]
-        total_cost = cost + dist_matrix[idx_to_city[current]][home_index]
-        if total_cost < min_total:
-            min_total = total_cost
-            best_last = current
-    
-    # Reconstruct path if valid
-    if best_last == -1:
+    full_mask = num_masks - 1
+    totals = cost_table[full_mask] + dist[cities, home_index]
+    best_last = int(totals.argmin())
+    if not np.isfinite(totals[best_last]):
         return {'path': None, 'cost': float('inf')}
     
+    # Reconstruct path by following parents back to home
     path = []
-    current_mask = mask
+    current_mask = full_mask
     current_node = best_last
-    
-    while current_mask:
-        city = idx_to_city[current_node]
-        path.append(city)
-        new_mask = current_mask & ~(1 << current_node)
-        
-        if (current_mask, current_node) not in memo:
-            break
-            
-        _, prev_node = memo[(current_mask, current_node)]
-        
-        if prev_node == home_index:
-            break
-            
-        prev_idx = city_to_idx[prev_node]
-        current_mask = new_mask
-        current_node = prev_idx
+    while current_node != -1:
+        path.append(cities[current_node])
+        prev_node = int(parent_table[current_mask, current_node])
+        current_mask ^= 1 << current_node
+        current_node = prev_node
     
     path.reverse()
     full_path = [home_index] + path + [home_index]
     
-    # Add validation to ensure no duplicates (except home)
-    visited = set()
-    for city in full_path[1:-1]:  # Exclude first and last (home)
-        if city in visited:
-            # If duplicates found, fall back to brute force for small n
-            if len(dist_matrix) <= 10:
-                return brute_force_tsp(dist_matrix, home_index)
-            return {'path': None, 'cost': float('inf')}
-        visited.add(city)
-    
-    return {'path': full_path, 'cost': min_total}
+    return {'path': full_path, 'cost': _tour_cost(dist_matrix, full_path)}
 
 def nearest_neighbor_tsp(dist_matrix, home_index):
     """
     Greedy heuristic algorithm.
+    Each step takes an argmin over the distance row with visited cities masked out.
     """
-    n = len(dist_matrix)
+    dist = _distance_rows(dist_matrix)
+    n = len(dist)
     if n == 0:
         return {'path': [], 'cost': 0}
-    
-    unvisited = set(range(n))
+
+    penalty = np.zeros(n)  # inf once a city is visited
+    penalty[home_index] = np.inf
     current = home_index
-    unvisited.remove(current)
     path = [current]
-    total_cost = 0
-    
-    while unvisited:
-        next_city = min(unvisited, key=lambda city: dist_matrix[current][city])
-        total_cost += dist_matrix[current][next_city]
-        path.append(next_city)
-        current = next_city
-        unvisited.remove(current)
-    
+
+    for _ in range(n - 1):
+        current = int(np.argmin(dist[current] + penalty))
+        penalty[current] = np.inf
+        path.append(current)
+
     # Return to home
-    total_cost += dist_matrix[current][home_index]
     path.append(home_index)
-    
-    return {'path': path, 'cost': total_cost}
\ No newline at end of file
+    total_cost = float(dist[path[:-1], path[1:]].sum(dtype=np.float64))
+
+    return {'path': path, 'cost': total_cost}
+
+def multi_start_nearest_neighbor_tsp(dist_matrix, home_index, starts=None, max_starts=16, batch_size=16, seed=0):
+    """
+    Nearest neighbour from several start cities, keeping the cheapest tour (rotated to begin at home).
+    Starts are processed in batches that advance together one step at a time.
+    Small instances try every city; larger ones try home plus a seeded sample of max_starts - 1 cities.
+    """
+    dist = _distance_rows(dist_matrix)
+    n = len(dist)
+    if n == 0:
+        return {'path': [], 'cost': 0}
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1. Got batch_size={batch_size}.")
+
+    if starts is None:
+        if n <= max_starts:
+            starts = np.arange(n)
+        else:
+            others = np.delete(np.arange(n), home_index)
+            sample = np.random.default_rng(seed).choice(others, max_starts - 1, replace=False)
+            starts = np.concatenate(([home_index], sample))
+    starts = np.asarray(starts, dtype=np.intp)
+
+    best_cost, best_tour = np.inf, None
+    for offset in range(0, len(starts), batch_size):
+        batch = starts[offset:offset + batch_size]
+        rows = np.arange(len(batch))
+        tours = np.empty((len(batch), n), dtype=np.intp)
+        tours[:, 0] = batch
+        penalty = np.zeros((len(batch), n))
+        penalty[rows, batch] = np.inf
+
+        current = batch
+        for step in range(1, n):
+            current = np.argmin(dist[current] + penalty, axis=1)
+            penalty[rows, current] = np.inf
+            tours[:, step] = current
+
+        costs = dist[tours, np.roll(tours, -1, axis=1)].sum(axis=1, dtype=np.float64)
+        k = int(np.argmin(costs))
+        if costs[k] < best_cost:
+            best_cost, best_tour = float(costs[k]), tours[k].tolist()
+
+    i = best_tour.index(home_index)
+    path = best_tour[i:] + best_tour[:i] + [home_index]
+    return {'path': path, 'cost': best_cost}
+
+def _as_array(dist_matrix):
+    """
+    Dense NumPy view of a distance matrix (nested list, array or TSPInstance); float32 stays float32.
+    """
+    dist = np.asarray(dist_matrix)
+    return dist if dist.dtype.kind == 'f' else dist.astype(float)
+
+def _distance_rows(dist_matrix, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Row source for algorithms that only read O(n) rows. A TSPInstance uses its cached dense
+    matrix while that fits the memory budget (recomputing rows from coordinates is several times
+    slower than indexing it) and only computes rows on demand above that size.
+    """
+    if isinstance(dist_matrix, TSPInstance):
+        n = len(dist_matrix)
+        if n * n * dist_matrix.dtype.itemsize > memory_budget:
+            return dist_matrix
+        return dist_matrix.matrix()
+    return _as_array(dist_matrix)
+
+def _tour_cost(dist_matrix, path):
+    if isinstance(dist_matrix, TSPInstance):
+        return dist_matrix.tour_cost(path)
+    return sum(dist_matrix[path[i]][path[i + 1]] for i in range(len(path) - 1))
+
+def _mst_weight(weights, nodes):
+    """
+    Weight of a minimum spanning tree over `nodes` (Prim on the dense submatrix),
+    and the degree of each node in that tree.
+    """
+    k = len(nodes)
+    degrees = np.zeros(k, dtype=int)
+    if k <= 1:
+        return 0.0, degrees
+
+    sub = weights[np.ix_(nodes, nodes)]
+    in_tree = np.zeros(k, dtype=bool)
+    in_tree[0] = True
+    best = sub[0].copy()
+    parent = np.zeros(k, dtype=int)
+    total = 0.0
+
+    for _ in range(k - 1):
+        candidates = np.where(in_tree, np.inf, best)
+        v = int(candidates.argmin())
+        total += candidates[v]
+        in_tree[v] = True
+        degrees[v] += 1
+        degrees[parent[v]] += 1
+        closer = sub[v] < best
+        best = np.where(closer, sub[v], best)
+        parent = np.where(closer, v, parent)
+
+    return total, degrees
+
+def _one_tree(weights, special):
+    """
+    Minimum 1-tree: an MST over every node but `special`, plus the two cheapest edges from `special`.
+    Returns its weight and the degree of every node.
+    """
+    n = len(weights)
+    others = np.array([i for i in range(n) if i != special])
+    tree_weight, tree_degrees = _mst_weight(weights, others)
+
+    row = weights[special, others]
+    cheapest = np.argpartition(row, 1)[:2]
+    degrees = np.zeros(n, dtype=int)
+    degrees[others] = tree_degrees
+    degrees[others[cheapest]] += 1
+    degrees[special] = 2
+    return tree_weight + row[cheapest].sum(), degrees
+
+def _held_karp_penalties(bound_matrix, upper_bound, home_index, iterations=200):
+    """
+    Subgradient optimisation of the Held-Karp 1-tree bound.
+    Returns (lower bound, node penalties pi). Adding pi[i] + pi[j] to every edge
+    changes each tour's cost by exactly 2 * sum(pi), but tightens the 1-tree bound.
+    """
+    n = len(bound_matrix)
+    pi = np.zeros(n)
+    best_bound = -np.inf
+    best_pi = pi.copy()
+    if n < 3:
+        return best_bound, best_pi
+
+    for iteration in range(iterations):
+        weights = bound_matrix + pi[:, None] + pi[None, :]
+        np.fill_diagonal(weights, np.inf)
+        tree_weight, degrees = _one_tree(weights, home_index)
+        bound = tree_weight - 2 * pi.sum()
+        if bound > best_bound:
+            best_bound, best_pi = bound, pi.copy()
+
+        gradient = degrees - 2
+        if not gradient.any() or bound >= upper_bound:
+            break  # the 1-tree is a tour, or the seed tour is already optimal
+        pi = pi + (0.98 ** iteration) * (upper_bound - bound) / (gradient * gradient).sum() * gradient
+
+    return best_bound, best_pi
+
+def branch_and_bound_tsp(dist_matrix, home_index):
+    """
+    Exact branch-and-bound algorithm.
+    Extends the tour depth-first from home, seeded with the nearest-neighbour tour as the upper bound.
+    A partial tour is pruned when its cost plus a lower bound on completing it (MST of the unvisited
+    cities plus the cheapest links back to the tour ends) cannot beat the best tour found so far.
+    Edge weights carry Held-Karp 1-tree penalties, which makes the bound tight enough for 15-25 cities.
+    Asymmetric matrices are bounded with min(d[i][j], d[j][i]), which stays a valid lower bound.
+    """
+    n = len(dist_matrix)
+    if n <= 1:
+        return {'path': [home_index, home_index], 'cost': 0}
+
+    dist = np.array(dist_matrix, dtype=float)
+    bound_matrix = np.minimum(dist, dist.T)
+    integral = bool(np.all(dist == np.round(dist)))
+
+    seed = nearest_neighbor_tsp(dist_matrix, home_index)
+    best = {'cost': float(seed['cost']), 'path': seed['path']}
+
+    _, pi = _held_karp_penalties(bound_matrix, best['cost'], home_index)
+    penalty_total = 2 * pi.sum()
+    weights = dist + pi[:, None] + pi[None, :]
+    bound_weights = bound_matrix + pi[:, None] + pi[None, :]
+    np.fill_diagonal(bound_weights, np.inf)
+
+    visited = np.zeros(n, dtype=bool)
+    visited[home_index] = True
+    path = [home_index]
+
+    def search(current, cost):
+        unvisited = np.flatnonzero(~visited)
+        if len(unvisited) == 0:
+            total = cost + weights[current, home_index] - penalty_total
+            if total < best['cost'] - 1e-9:
+                best['cost'] = total
+                best['path'] = path + [home_index]
+            return
+
+        if len(unvisited) == 1:
+            last = unvisited[0]
+            bound = cost + weights[current, last] + weights[last, home_index] - penalty_total
+        else:
+            tree_weight, _ = _mst_weight(bound_weights, unvisited)
+            bound = (cost + tree_weight + bound_weights[current, unvisited].min()
+                     + bound_weights[home_index, unvisited].min() - penalty_total)
+        if integral:
+            bound = math.ceil(bound - 1e-6)
+        if bound >= best['cost'] - 1e-9:
+            return
+
+        for city in unvisited[np.argsort(weights[current, unvisited])]:
+            city = int(city)
+            visited[city] = True
+            path.append(city)
+            search(city, cost + weights[current, city])
+            path.pop()
+            visited[city] = False
+
+    search(home_index, 0.0)
+
+    return {'path': best['path'], 'cost': _tour_cost(dist_matrix, best['path'])}
+
+
+def _neighbor_lists(dist, k):
+    """
+    The k nearest other cities of every city, nearest first.
+    """
+    n = len(dist)
+    k = min(k, n - 1)
+    masked = dist.copy()
+    np.fill_diagonal(masked, np.inf)
+    nearest = np.argpartition(masked, k - 1, axis=1)[:, :k]
+    order = np.take_along_axis(masked, nearest, axis=1).argsort(axis=1)
+    return np.take_along_axis(nearest, order, axis=1).tolist()
+
+def _two_opt(d, tour, pos, neighbors, work, active):
+    """
+    2-opt with neighbour lists and don't-look bits.
+    Only cities in `work` are examined; a city goes back on the list when one of its tour edges changes.
+    Returns True if the tour was improved.
+    """
+    n = len(tour)
+    improved = False
+
+    def reverse(i, j):
+        # Reverse the tour segment from position i forward to position j, whichever side is shorter
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        for _ in range(length // 2):
+            a, b = tour[i], tour[j]
+            tour[i], tour[j] = b, a
+            pos[b], pos[a] = i, j
+            i = (i + 1) % n
+            j = (j - 1) % n
+
+    while work:
+        a = work.pop()
+        active[a] = False
+        for direction in (1, -1):
+            i = pos[a]
+            b = tour[(i + direction) % n]
+            d_ab = d[a][b]
+            moved = False
+            for c in neighbors[a]:
+                d_ac = d[a][c]
+                if d_ac >= d_ab:
+                    break  # neighbours are sorted, so no later c can give a gain
+                j = pos[c]
+                e = tour[(j + direction) % n]
+                if c == b or e == a:
+                    continue
+                delta = d_ac + d[b][e] - d_ab - d[c][e]
+                if delta < -1e-9:
+                    if direction == 1:
+                        reverse((i + 1) % n, j)   # a b ... c e  ->  a c ... b e
+                    else:
+                        reverse(j, (i - 1) % n)  # e c ... b a  ->  e b ... c a
+                    for city in (a, b, c, e):
+                        if not active[city]:
+                            active[city] = True
+                            work.append(city)
+                    improved = moved = True
+                    break
+            if moved:
+                break
+
+    return improved
+
+def _or_opt(d, tour, pos, neighbors, max_segment=3):
+    """
+    One Or-opt pass: moves segments of 1 to max_segment cities, possibly reversed,
+    next to one of the segment ends' nearest neighbours. Returns the cities whose edges changed.
+    """
+    n = len(tour)
+    touched = []
+
+    def move(i, seg, u):
+        # Move the segment at positions i.. (cities `seg`, in their new order) to just after city u.
+        # Only the cities between the segment and u shift, taking whichever side of the tour is shorter.
+        length = len(seg)
+        after = (pos[u] - (i + length - 1)) % n  # cities from the segment's end up to and including u
+        if after <= n - length - after:
+            write, read = i, (i + length) % n
+            for _ in range(after):
+                city = tour[read]
+                tour[write], pos[city] = city, write
+                write, read = (write + 1) % n, (read + 1) % n
+            for city in seg:
+                tour[write], pos[city] = city, write
+                write = (write + 1) % n
+        else:
+            write, read = (i + length - 1) % n, (i - 1) % n
+            for _ in range(n - length - after):
+                city = tour[read]
+                tour[write], pos[city] = city, write
+                write, read = (write - 1) % n, (read - 1) % n
+            for city in reversed(seg):
+                tour[write], pos[city] = city, write
+                write = (write - 1) % n
+
+    for start in range(n):
+        for length in range(1, max_segment + 1):
+            if length + 2 >= n:
+                break
+            i = start
+            s1 = tour[i]
+            s2 = tour[(i + length - 1) % n]
+            p = tour[(i - 1) % n]
+            nxt = tour[(i + length) % n]
+            removal_gain = d[p][s1] + d[s2][nxt] - d[p][nxt]
+            if removal_gain <= 1e-9:
+                continue
+
+            segment = set(tour[(i + offset) % n] for offset in range(length))
+            best = None
+            for end, other_end in ((s1, s2), (s2, s1)):
+                for c in neighbors[end]:
+                    if c in segment:
+                        continue
+                    if d[c][end] >= removal_gain:
+                        break
+                    for e in (tour[(pos[c] + 1) % n], tour[(pos[c] - 1) % n]):
+                        if e in segment:
+                            continue
+                        # Insert between c and e with `end` next to c
+                        delta = d[c][end] + d[other_end][e] - d[c][e] - removal_gain
+                        if delta < -1e-9 and (best is None or delta < best[0]):
+                            best = (delta, c, e, end)
+            if best is None:
+                continue
+
+            _, c, e, end = best
+            seg = [tour[(i + offset) % n] for offset in range(length)]
+            if end == s2:
+                seg.reverse()  # seg now starts with the city that goes next to c
+            if tour[(pos[c] + 1) % n] == e:
+                move(i, seg, c)
+            else:
+                seg.reverse()
+                move(i, seg, e)
+            touched.extend((p, nxt, c, e, s1, s2))
+            break
+
+    return touched
+
+def improve_tour(dist_matrix, path, neighbors=10, max_rounds=50):
+    """
+    Local-search refinement for a closed tour produced by any constructive heuristic.
+    Alternates 2-opt (neighbour lists + don't-look bits) and Or-opt until neither improves the
+    tour. With neighbour lists each pass costs O(n * neighbors) evaluations instead of O(n^2).
+    The returned path still starts and ends at path[0]. The moves assume symmetric distances
+    (a reversal changes the length of every reversed edge otherwise), so asymmetric matrices
+    get the original path back unchanged.
+    """
+    if not path or len(path) < 6:
+        return {'path': path, 'cost': _tour_cost(dist_matrix, path) if path else 0}
+
+    dist = _as_array(dist_matrix)
+    # Coordinate metrics are symmetric by construction
+    if not isinstance(dist_matrix, TSPInstance) and not np.allclose(dist, dist.T):
+        return {'path': list(path), 'cost': _tour_cost(dist_matrix, path)}
+    home = path[0]
+    tour = list(path[:-1])
+    n = len(tour)
+    # Plain lists are much faster than NumPy for scalar lookups; keep NumPy for very large instances
+    d = dist.tolist() if n <= 2000 else dist
+    neighbor_lists = _neighbor_lists(dist, neighbors)
+    pos = [0] * len(dist)
+    for index, city in enumerate(tour):
+        pos[city] = index
+
+    active = [True] * len(dist)
+    work = list(reversed(tour))
+    for _ in range(max_rounds):
+        _two_opt(d, tour, pos, neighbor_lists, work, active)
+        touched = _or_opt(d, tour, pos, neighbor_lists)
+        if not touched:
+            break
+        for city in touched:
+            if not active[city]:
+                active[city] = True
+                work.append(city)
+
+    start = pos[home]
+    improved = tour[start:] + tour[:start] + [home]
+    original_cost = _tour_cost(dist_matrix, path)
+    improved_cost = _tour_cost(dist_matrix, improved)
+    if improved_cost > original_cost:
+        return {'path': list(path), 'cost': original_cost}
+    return {'path': improved, 'cost': improved_cost}
+
+def local_search_tsp(dist_matrix, home_index, construct=None):
+    """
+    Constructive heuristic (nearest neighbour by default) followed by 2-opt / Or-opt local search.
+    """
+    construct = construct or nearest_neighbor_tsp
+    start = construct(dist_matrix, home_index)
+    if not start['path']:
+        return start
+    return improve_tour(dist_matrix, start['path'])
+
+def minimum_spanning_tree(dist_matrix, root=0):
+    """
+    Prim's algorithm on a dense matrix in O(n^2): each step adds the closest outside city.
+    Returns parent[i] for every city (-1 for the root).
+    """
+    dist = _distance_rows(dist_matrix)
+    n = len(dist)
+    parent = np.full(n, -1)
+    if n == 0:
+        return parent
+
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[root] = True
+    best = np.array(dist[root], dtype=float)
+    best[root] = np.inf
+    parent[:] = root
+    parent[root] = -1
+
+    for _ in range(n - 1):
+        city = int(np.argmin(best))
+        in_tree[city] = True
+        best[city] = np.inf
+        row = dist[city]
+        closer = (row < best) & ~in_tree
+        best[closer] = row[closer]
+        parent[closer] = city
+    return parent
+
+def mst_approximation_tsp(dist_matrix, home_index):
+    """
+    Double-tree 2-approximation: a preorder walk of the minimum spanning tree rooted at home,
+    skipping repeated cities. With metric distances (triangle inequality) the tour costs at
+    most twice the optimum, because the MST weighs no more than any tour.
+    """
+    n = len(dist_matrix)
+    if n == 0:
+        return {'path': [], 'cost': 0}
+
+    parent = minimum_spanning_tree(dist_matrix, home_index)
+    children = [[] for _ in range(n)]
+    for city, up in enumerate(parent.tolist()):
+        if up >= 0:
+            children[up].append(city)
+
+    path = []
+    stack = [home_index]
+    while stack:
+        city = stack.pop()
+        path.append(city)
+        stack.extend(reversed(children[city]))
+    path.append(home_index)
+
+    return {'path': path, 'cost': _tour_cost(dist_matrix, path)}
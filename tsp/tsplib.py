@@ -0,0 +1,189 @@
+"""
+Reader for TSPLIB problem (.tsp) and tour (.opt.tour) files.
+
+Files are read line by line (gzip-compressed files too), so coordinate and matrix sections
+are never held in memory as text. Supported problems are symmetric TSPs with node coordinates
+(EUC_2D, CEIL_2D, ATT, GEO) or explicit edge weights in any of the triangular or full matrix
+layouts.
+"""
+import gzip
+import os
+import numpy as np
+
+from instance import TSPInstance
+
+# TSPLIB EDGE_WEIGHT_TYPE -> TSPInstance metric
+COORDINATE_METRICS = {
+    'EUC_2D': 'euc_2d',
+    'CEIL_2D': 'ceil_2d',
+    'ATT': 'att',
+    'GEO': 'geo',
+}
+
+# EDGE_WEIGHT_FORMAT -> (entry order, include diagonal). For a symmetric matrix each column
+# format lists the same numbers as the row format of the opposite triangle.
+EXPLICIT_FORMATS = {
+    'UPPER_ROW': ('upper', False),
+    'LOWER_COL': ('upper', False),
+    'UPPER_DIAG_ROW': ('upper', True),
+    'LOWER_DIAG_COL': ('upper', True),
+    'LOWER_ROW': ('lower', False),
+    'UPPER_COL': ('lower', False),
+    'LOWER_DIAG_ROW': ('lower', True),
+    'UPPER_DIAG_COL': ('lower', True),
+    'FULL_MATRIX': ('full', True),
+}
+
+_SECTIONS = {
+    'NODE_COORD_SECTION', 'EDGE_WEIGHT_SECTION', 'DISPLAY_DATA_SECTION', 'TOUR_SECTION',
+    'FIXED_EDGES_SECTION', 'DEMAND_SECTION', 'DEPOT_SECTION', 'EOF',
+}
+
+def _open(path):
+    if str(path).endswith('.gz'):
+        return gzip.open(path, 'rt')
+    return open(path)
+
+def _keyword(line):
+    return line.split(':', 1)[0].strip().upper()
+
+def _read_header(lines):
+    """
+    Reads KEY : VALUE lines up to the first section keyword.
+    Returns (header, section) where section is None at end of file.
+    """
+    header = {}
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        key = _keyword(line)
+        if key in _SECTIONS:
+            return header, key
+        if ':' not in line:
+            raise ValueError(f"Malformed TSPLIB header line: {line!r}.")
+        header[key] = line.split(':', 1)[1].strip()
+    return header, None
+
+def _tokens(lines):
+    for line in lines:
+        yield from line.split()
+
+def _next_section(lines):
+    """
+    Skips the rest of an unused section and returns the next section keyword (None at end of file).
+    """
+    for line in lines:
+        key = _keyword(line) if line.strip() else None
+        if key in _SECTIONS:
+            return key
+    return None
+
+def _read_coordinates(lines, dimension):
+    coordinates = np.full((dimension, 2), np.nan)
+    read = 0
+    for line in lines:
+        fields = line.split()
+        if not fields:
+            continue
+        if len(fields) < 3:
+            raise ValueError(f"Malformed NODE_COORD_SECTION line: {line.strip()!r}.")
+        node = int(fields[0])
+        if not 1 <= node <= dimension:
+            raise ValueError(f"Node {node} is outside 1..{dimension}.")
+        coordinates[node - 1] = float(fields[1]), float(fields[2])
+        read += 1
+        if read == dimension:
+            break
+    if np.isnan(coordinates).any():
+        raise ValueError(f"NODE_COORD_SECTION does not list all {dimension} nodes.")
+    return coordinates
+
+def _read_edge_weights(lines, dimension, weight_format):
+    if weight_format not in EXPLICIT_FORMATS:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT {weight_format!r}.")
+    order, diagonal = EXPLICIT_FORMATS[weight_format]
+    if order == 'full':
+        rows, cols = np.indices((dimension, dimension)).reshape(2, -1)
+    elif order == 'upper':
+        rows, cols = np.triu_indices(dimension, 0 if diagonal else 1)
+    else:
+        rows, cols = np.tril_indices(dimension, 0 if diagonal else -1)
+
+    count = len(rows)
+    try:
+        weights = np.fromiter(map(float, _tokens(lines)), dtype=float, count=count)
+    except ValueError:
+        raise ValueError(f"EDGE_WEIGHT_SECTION must contain {count} numbers for {weight_format}.")
+
+    matrix = np.zeros((dimension, dimension))
+    matrix[rows, cols] = weights
+    if order != 'full':
+        matrix[cols, rows] = weights
+    np.fill_diagonal(matrix, 0)
+    return matrix
+
+def load_problem(path, dtype=np.float64):
+    """
+    Reads a TSPLIB .tsp file and returns a dict with 'name', 'comment', 'dimension',
+    'edge_weight_type' and 'distances': a TSPInstance for coordinate problems or a
+    dense NumPy matrix for EXPLICIT ones. Either can be passed to the algorithms directly.
+    """
+    with _open(path) as f:
+        lines = iter(f)
+        header, section = _read_header(lines)
+
+        problem_type = header.get('TYPE', 'TSP').split()[0].upper()
+        if problem_type != 'TSP':
+            raise ValueError(f"Only symmetric TSP problems are supported. Got TYPE={problem_type}.")
+        try:
+            dimension = int(header['DIMENSION'])
+        except (KeyError, ValueError):
+            raise ValueError("TSPLIB problem is missing a valid DIMENSION.")
+        weight_type = header.get('EDGE_WEIGHT_TYPE', '').upper()
+        if weight_type != 'EXPLICIT' and weight_type not in COORDINATE_METRICS:
+            raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE {weight_type!r}.")
+
+        distances = None
+        while section not in (None, 'EOF'):
+            if section == 'NODE_COORD_SECTION' and weight_type != 'EXPLICIT':
+                coordinates = _read_coordinates(lines, dimension)
+                distances = TSPInstance(coordinates, metric=COORDINATE_METRICS[weight_type], dtype=dtype)
+            elif section == 'EDGE_WEIGHT_SECTION' and weight_type == 'EXPLICIT':
+                weight_format = header.get('EDGE_WEIGHT_FORMAT', '').upper()
+                distances = _read_edge_weights(lines, dimension, weight_format).astype(dtype, copy=False)
+            section = _next_section(lines)
+
+    if distances is None:
+        raise ValueError(f"{path} has no distance data for EDGE_WEIGHT_TYPE {weight_type}.")
+
+    return {
+        'name': header.get('NAME', os.path.basename(str(path)).split('.')[0]),
+        'comment': header.get('COMMENT', ''),
+        'dimension': dimension,
+        'edge_weight_type': weight_type,
+        'distances': distances,
+    }
+
+def load_tour(path):
+    """
+    Reads a TSPLIB .tour file and returns the tour as 0-based city indices (not closed).
+    """
+    with _open(path) as f:
+        lines = iter(f)
+        header, section = _read_header(lines)
+        while section not in (None, 'EOF', 'TOUR_SECTION'):
+            section = _next_section(lines)
+        if section != 'TOUR_SECTION':
+            raise ValueError(f"{path} has no TOUR_SECTION.")
+
+        tour = []
+        for token in _tokens(lines):
+            if token == 'EOF' or int(token) == -1:
+                break
+            tour.append(int(token) - 1)
+
+    dimension = int(header.get('DIMENSION', len(tour)))
+    if sorted(tour) != list(range(dimension)):
+        raise ValueError(f"{path} is not a tour over {dimension} cities.")
+    return tour